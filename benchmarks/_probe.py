@@ -0,0 +1,91 @@
+"""
+Measure one synthetic CLI in a fresh interpreter.
+
+Run by ``run.py`` as ``python _probe.py directory module options memory``,
+prints the measurements as JSON. Nothing is imported from npdoc-cli before
+the import itself is timed.
+"""
+import contextlib
+import importlib
+import io
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+def _per_call(func, number: int = 200, repeat: int = 5) -> float:
+    """Median time of ``func()`` in microseconds."""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - t0) / number)
+    return statistics.median(times) * 1e6
+
+
+def _help(cli, argv: list):
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            cli.parse_args(argv + ['--help'])
+        except SystemExit:
+            pass
+
+
+def timings(module, options: dict) -> dict:
+    """Build, parse, dispatch and help timings of a generated module."""
+    cli = module.cli
+    out = {}
+    t0 = time.perf_counter()
+    cli.build(**options)
+    out['build_ms'] = (time.perf_counter() - t0) * 1e3
+
+    for key, argv in (('parse', module.SAMPLE_ARGV),
+                      ('parse_sub', module.SAMPLE_SUB_ARGV)):
+        if argv is None:
+            continue
+        out[key + '_us'] = _per_call(lambda: cli.parse_args(argv))
+
+    number = 200
+    times = []
+    for _ in range(5):
+        namespaces = [cli.parse_args(module.SAMPLE_ARGV)
+                      for _ in range(number)]
+        t0 = time.perf_counter()
+        for ns in namespaces:
+            cli.dispatch(ns)
+        times.append((time.perf_counter() - t0) / number)
+    out['dispatch_us'] = statistics.median(times) * 1e6
+
+    out['help_ms'] = _per_call(lambda: _help(cli, []), number=5) / 1e3
+    out['command_help_ms'] = _per_call(
+        lambda: _help(cli, module.SAMPLE_ARGV[:1]), number=5) / 1e3
+    return out
+
+
+def main(directory: str, name: str, options: str, memory: str) -> dict:
+    sys.path.insert(0, directory)
+    options = json.loads(options)
+    if memory == 'memory':
+        tracemalloc.start()
+        module = importlib.import_module(name)
+        module.cli.build(**options)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {'peak_memory_kib': peak / 1024}
+
+    out = {}
+    t0 = time.perf_counter()
+    importlib.import_module('npdoc_cli')
+    out['import_npdoc_cli_ms'] = (time.perf_counter() - t0) * 1e3
+    t0 = time.perf_counter()
+    module = importlib.import_module(name)
+    out['import_module_ms'] = (time.perf_counter() - t0) * 1e3
+    out.update(timings(module, options))
+    return out
+
+
+if __name__ == '__main__':
+    print(json.dumps(main(*sys.argv[1:])))
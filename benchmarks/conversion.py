@@ -0,0 +1,121 @@
+"""
+Conversion of numeric list arguments, per token into lists against in bulk
+into ``array.array``.
+"""
+import array
+import sys
+import time
+import tracemalloc
+
+from npdoc_cli import NumpyDocCLI
+
+_TYPES = {'int': (int, 'q'), 'float': (float, 'd')}
+
+
+def _cli() -> NumpyDocCLI:
+    """CLI with a list and an array command for each item type."""
+    conv = NumpyDocCLI()
+
+    @conv.program
+    def program():
+        """Conversion benchmark."""
+
+    for name, (item_type, code) in _TYPES.items():
+        def as_list(values):
+            return values
+
+        def as_array(values):
+            return values
+
+        for func, annotation, extra in (
+                (as_list, list[item_type], ''),
+                (as_array, list[item_type],
+                 '\n        For CLI argument typecode = {}.'.format(code))):
+            func.__name__ = func.__qualname__ = '{}_{}'.format(
+                func.__name__, name)
+            func.__annotations__ = {'values': annotation}
+            func.__doc__ = '''
+    Values.
+
+    Parameters
+    ----------
+    values : list[{}]
+        Values.{}
+    '''.format(name, extra)
+            conv.command(func)
+    conv.build()
+    return conv
+
+
+def _tokens(name: str, size: int) -> list:
+    if name == 'int':
+        return [str(i) for i in range(size)]
+    return [str(i + 0.5) for i in range(size)]
+
+
+def _best(func, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def _size(values) -> int:
+    """Bytes held by parsed values, including boxed items of lists."""
+    if isinstance(values, array.array):
+        return sys.getsizeof(values)
+    return sys.getsizeof(values) + sum(sys.getsizeof(v) for v in values)
+
+
+def _peak_kib(func) -> float:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def measure(sizes: list, repeat: int = 5) -> list:
+    """
+    Parse time and peak memory of list and array arguments.
+
+    Parameters
+    ----------
+    sizes : list[int]
+        Numbers of tokens.
+    repeat : int, optional
+        Timings are the best of this many parses. The default is 5.
+
+    Returns
+    -------
+    list[dict]
+        Size and measurements of each number of tokens.
+
+    """
+    conv = _cli()
+    results = []
+    for size in sizes:
+        result = {'size': size, 'options': {}}
+        for name in _TYPES:
+            tokens = _tokens(name, size)
+            for kind in ('list', 'array'):
+                argv = ['as-{}-{}'.format(kind, name)] + tokens
+                parsed = conv.parse_args(argv).values
+                assert len(parsed) == size
+                assert isinstance(parsed, array.array) == (kind == 'array')
+                result['{}_{}_ms'.format(name, kind)] = _best(
+                    lambda: conv.parse_args(argv), repeat) * 1e3
+                result['{}_{}_peak_kib'.format(name, kind)] = _peak_kib(
+                    lambda: conv.parse_args(argv))
+                result['{}_{}_result_kib'.format(name, kind)] = _size(
+                    parsed) / 1024
+            result[name + '_speedup'] = (result[name + '_list_ms']
+                                         / result[name + '_array_ms'])
+        results.append(result)
+        print('size', size, {k: round(v, 2) for k, v in result.items()
+                             if k not in ('size', 'options')},
+              file=sys.stderr)
+    return results
+
@@ -0,0 +1,77 @@
+"""
+Parse time of the fast engine against argparse, for a command and a
+subcommand of synthetic CLIs of several sizes.
+"""
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import synthetic
+
+
+def _load(directory: str, size: int):
+    """Import a synthetic CLI of ``size`` commands and subcommands."""
+    name = 'synthetic_engine_{}'.format(size)
+    path = Path(directory, name + '.py')
+    path.write_text(synthetic.generate(size))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _best_us(func, repeat: int, loops: int = 200) -> float:
+    """Best time of ``loops`` calls, per call in microseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, time.perf_counter() - t0)
+    return best / loops * 1e6
+
+
+def measure(sizes: list, repeat: int = 5) -> list:
+    """
+    Parse time of each engine.
+
+    Parameters
+    ----------
+    sizes : list[int]
+        Numbers of commands and subcommands.
+    repeat : int, optional
+        Timings are the best of this many runs. The default is 5.
+
+    Returns
+    -------
+    list[dict]
+        Size and parse times in microseconds of each engine and argument
+        list, and the speedups.
+
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            module = _load(directory, size)
+            cli = module.cli
+            result = {'size': size, 'options': {}}
+            for sample, argv in (('command', module.SAMPLE_ARGV),
+                                 ('subcommand', module.SAMPLE_SUB_ARGV)):
+                parsed = {}
+                for engine in ('argparse', 'fast'):
+                    cli.build(engine=engine)
+                    parsed[engine] = vars(cli.parse_args(argv))
+                    result['{}_{}_us'.format(sample, engine)] = _best_us(
+                        lambda: cli.parse_args(argv), repeat)
+                assert parsed['fast'] == parsed['argparse']
+                result[sample + '_speedup'] = (
+                    result[sample + '_argparse_us']
+                    / result[sample + '_fast_us'])
+            results.append(result)
+            print('size', size, {k: round(v, 2) for k, v in result.items()
+                                 if k not in ('size', 'options')},
+                  file=sys.stderr)
+    return results
@@ -0,0 +1,274 @@
+"""
+Benchmarks of npdoc-cli on synthetic CLIs.
+
+Measure import, build, parse, dispatch and help times and peak memory for
+CLIs of 10 to 10,000 commands and subcommands, and compare two result files::
+
+    python benchmarks/run.py measure -o before.json
+    git checkout feature
+    python benchmarks/run.py measure -o after.json
+    python benchmarks/run.py compare before.json after.json
+
+Every measurement runs in a fresh interpreter, and the median of the
+repeats is kept. Results are JSON, tagged with the git commit, python
+version and build options so files from different commits line up.
+"""
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+sys.path.insert(0, str(HERE.parent / 'src'))
+
+from npdoc_cli import NumpyDocCLI  # noqa: E402
+import conversion  # noqa: E402
+import engine as engine_bench  # noqa: E402
+import synthetic  # noqa: E402
+import threads as threads_bench  # noqa: E402
+
+bench = NumpyDocCLI()
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE,
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _option(text: str):
+    """Parse a ``key=value`` build option, value as a python literal."""
+    import ast
+    key, _, value = text.partition('=')
+    try:
+        return key, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return key, value
+
+
+def _probe(directory: str, name: str, options: dict, mode: str) -> dict:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [str(HERE.parent / 'src')]
+        + [p for p in [env.get('PYTHONPATH')] if p])
+    out = subprocess.run(
+        [sys.executable, str(HERE / '_probe.py'), directory, name,
+         json.dumps(options), mode],
+        capture_output=True, text=True, env=env)
+    if out.returncode:
+        raise RuntimeError(out.stderr)
+    return json.loads(out.stdout)
+
+
+def measure_size(size: int, options: dict, repeat: int) -> dict:
+    """
+    Measure a synthetic CLI of one size.
+
+    Parameters
+    ----------
+    size : int
+        Number of commands and subcommands.
+    options : dict
+        Keyword arguments of :py:meth:`NumpyDocCLI.build`.
+    repeat : int
+        Number of fresh interpreters the timings are the median of.
+
+    Returns
+    -------
+    dict
+        Size, options and measurements.
+
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        name = 'synthetic_cli_{}'.format(size)
+        Path(directory, name + '.py').write_text(synthetic.generate(size))
+        runs = [_probe(directory, name, options, 'time')
+                for _ in range(repeat)]
+        result = {'size': size, 'options': options}
+        for key in runs[0]:
+            result[key] = statistics.median(r[key] for r in runs)
+        result.update(_probe(directory, name, options, 'memory'))
+    return result
+
+
+@bench.program
+def run():
+    """
+    Benchmarks of npdoc-cli on synthetic CLIs.
+
+    """
+    bench.print_help()
+
+
+@bench.command
+def measure(
+        sizes: list[int] = None,
+        repeat: int = 3,
+        build_options: list[str] = None,
+        output: str = None):
+    """
+    Measure synthetic CLIs and write the results as JSON.
+
+    Parameters
+    ----------
+    sizes : list[int], optional
+        Numbers of commands and subcommands. The default is 10 100 1000 10000.
+    repeat : int, optional
+        Fresh interpreters each timing is the median of. The default is 3.
+    build_options : list[str], optional
+        Keyword arguments of build as key=value, e.g. lazy=True.
+    output : str, optional
+        File to write the results to. The default is stdout.
+
+    """
+    if sizes is None:
+        sizes = [10, 100, 1000, 10000]
+    options = dict(_option(o) for o in build_options or [])
+    results = []
+    for size in sizes:
+        results.append(measure_size(size, options, repeat))
+        print(_table([results[-1]]), file=sys.stderr)
+    return _write(results, output)
+
+
+def _write(results: list, output: str) -> dict:
+    """Write results tagged with the commit, as JSON."""
+    report = {
+        'commit': _commit(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if output is None:
+        print(text)
+    else:
+        Path(output).write_text(text + '\n')
+    return report
+
+
+def _key(result: dict) -> tuple:
+    return result['size'], json.dumps(result['options'], sort_keys=True)
+
+
+def _table(results: list, baseline: list = None) -> str:
+    base = {_key(r): r for r in baseline or []}
+    lines = []
+    for r in results:
+        old = base.get(_key(r))
+        lines.append('size {} {}'.format(r['size'], r['options'] or ''))
+        for metric, value in r.items():
+            if metric in ('size', 'options'):
+                continue
+            line = '  {:<22}{:>12.2f}'.format(metric, value)
+            if old and old.get(metric):
+                line += '{:>12.2f}{:>8.2f}x'.format(
+                    old[metric], value / old[metric])
+            lines.append(line)
+    return '\n'.join(lines)
+
+
+@bench.command
+def convert(sizes: list[int] = None, repeat: int = 5, output: str = None):
+    """
+    Compare parsing numeric lists per token and in bulk into arrays.
+
+    Parameters
+    ----------
+    sizes : list[int], optional
+        Numbers of tokens. The default is 1000 10000 100000.
+    repeat : int, optional
+        Timings are the best of this many parses. The default is 5.
+    output : str, optional
+        File to write the results to. The default is stdout.
+
+    """
+    if sizes is None:
+        sizes = [1000, 10000, 100000]
+    return _write(conversion.measure(sizes, repeat), output)
+
+
+@bench.command
+def threads(
+        sizes: list[int] = None,
+        counts: list[int] = None,
+        calls: int = 2000,
+        rebuild: float = None,
+        output: str = None):
+    """
+    Measure calls per second of the thread safe call API from many threads.
+
+    Parameters
+    ----------
+    sizes : list[int], optional
+        Numbers of commands and subcommands. The default is 100 1000.
+    counts : list[int], optional
+        Numbers of threads. The default is 1 2 4 8.
+    calls : int, optional
+        Calls made by each thread. The default is 2000.
+    rebuild : float, optional
+        Seconds between rebuilds from another thread. Never if not given.
+    output : str, optional
+        File to write the results to. The default is stdout.
+
+    """
+    if sizes is None:
+        sizes = [100, 1000]
+    if counts is None:
+        counts = [1, 2, 4, 8]
+    return _write(threads_bench.measure(sizes, counts, calls, rebuild), output)
+
+
+@bench.command
+def engine(sizes: list[int] = None, repeat: int = 5, output: str = None):
+    """
+    Compare parse times of the fast engine and argparse.
+
+    Parameters
+    ----------
+    sizes : list[int], optional
+        Numbers of commands and subcommands. The default is 10 100 1000
+        10000.
+    repeat : int, optional
+        Timings are the best of this many runs. The default is 5.
+    output : str, optional
+        File to write the results to. The default is stdout.
+
+    """
+    if sizes is None:
+        sizes = [10, 100, 1000, 10000]
+    return _write(engine_bench.measure(sizes, repeat), output)
+
+
+@bench.command
+def compare(baseline: str, results: str):
+    """
+    Compare two result files, as new value, old value and their ratio.
+
+    Parameters
+    ----------
+    baseline : str
+        Result file of the reference commit.
+    results : str
+        Result file of the commit being compared.
+
+    """
+    old = json.loads(Path(baseline).read_text())
+    new = json.loads(Path(results).read_text())
+    print('{} -> {}'.format(old['commit'], new['commit']))
+    print(_table(new['results'], old['results']))
+
+
+if __name__ == '__main__':
+    bench.build()
+    bench.dispatch(bench.parse_args())
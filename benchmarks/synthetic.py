@@ -0,0 +1,159 @@
+"""
+Generator of synthetic CLIs for benchmarking npdoc-cli.
+
+Each generated module registers a program on its own :py:obj:`NumpyDocCLI`
+named ``cli``, with function commands and class commands holding
+subcommands, whose arguments rotate through positionals, lists, choices,
+bools and counts. It also defines ``SAMPLE_ARGV`` and ``SAMPLE_SUB_ARGV``,
+an invocation of a command and of a subcommand near the middle of the CLI.
+"""
+
+_HEADER = '''"""Synthetic CLI with {size} commands and subcommands."""
+from npdoc_cli import NumpyDocCLI
+
+cli = NumpyDocCLI()
+
+
+@cli.program
+def program():
+    """
+    Synthetic program.
+
+    """
+'''
+
+_ARGUMENTS = [
+    (
+        'value{i}: int',
+        '''        value{i} : int
+            Integer positional argument number {i}.''',
+    ),
+    (
+        'name{i}: str',
+        '''        name{i} : str
+            String positional argument number {i}.''',
+    ),
+    (
+        'ids{i}: list[int]',
+        '''        ids{i} : list[int]
+            List of identifiers number {i}.''',
+    ),
+    (
+        "mode{i}: str = 'a'",
+        '''        mode{i} : {{a, b, c}}, optional
+            Choice number {i}. The default is 'a'.''',
+    ),
+    (
+        'force{i}: bool = False',
+        '''        force{i} : bool, optional
+            Flag number {i}. The default is False.''',
+    ),
+    (
+        'count{i}: int = 0',
+        '''        count{i} : int, optional
+            Counter number {i}.
+            For CLI argument action = count.''',
+    ),
+    (
+        'scale{i}: float = 1.0',
+        '''        scale{i} : float, optional
+            Scale number {i}. The default is 1.0.''',
+    ),
+]
+"""Signature and doc string of each argument shape."""
+
+_SAMPLE_VALUES = ['1', 'text', '1 2 3', '-m b', '-f', '-cc', '-s 2.5']
+"""Command line values for each argument shape, for the sample argv."""
+
+
+def _function(name: str, n: int, shift: int, indent: str) -> str:
+    """Source of a documented function with ``n`` arguments."""
+    sig = []
+    doc = []
+    for k in range(n):
+        signature, docstring = _ARGUMENTS[(shift + k) % len(_ARGUMENTS)]
+        sig.append(signature.format(i=k))
+        doc.append(docstring.format(i=k))
+    # positionals first
+    sig.sort(key=lambda s: '=' in s)
+    lines = [
+        'def {}({}):'.format(name, ', '.join(sig)),
+        '    """',
+        '    Synthetic command {}.'.format(name),
+        '',
+        '    Extended summary of {}.'.format(name),
+        '',
+        '    Parameters',
+        '    ----------',
+    ]
+    lines += [d[4:] for d in doc]
+    lines += ['', '    """', '    return None']
+    return '\n'.join(indent + line if line else line for line in lines)
+
+
+def _sample(n: int, shift: int) -> list:
+    """Sample argv values for a function generated by :py:func:`_function`."""
+    positional = []
+    optional = []
+    for k in range(n):
+        shape = (shift + k) % len(_ARGUMENTS)
+        value = _SAMPLE_VALUES[shape]
+        if value.startswith('-'):
+            # short flags are the first free prefix of the argument name
+            name = _ARGUMENTS[shape][0].split('{')[0]
+            flag, _, rest = value.partition(' ')
+            optional += [flag.replace(flag[1], name[0], 1)] + rest.split()
+        else:
+            positional += value.split()
+    return positional + optional
+
+
+def generate(size: int, arguments: int = 4) -> str:
+    """
+    Source of a module registering a synthetic CLI.
+
+    Parameters
+    ----------
+    size : int
+        Total number of commands and subcommands.
+    arguments : int, optional
+        Arguments of each command and subcommand. The default is 4.
+
+    Returns
+    -------
+    str
+        Module source.
+
+    """
+    parts = [_HEADER.format(size=size)]
+    count = 0
+    index = 0
+    sample = sample_sub = None
+    while count < size:
+        shift = index % len(_ARGUMENTS)
+        if index % 2 == 0 or size - count < 4:
+            name = 'command_{}'.format(index)
+            parts.append('\n@cli.command\n' + _function(
+                name, arguments, shift, ''))
+            count += 1
+            if sample is None and count >= size // 2:
+                sample = [name.replace('_', '-')] + _sample(arguments, shift)
+        else:
+            name = 'group_{}'.format(index)
+            methods = []
+            for s in range(3):
+                sub = 'sub_{}'.format(s)
+                methods.append('    @cli.subcommand\n    @staticmethod\n'
+                               + _function(sub, arguments, shift + s, '    '))
+            parts.append('\n@cli.command\nclass {}():\n'.format(name)
+                         + '    """Synthetic group {}."""\n\n'.format(name)
+                         + '\n\n'.join(methods))
+            count += 4
+            if sample_sub is None and count >= size // 2:
+                sample_sub = [name.replace('_', '-'), 'sub-1'] + _sample(
+                    arguments, shift + 1)
+        parts.append('\n')
+        index += 1
+    parts.append('\nSAMPLE_ARGV = {!r}\n'.format(sample))
+    parts.append('SAMPLE_SUB_ARGV = {!r}\n'.format(sample_sub))
+    return '\n'.join(parts)
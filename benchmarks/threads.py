@@ -0,0 +1,115 @@
+"""
+Throughput of ``NumpyDocCLI.call`` from many threads, alone and while
+another thread keeps rebuilding the CLI.
+"""
+import importlib.util
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import synthetic
+
+
+def _load(directory: str, size: int):
+    """Import a synthetic CLI of ``size`` commands and subcommands."""
+    name = 'synthetic_threads_{}'.format(size)
+    path = Path(directory, name + '.py')
+    path.write_text(synthetic.generate(size))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _throughput(cli, argv: list, threads: int, calls: int,
+                rebuild: float) -> float:
+    """Calls per second of ``threads`` threads making ``calls`` each."""
+    done = threading.Event()
+    failures = []
+
+    def work():
+        for _ in range(calls):
+            if cli.call(argv).status:
+                failures.append(argv)
+
+    def rebuilder():
+        lazy = False
+        while not done.wait(rebuild):
+            cli.build(lazy=lazy)
+            lazy = not lazy
+
+    builder = threading.Thread(target=rebuilder) if rebuild else None
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    t0 = time.perf_counter()
+    if builder is not None:
+        builder.start()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - t0
+    done.set()
+    if builder is not None:
+        builder.join()
+    if failures:
+        raise RuntimeError('{} calls failed'.format(len(failures)))
+    return threads * calls / elapsed
+
+
+def measure(sizes: list, threads: list, calls: int = 2000,
+            rebuild: float = None) -> list:
+    """
+    Calls per second of a sample command for numbers of threads.
+
+    Parameters
+    ----------
+    sizes : list[int]
+        Numbers of commands and subcommands.
+    threads : list[int]
+        Numbers of threads calling concurrently.
+    calls : int, optional
+        Calls made by each thread. The default is 2000.
+    rebuild : float, optional
+        Rebuild the CLI from another thread this often, in seconds. The
+        default is None, which never rebuilds.
+
+    Returns
+    -------
+    list[dict]
+        Size and throughputs, including ``parse_args`` and ``dispatch``
+        from a single thread as a reference, and memoized ``invoke``.
+
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            module = _load(directory, size)
+            cli = module.cli
+            cli.build()
+            argv = module.SAMPLE_ARGV
+            result = {'size': size, 'options': {'rebuild': rebuild}}
+
+            t0 = time.perf_counter()
+            for _ in range(calls):
+                cli.dispatch(cli.parse_args(argv))
+            result['dispatch_calls_per_s'] = calls / (
+                time.perf_counter() - t0)
+
+            cli.build(memo_size=16)
+            t0 = time.perf_counter()
+            for _ in range(calls):
+                cli.invoke(argv)
+            result['invoke_memo_calls_per_s'] = calls / (
+                time.perf_counter() - t0)
+            cli.build()
+            for n in threads:
+                result['threads_{}_calls_per_s'.format(n)] = _throughput(
+                    cli, argv, n, calls, rebuild)
+            results.append(result)
+            print('size', size, {k: round(v) for k, v in result.items()
+                                 if k not in ('size', 'options')},
+                  file=sys.stderr)
+    return results
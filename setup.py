@@ -6,5 +6,6 @@ setup(name='npdoc-cli',
       author='Cole Gray',
       author_email='cole.gray14@gmail.com',
       packages=find_packages('src'),
+      py_modules=['npdoc_zygote'],
       package_dir = {'':'src'}
      )
\ No newline at end of file
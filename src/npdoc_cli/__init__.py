@@ -5,4 +5,7 @@ Created on Sat Feb  1 11:54:32 2025
 @author: coleg
 """
 
-from npdoc_cli._interface import *
\ No newline at end of file
+from npdoc_cli._interface import *
+
+__version__ = '0.0.2'
+"""Version of npdoc-cli."""
@@ -0,0 +1,129 @@
+"""
+Command line tools for CLIs generated by npdoc-cli.
+
+Run with ``python -m npdoc_cli``.
+"""
+import importlib as _importlib
+import sys as _sys
+from npdoc_cli._interface import NumpyDocCLI, cli as _cli
+
+tools = NumpyDocCLI()
+"""CLI of ``python -m npdoc_cli``."""
+
+
+def _load_cli(target: str) -> NumpyDocCLI:
+    """
+    Import a module and return the CLI it registers.
+
+    Parameters
+    ----------
+    target : str
+        Module name, optionally followed by ``:attribute`` naming the
+        :py:obj:`NumpyDocCLI` in it. Without an attribute, the module's
+        ``cli`` is used, falling back on ``npdoc_cli.cli``.
+
+    Returns
+    -------
+    :py:obj:`NumpyDocCLI`
+        The registered CLI.
+
+    """
+    module, _, attr = target.partition(':')
+    if '' not in _sys.path:
+        _sys.path.insert(0, '')
+    mod = _importlib.import_module(module)
+    if attr:
+        return getattr(mod, attr)
+    found = getattr(mod, 'cli', None)
+    if isinstance(found, NumpyDocCLI):
+        return found
+    return _cli
+
+
+@tools.program
+def npdoc_cli():
+    """
+    Tools for CLIs generated by npdoc-cli.
+
+    """
+    tools.print_help()
+
+
+@tools.command
+def compile(
+        module: str,
+        output: str = None,
+        sort: str = 'None',
+        keep_underscores: bool = False):
+    """
+    Compile a CLI into a static parser module.
+
+    Parameters
+    ----------
+    module : str
+        Module registering the CLI, as pkg.module or pkg.module:attribute.
+    output : str, optional
+        File to write the parser module to. The default is stdout.
+    sort : {None, alphabetical}, optional
+        Sort commands and subcommands by key. The default is None.
+    keep_underscores : bool, optional
+        Keep underscores in names instead of using dashes.
+
+    """
+    source = _load_cli(module).compile(
+        output,
+        replace_underscores=not keep_underscores,
+        sort=sort)
+    if output is None:
+        print(source, end='')
+
+
+@tools.command
+def completion(
+        module: str,
+        shell: str = 'bash',
+        output: str = None,
+        prog: str = None):
+    """
+    Generate a static shell completion script for a CLI.
+
+    Parameters
+    ----------
+    module : str
+        Module registering the CLI, as pkg.module or pkg.module:attribute.
+    shell : {bash, zsh, fish}, optional
+        Shell the script is for. The default is bash.
+    output : str, optional
+        File to write the script to. The default is stdout.
+    prog : str, optional
+        Command the script completes. The default is the program name.
+
+    """
+    completed = _load_cli(module)
+    completed.build()
+    script = completed.completion(shell, output, prog)
+    if output is None:
+        print(script, end='')
+
+
+@tools.command
+def serve(module: str, socket: str):
+    """
+    Build a CLI and serve it as a fork server on a Unix socket.
+
+    Parameters
+    ----------
+    module : str
+        Module registering the CLI, as pkg.module or pkg.module:attribute.
+    socket : str
+        Socket file to listen on. Run commands: python -m npdoc_zygote SOCKET ARGS.
+
+    """
+    served = _load_cli(module)
+    served.build()
+    served.serve(socket)
+
+
+if __name__ == '__main__':
+    tools.build()
+    tools.dispatch(tools.parse_args())
@@ -0,0 +1,98 @@
+"""
+Numeric list arguments converted in bulk into ``array.array``.
+
+argparse converts the values of ``list[T]`` arguments one at a time, with
+per value checks, into a list of boxed objects. Arguments using
+:py:class:`ArrayAction` get every token converted in one pass into a
+contiguous typed buffer instead.
+"""
+import argparse as _ap
+import array as _array
+from npdoc_cli._errors import CLIArgError
+
+TYPECODES = {int: 'q', float: 'd'}
+"""Default typecode of ``array.array[T]`` for each item type."""
+
+
+def typecode(item_type: type, code: str = None) -> str:
+    """
+    Typecode of an array argument.
+
+    Parameters
+    ----------
+    item_type : type
+        Item type of the annotation, e.g. ``int`` for ``array.array[int]``.
+        None if not given.
+    code : str, optional
+        Typecode from the doc string, takes precedence. The default is None.
+
+    Raises
+    ------
+    CLIArgError
+        If the typecode is unknown or can't be found from the item type.
+
+    Returns
+    -------
+    str
+        One of ``array.typecodes``.
+
+    """
+    if code is None:
+        if item_type is None:
+            return 'd'
+        if item_type not in TYPECODES:
+            raise CLIArgError(
+                'No array typecode for ' + str(item_type)
+                + ', give one with For CLI argument typecode = ?.')
+        code = TYPECODES[item_type]
+    if code not in _array.typecodes or code == 'u':
+        raise CLIArgError('Unknown array typecode : ' + str(code))
+    return code
+
+
+def convert(code: str, values: list) -> _array.array:
+    """
+    Convert tokens into an array in one pass.
+
+    Raises
+    ------
+    ValueError
+        Naming the first token that isn't a valid item.
+
+    """
+    convert_item = float if code in 'fd' else int
+    try:
+        return _array.array(code, map(convert_item, values))
+    except (ValueError, OverflowError):
+        pass
+    # find the culprit, only paid for on errors
+    for v in values:
+        try:
+            _array.array(code, [convert_item(v)])
+        except (ValueError, OverflowError):
+            raise ValueError('invalid {} value: {!r}'.format(
+                'array ' + code, v)) from None
+    raise ValueError('invalid array {} values'.format(code))
+
+
+class ArrayAction(_ap.Action):
+    """
+    Store tokens as an ``array.array``, extending it when repeated.
+    """
+
+    def __init__(self, option_strings, dest, typecode='d', **kwargs):
+        kwargs.setdefault('nargs', '+')
+        super().__init__(option_strings, dest, **kwargs)
+        self.typecode = typecode
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        try:
+            items = convert(self.typecode, values)
+        except ValueError as e:
+            parser.error('argument {}: {}'.format(
+                '/'.join(self.option_strings) or self.metavar or self.dest,
+                e))
+        current = getattr(namespace, self.dest, None)
+        if isinstance(current, _array.array):
+            items = _array.array(self.typecode, current) + items
+        setattr(namespace, self.dest, items)
@@ -0,0 +1,122 @@
+"""
+Running async routines dispatched by a CLI.
+
+asyncio is only imported once an async routine is dispatched.
+"""
+
+
+def is_async(value: object) -> bool:
+    """True if a routine returned an awaitable or an async iterator."""
+    return hasattr(value, '__await__') or hasattr(value, '__anext__')
+
+
+async def resolve(value: object) -> object:
+    """
+    Result of an async routine.
+
+    Parameters
+    ----------
+    value : object
+        Output of the routine. Awaitables are awaited and async iterators,
+        e.g. of async generators, are collected into a list.
+
+    Returns
+    -------
+    object
+        Result of the routine.
+
+    """
+    if hasattr(value, '__anext__'):
+        return [item async for item in value]
+    return await value
+
+
+def loop_factory(uvloop: bool = True) -> callable:
+    """
+    Callable creating event loops for async routines.
+
+    Parameters
+    ----------
+    uvloop : bool, optional
+        Use uvloop when it's installed. The default is True.
+
+    Returns
+    -------
+    callable
+        Creates a new event loop.
+
+    """
+    if uvloop:
+        try:
+            import uvloop as _uvloop
+        except ImportError:
+            pass
+        else:
+            return _uvloop.new_event_loop
+    import asyncio
+
+    return asyncio.new_event_loop
+
+
+class _Holder():
+    """Runner of one thread, closed once the thread ends."""
+
+    __slots__ = ('runner', '__weakref__')
+
+
+class Runners():
+    """
+    One asyncio.Runner per thread, kept open between dispatches.
+
+    Creating an event loop for each dispatch costs more than many short
+    routines, so the loop of each thread is reused. It's closed when its
+    thread ends, or at exit.
+    """
+
+    def __init__(self, uvloop: bool = True):
+        """
+        Initialize :py:obj:`Runners`.
+
+        Parameters
+        ----------
+        uvloop : bool, optional
+            Run on uvloop when it's installed. The default is True.
+
+        Returns
+        -------
+        None.
+
+        """
+        import threading
+
+        self.uvloop = uvloop
+        """Run on uvloop when it's installed."""
+        self._local = threading.local()
+
+    def run(self, value: object) -> object:
+        """
+        Run an async routine's output to completion on this thread's loop.
+
+        Parameters
+        ----------
+        value : object
+            Awaitable or async iterator returned by a routine.
+
+        Returns
+        -------
+        object
+            Output of :py:func:`resolve`.
+
+        """
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            import asyncio
+            import weakref
+
+            holder = _Holder()
+            holder.runner = asyncio.Runner(
+                loop_factory=loop_factory(self.uvloop))
+            # thread locals are dropped with their thread
+            weakref.finalize(holder, holder.runner.close)
+            self._local.holder = holder
+        return holder.runner.run(resolve(value))
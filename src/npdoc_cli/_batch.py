@@ -0,0 +1,306 @@
+"""
+Batch execution of many command lines with one built CLI.
+"""
+import sys as _sys
+from collections import namedtuple as _namedtuple
+
+BatchFailure = _namedtuple('BatchFailure', ['line', 'argv', 'status', 'error'])
+"""Line of a batch that failed, its arguments, exit status and error."""
+
+_batch_cli = None
+# CLI inherited by forked batch workers
+
+IN_FLIGHT = 2
+"""Chunks of lines sent to each worker ahead of the results read."""
+
+
+class BatchResult():
+    """
+    Outcome of :py:meth:`NumpyDocCLI.run_batch`.
+    """
+
+    def __init__(self, total: int, failures: list):
+        self.total = total
+        """Number of command lines run."""
+        self.failures = sorted(failures)
+        """List of :py:obj:`BatchFailure`, by line number."""
+
+    def __repr__(self):
+        return 'BatchResult(total={}, failed={})'.format(
+            self.total, len(self.failures))
+
+    @property
+    def status(self) -> int:
+        """0 if every line succeeded, else the status of the first failure."""
+        return self.failures[0].status if self.failures else 0
+
+    def report(self) -> str:
+        """Summary of the batch listing every failure."""
+        lines = ['{} of {} lines failed'.format(
+            len(self.failures), self.total)]
+        for f in self.failures:
+            lines.append('line {}: status {}: {}: {}'.format(
+                f.line, f.status, ' '.join(f.argv), f.error))
+        return '\n'.join(lines) + '\n'
+
+
+def read_lines(source) -> iter:
+    """
+    Command lines of a batch, one at a time.
+
+    Parameters
+    ----------
+    source : str, path, or iterable
+        File with one command line per line, ``-`` for stdin, or an
+        iterable of lines or of argument lists. Blank lines and lines
+        starting with ``#`` are skipped.
+
+    Yields
+    ------
+    tuple
+        Line number, starting at 1, and list of arguments.
+
+    """
+    import shlex
+
+    if isinstance(source, str) or hasattr(source, '__fspath__'):
+        if source == '-':
+            yield from read_lines(_sys.stdin)
+            return
+        with open(source) as f:
+            yield from read_lines(f)
+        return
+
+    for i, line in enumerate(source, 1):
+        if isinstance(line, str):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                argv = shlex.split(line)
+            except ValueError as e:
+                yield i, [line], e
+                continue
+        else:
+            argv = list(line)
+        yield i, argv, None
+
+
+def run_line(cli, argv: list) -> tuple:
+    """
+    Parse and dispatch one command line.
+
+    Returns
+    -------
+    tuple
+        Exit status and error message, None if it succeeded.
+
+    """
+    import contextlib
+    import io
+    import traceback
+
+    err = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(err):
+            args = cli.parse_args(argv)
+    except SystemExit as e:
+        message = err.getvalue().strip().splitlines()
+        return (e.code if isinstance(e.code, int) else 1,
+                message[-1] if message else None)
+    try:
+        cli.dispatch(args)
+    except SystemExit as e:
+        if e.code is None or e.code == 0:
+            return 0, None
+        if isinstance(e.code, int):
+            return e.code, 'exit status {}'.format(e.code)
+        return 1, str(e.code)
+    except Exception as e:
+        traceback.print_exc()
+        return 1, ''.join(traceback.format_exception_only(e)).strip()
+    return 0, None
+
+
+def _batch_job(chunk: list) -> list:
+    """Run a chunk of lines in a forked worker."""
+    return [(i, argv) + run_line(_batch_cli, argv) for i, argv in chunk]
+
+
+def _serve_chunks(conn, recycle: int):
+    """Run the chunks received in a forked worker, ``recycle`` at most."""
+    done = 0
+    while recycle is None or done < recycle:
+        try:
+            chunk = conn.recv()
+        except EOFError:
+            break
+        results = _batch_job(chunk)
+        # output is written before the worker may be stopped
+        for stream in (_sys.stdout, _sys.stderr):
+            stream.flush()
+        conn.send(results)
+        done += 1
+    conn.close()
+
+
+def _lost(process) -> tuple:
+    """Status and error of the lines a dead worker was running."""
+    code = process.exitcode
+    if code is not None and code < 0:
+        return 1, 'worker killed by signal {}'.format(-code)
+    return code or 1, 'worker exited with status {}'.format(code)
+
+
+class _Worker():
+    """
+    Forked worker running chunks of lines sent through a pipe, one at a
+    time in the order sent.
+    """
+
+    def __init__(self, context, recycle: int):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_serve_chunks, args=(child, recycle), daemon=True)
+        self.process.start()
+        child.close()
+        self.left = recycle
+        """Chunks it still accepts, None if no limit."""
+        self.chunks = []
+        """Chunks sent, not yet answered, the first one running."""
+
+    def accepts(self) -> bool:
+        return (len(self.chunks) < IN_FLIGHT
+                and (self.left is None or self.left > 0))
+
+    def send(self, chunk: list):
+        self.conn.send(chunk)
+        self.chunks.append(chunk)
+        if self.left is not None:
+            self.left -= 1
+
+    def close(self):
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+
+
+def _run_lines(cli, lines: iter, jobs: int, recycle: int, chunksize: int):
+    """Status of each line, in-process or in a pool of forked workers."""
+    global _batch_cli
+
+    context = None
+    if jobs > 1:
+        import multiprocessing
+
+        try:
+            context = multiprocessing.get_context('fork')
+        except ValueError:
+            context = None
+
+    if context is None:
+        for i, argv in lines:
+            yield (i, argv) + run_line(cli, argv)
+        return
+
+    # fill in every parser once, instead of in every worker
+    cli._populate_all(lazy_commands=True)
+    import itertools
+    from multiprocessing.connection import wait
+
+    def start() -> _Worker:
+        for stream in (_sys.stdout, _sys.stderr):
+            stream.flush()
+        return _Worker(context, recycle)
+
+    # a window of chunks in flight for each worker, so lines are read as
+    # results come in instead of the whole batch being queued for them
+    _batch_cli = cli
+    workers = []
+    requeued = []
+
+    def died(k: int) -> list:
+        """Replace a dead worker, returning the lines it was running."""
+        w = workers[k]
+        w.close()
+        # it runs chunks in order, so the others weren't read yet
+        requeued[:0] = w.chunks[1:]
+        workers[k] = start()
+        status, error = _lost(w.process)
+        return [(i, argv, status, error)
+                for chunk in w.chunks[:1] for i, argv in chunk]
+
+    try:
+        workers = [start() for _ in range(jobs)]
+        reading = True
+        while True:
+            for k in range(len(workers)):
+                w = workers[k]
+                while w.accepts() and (requeued or reading):
+                    if requeued:
+                        chunk = requeued.pop(0)
+                    else:
+                        chunk = list(itertools.islice(lines, chunksize))
+                        if not chunk:
+                            reading = False
+                            break
+                    try:
+                        w.send(chunk)
+                    except OSError:
+                        requeued.insert(0, chunk)
+                        yield from died(k)
+                        break
+            busy = [w for w in workers if w.chunks]
+            if not busy:
+                break
+            ready = wait([w.conn for w in busy])
+            for k, w in enumerate(workers):
+                if w.conn not in ready:
+                    continue
+                try:
+                    results = w.conn.recv()
+                except (EOFError, OSError):
+                    yield from died(k)
+                    continue
+                w.chunks.pop(0)
+                yield from results
+                if (not w.chunks and not w.accepts()
+                        and (reading or requeued)):
+                    # recycled
+                    w.close()
+                    workers[k] = start()
+    finally:
+        for w in workers:
+            w.close()
+        _batch_cli = None
+
+
+def run_batch(
+        cli,
+        source,
+        jobs: int = 1,
+        recycle: int = None,
+        chunksize: int = 1) -> BatchResult:
+    """
+    Run every command line of a batch.
+
+    See :py:meth:`NumpyDocCLI.run_batch`.
+    """
+    failures = []
+    total = 0
+
+    def runnable():
+        nonlocal total
+        for i, argv, error in read_lines(source):
+            total += 1
+            if error is not None:
+                failures.append(BatchFailure(i, argv, 2, str(error)))
+            else:
+                yield i, argv
+
+    for i, argv, status, error in _run_lines(
+            cli, runnable(), jobs, recycle, chunksize):
+        if status:
+            failures.append(BatchFailure(i, argv, status, error))
+    return BatchResult(total, failures)
@@ -0,0 +1,313 @@
+"""
+Persistent on-disk cache of scraped command settings.
+"""
+import os as _os
+import sys as _sys
+
+_CACHE_VERSION = 2
+"""Bump when the layout of cached entries changes."""
+
+_versions = None
+# versions of npdoc-cli and numpydoc, looked up once
+
+
+def default_cache_dir() -> str:
+    """
+    Directory used by :py:obj:`ScrapeCache` when none is given.
+
+    The ``NPDOC_CLI_CACHE_DIR`` environment variable takes precedence over
+    the platform's user cache directory.
+
+    Returns
+    -------
+    str
+        Path of the cache directory.
+
+    """
+    path = _os.environ.get('NPDOC_CLI_CACHE_DIR')
+    if path:
+        return path
+    if _sys.platform == 'win32':
+        base = _os.environ.get('LOCALAPPDATA') or _os.path.expanduser('~')
+        return _os.path.join(base, 'npdoc-cli', 'Cache')
+    if _sys.platform == 'darwin':
+        return _os.path.expanduser('~/Library/Caches/npdoc-cli')
+    base = _os.environ.get('XDG_CACHE_HOME') or _os.path.expanduser('~/.cache')
+    return _os.path.join(base, 'npdoc-cli')
+
+
+def _installed_version(name: str) -> str:
+    """
+    Version of an installed distribution without importing it, or
+    importlib.metadata, from the name of its dist-info directory.
+    """
+    import importlib.util
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.origin is None:
+        return ''
+    site = _os.path.dirname(_os.path.dirname(spec.origin))
+    prefix = name + '-'
+    for entry in _os.listdir(site):
+        if entry.startswith(prefix) and entry.endswith('.dist-info'):
+            return entry[len(prefix):-len('.dist-info')]
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return ''
+
+
+def versions() -> str:
+    """Versions of npdoc-cli and numpydoc, which cached settings depend on."""
+    global _versions
+
+    if _versions is None:
+        import npdoc_cli
+
+        _versions = 'npdoc-cli {}, numpydoc {}'.format(
+            npdoc_cli.__version__, _installed_version('numpydoc'))
+    return _versions
+
+
+def digest(obj: callable, scrape_settings: dict) -> str:
+    """
+    Hash the parts of a callable that determine its scraped settings.
+
+    Parameters
+    ----------
+    obj : callable
+        Function or class definition of a command.
+    scrape_settings : dict
+        Settings passed to :py:meth:`NumpyDocCommand.scrape`.
+
+    Returns
+    -------
+    str
+        Hex digest of the qualified name, doc string, signature and
+        scrape settings of ``obj``, and of the :py:func:`versions`.
+
+    """
+    import hashlib
+    import inspect
+
+    try:
+        signature = str(inspect.signature(obj))
+    except (TypeError, ValueError):
+        signature = ''
+    parts = (
+        str(_CACHE_VERSION),
+        versions(),
+        getattr(obj, '__module__', '') or '',
+        getattr(obj, '__qualname__', '') or '',
+        getattr(obj, '__doc__', '') or '',
+        signature,
+        repr(sorted(scrape_settings.items())),
+    )
+    return hashlib.sha256('\0'.join(parts).encode()).hexdigest()
+
+
+class ScrapeCache():
+    """
+    On-disk cache of :py:meth:`NumpyDocCommand.spec` results.
+
+    Each command is stored in its own file named after its qualified name.
+    The file holds a digest of the command's doc string, signature and scrape
+    settings next to the scraped settings, so an entry that no longer matches
+    its command is simply scraped again and overwritten.
+    """
+
+    def __init__(self, directory: str = None):
+        """
+        Initialize a :py:obj:`ScrapeCache`.
+
+        Parameters
+        ----------
+        directory : str, optional
+            Directory to store entries in. The default is
+            :py:func:`default_cache_dir`.
+
+        Returns
+        -------
+        None.
+
+        """
+        if directory is None:
+            directory = default_cache_dir()
+        self.directory = _os.fspath(directory)
+        """Directory holding the cache entries."""
+
+    def path(self, name: str) -> str:
+        """
+        Path of the cache entry for ``name``.
+
+        Parameters
+        ----------
+        name : str
+            Name of the entry, for commands ``module:qualname``.
+
+        Returns
+        -------
+        str
+            File path of the entry.
+
+        """
+        import hashlib
+
+        fname = hashlib.sha256(name.encode()).hexdigest()[:32]
+        return _os.path.join(self.directory, fname + '.pickle')
+
+    def load(self, name: str, key: str):
+        """
+        Load an entry.
+
+        Parameters
+        ----------
+        name : str
+            Name of the entry.
+        key : str
+            Digest the entry must have been stored with.
+
+        Returns
+        -------
+        any
+            Cached value, None if missing, stale or unreadable.
+
+        """
+        import pickle
+
+        try:
+            with open(self.path(name), 'rb') as f:
+                stored_key, value = pickle.load(f)
+        except Exception:
+            return None
+        if stored_key != key:
+            return None
+        return value
+
+    def store(self, name: str, key: str, value):
+        """
+        Store an entry.
+
+        The entry is written to a temporary file first and moved into place,
+        so concurrent readers never see a partially written entry. Values
+        that can't be pickled are not cached.
+
+        Parameters
+        ----------
+        name : str
+            Name of the entry.
+        key : str
+            Digest to store the entry with.
+        value : any
+            Value to store.
+
+        Returns
+        -------
+        None.
+
+        """
+        import pickle
+        import tempfile
+
+        try:
+            data = pickle.dumps((key, value))
+        except Exception:
+            return
+        try:
+            _os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with _os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            _os.replace(tmp, self.path(name))
+        except OSError:
+            try:
+                _os.remove(tmp)
+            except OSError:
+                pass
+
+    def spec(self, npdoc_command, scrape_settings: dict):
+        """
+        Spec of a command, using the cached spec when up to date.
+
+        Parameters
+        ----------
+        npdoc_command : :py:obj:`NumpyDocCommand`
+            Command to scrape.
+        scrape_settings : dict
+            Settings to pass to :py:meth:`NumpyDocCommand.scrape`.
+
+        Returns
+        -------
+        :py:obj:`CommandSpec`
+            Scraped settings of the command.
+
+        """
+        obj = npdoc_command.obj
+        name = '{}:{}'.format(getattr(obj, '__module__', ''), obj.__qualname__)
+        key = digest(obj, scrape_settings)
+        value = self.load(name, key)
+        if value is None:
+            value = npdoc_command._scrape(**scrape_settings)
+            self.store(name, key, value)
+        return value
+
+    def load_summary(self, target: str) -> str:
+        """
+        Load the one line summary stored for a lazy command.
+
+        Parameters
+        ----------
+        target : str
+            Import path of the command, ``module:qualname``.
+
+        Returns
+        -------
+        str
+            The summary, None if it was never stored.
+
+        """
+        return self.load('summary:' + target, '')
+
+    def store_summary(self, target: str, summary: str):
+        """
+        Store the one line summary of a lazy command.
+
+        Parameters
+        ----------
+        target : str
+            Import path of the command, ``module:qualname``.
+        summary : str
+            Summary to show in the program help.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.load_summary(target) != summary:
+            self.store('summary:' + target, '', summary)
+
+    def clear(self):
+        """
+        Remove every entry from the cache directory.
+
+        Returns
+        -------
+        None.
+
+        """
+        try:
+            names = _os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(('.pickle', '.tmp')):
+                try:
+                    _os.remove(_os.path.join(self.directory, name))
+                except OSError:
+                    pass
@@ -0,0 +1,316 @@
+"""
+Ahead-of-time compilation of a CLI into a static parser module.
+"""
+import math as _math
+import os as _os
+from npdoc_cli._errors import CLIArgError
+from npdoc_cli._index import CommandIndex as _CommandIndex
+from npdoc_cli._index import CommandsAction as _CommandsAction
+from npdoc_cli._invoke import Parser as _Parser
+
+_HEADER = '''"""
+Parser for {prog} generated by npdoc-cli, do not edit.
+
+Rebuilds the ArgumentParser tree scraped from the doc strings at compile
+time, without importing numpydoc.
+"""
+'''
+
+_FOOTER = '''
+
+async def _resolve(out):
+    if hasattr(out, '__anext__'):
+        return [item async for item in out]
+    return await out
+
+
+def dispatch(args):
+    """Dispatch parsed arguments to the right function."""
+    a = dict(vars(args))
+    routine = a.pop('__routine__')
+    out = routine(**a)
+    if hasattr(out, '__await__') or hasattr(out, '__anext__'):
+        import asyncio
+
+        out = asyncio.run(_resolve(out))
+    return out
+
+
+def main(args=None):
+    """Parse command line arguments and dispatch them."""
+    return dispatch(build_parser().parse_args(args))
+
+
+if __name__ == '__main__':
+    main()
+'''
+
+
+class ModuleWriter():
+    """
+    Collect the source of a generated parser module.
+    """
+
+    def __init__(self):
+        self.imports = set()
+        """Modules imported by the generated module."""
+        self.lines = []
+        """Lines of the ``build_parser`` function body."""
+        self._count = 0
+
+    def name(self, prefix: str) -> str:
+        """Unique variable name in ``build_parser``."""
+        self._count += 1
+        return prefix + str(self._count)
+
+    def add(self, line: str):
+        """Add a line to the ``build_parser`` function body."""
+        self.lines.append('    ' + line)
+
+    def ref(self, obj: object) -> str:
+        """
+        Source for an import path reference to an object.
+
+        Parameters
+        ----------
+        obj : object
+            Function, class or method to reference.
+
+        Raises
+        ------
+        CLIArgError
+            If ``obj`` can't be imported by its qualified name.
+
+        Returns
+        -------
+        str
+            Expression evaluating to ``obj`` in the generated module.
+
+        """
+        module = getattr(obj, '__module__', None)
+        qualname = getattr(obj, '__qualname__', None)
+        if module is None or qualname is None:
+            raise CLIArgError('Cant compile a reference to ' + repr(obj))
+        if module == 'builtins':
+            return qualname
+        if module == '__main__' or '<' in qualname:
+            raise CLIArgError(
+                'Cant compile a reference to ' + module + '.' + qualname
+                + ', define it at the top level of an importable module.')
+        self.imports.add(module)
+        return module + '.' + qualname
+
+    def literal(self, value: object) -> str:
+        """
+        Source for a value passed to argparse.
+
+        Parameters
+        ----------
+        value : object
+            Value to write out.
+
+        Raises
+        ------
+        CLIArgError
+            If ``value`` has no source representation.
+
+        Returns
+        -------
+        str
+            Expression evaluating to ``value`` in the generated module.
+
+        """
+        if value is None or isinstance(value, (bool, int, str, bytes)):
+            return repr(value)
+        if isinstance(value, float):
+            if _math.isfinite(value):
+                return repr(value)
+            return 'float({!r})'.format(str(value))
+        if isinstance(value, list):
+            return '[' + ', '.join(self.literal(v) for v in value) + ']'
+        if isinstance(value, tuple):
+            items = [self.literal(v) for v in value]
+            return '(' + ', '.join(items) + (',)' if len(items) == 1 else ')')
+        if isinstance(value, dict):
+            return '{' + ', '.join(
+                self.literal(k) + ': ' + self.literal(v)
+                for k, v in value.items()) + '}'
+        if isinstance(value, _os.PathLike):
+            return self.ref(type(value)) + '({!r})'.format(_os.fspath(value))
+        if isinstance(value, type) or callable(value):
+            return self.ref(value)
+        raise CLIArgError('Cant compile value ' + repr(value))
+
+    def call(self, target: str, *args, **kwargs) -> str:
+        """Source of a call with literal arguments."""
+        items = [self.literal(a) for a in args]
+        items += [k + '=' + self.literal(v) for k, v in kwargs.items()]
+        return '{}({})'.format(target, ', '.join(items))
+
+    def source(self, prog: str) -> str:
+        """Full source of the generated module."""
+        imports = ['import ' + m for m in sorted(self.imports)]
+        body = '\n'.join(self.lines)
+        return (_HEADER.format(prog=prog) + '\n'.join(imports) + '\n\n\n'
+                + 'def build_parser():\n'
+                + '    """Build the ArgumentParser of the program."""\n'
+                + body + '\n' + _FOOTER)
+
+
+def _sorted(npdoc_commands: list, sort: str) -> list:
+    """Sort commands by name if asked to."""
+    if sort == 'alphabetical':
+        return sorted(npdoc_commands, key=lambda c: c.fname)
+    return list(npdoc_commands)
+
+
+def _write_parser(
+        cli,
+        writer: ModuleWriter,
+        npdoc_command,
+        parent_subparsers: str,
+        scrape_settings: dict) -> tuple:
+    """
+    Write the construction of one command's parser.
+
+    Parameters
+    ----------
+    cli : :py:obj:`NumpyDocCLI`
+        CLI being compiled.
+    writer : :py:obj:`ModuleWriter`
+        Generated module.
+    npdoc_command : :py:obj:`NumpyDocCommand`
+        Command to write.
+    parent_subparsers : str
+        Variable holding the subparsers object to add the parser to. If None,
+        the parser is written as the program entry point.
+    scrape_settings : dict
+        Additional settings to pass to :py:obj`NumpyDocCommand`.scrape.
+
+    Returns
+    -------
+    tuple[str, str]
+        Variable holding the written parser, and the command's name.
+
+    """
+    spec = cli._command_spec(npdoc_command, scrape_settings)
+    parser_pa, parser_kwa = spec.to_argparse()
+    var = writer.name('parser')
+    if parent_subparsers is None:
+        writer.add(var + ' = ' + writer.call(
+            writer.ref(_Parser), prog=parser_pa[0], **parser_kwa))
+    else:
+        writer.add(var + ' = ' + writer.call(
+            parent_subparsers + '.add_parser', *parser_pa, **parser_kwa))
+    writer.add(writer.call(
+        var + '.set_defaults', __routine__=npdoc_command.obj))
+    for a in spec.args:
+        pa, kwa = a.to_argparse()
+        writer.add(writer.call(var + '.add_argument', *pa, **kwa))
+    return var, spec.name
+
+
+def _write_children(
+        cli,
+        writer: ModuleWriter,
+        parser: str,
+        npdoc_commands: list,
+        help: str,
+        scrape_settings: dict,
+        sort: str):
+    """
+    Write the parsers of a parser's commands, and of theirs below them.
+
+    Like built parsers, they resolve abbreviated and mistyped command names
+    with a :py:obj:`CommandsAction` and its :py:obj:`CommandIndex`.
+
+    Parameters
+    ----------
+    cli : :py:obj:`NumpyDocCLI`
+        CLI being compiled.
+    writer : :py:obj:`ModuleWriter`
+        Generated module.
+    parser : str
+        Variable holding the parser of the program, a command or a group.
+    npdoc_commands : list[:py:obj:`NumpyDocCommand`]
+        Its commands or subcommands.
+    help : str
+        Help of its subparsers.
+    scrape_settings : dict
+        Additional settings to pass to :py:obj`NumpyDocCommand`.scrape.
+    sort : str, {None, alphabetical}
+        Sort commands and subcommands by key.
+
+    Returns
+    -------
+    None.
+
+    """
+    if not npdoc_commands:
+        return
+    subparsers = writer.name('subparsers')
+    writer.add(subparsers + ' = ' + writer.call(
+        parser + '.add_subparsers', action=_CommandsAction, help=help))
+    names = []
+    for c in _sorted(npdoc_commands, sort):
+        var, name = _write_parser(cli, writer, c, subparsers, scrape_settings)
+        names.append(name)
+        _write_children(cli, writer, var, cli._subcommands_of(c),
+                        'subcommand help', scrape_settings, sort)
+    writer.add(subparsers + '.index = ' + writer.call(
+        writer.ref(_CommandIndex), names))
+
+
+def compile_cli(
+        cli,
+        path: str = None,
+        replace_underscores: bool = True,
+        sort: str = 'None') -> str:
+    """
+    Compile a CLI into a static parser module.
+
+    The generated module defines ``build_parser``, ``dispatch`` and ``main``
+    and only imports npdoc-cli's parser and command index modules and the
+    modules holding the routines and argument types, so loading it needs
+    neither numpydoc nor ``inspect``. Its parsers resolve abbreviated
+    and mistyped command names as built ones do.
+
+    Parameters
+    ----------
+    cli : :py:obj:`NumpyDocCLI`
+        CLI to compile.
+    path : str, optional
+        File to write the module to. If None, it is only returned.
+    replace_underscores : bool, optional
+        Repace underscores in argument/command names with dashes.
+        The default is True.
+    sort : str, {None, alphabetical}
+        Sort commands and subcommands by key.
+
+    Raises
+    ------
+    CLIArgError
+        If a routine, type or default can't be written as source.
+
+    Returns
+    -------
+    str
+        Source of the generated module.
+
+    """
+    if cli.entry is None:
+        raise CLIArgError('No program defined to compile.')
+    scrape_sets = dict(
+        replace_underscores=replace_underscores
+    )
+    writer = ModuleWriter()
+    program, _ = _write_parser(cli, writer, cli.entry, None, scrape_sets)
+    _write_children(
+        cli, writer, program, cli.commands, 'command help', scrape_sets, sort)
+    writer.add('return ' + program)
+
+    source = writer.source(cli.entry.fname)
+    if path is not None:
+        with open(path, 'w') as f:
+            f.write(source)
+    return source
@@ -0,0 +1,272 @@
+"""
+Static bash, zsh and fish completion scripts generated from a built CLI.
+
+The scripts hold every command, subcommand, flag and choice, so completing
+doesn't start python.
+"""
+import argparse as _ap
+import re as _re
+from collections import namedtuple as _namedtuple
+from npdoc_cli._errors import CLIArgError
+
+Option = _namedtuple('Option', ['flags', 'takes_value', 'choices', 'help'])
+"""Optional argument of a parser, as completed by the scripts."""
+
+Node = _namedtuple('Node', ['commands', 'options', 'choices'])
+"""
+Completions of a parser: (name, help) of its commands or subcommands,
+its :py:obj:`Option` and the choices of its positional arguments.
+"""
+
+
+def _help(text) -> str:
+    if not text or text == _ap.SUPPRESS:
+        return ''
+    return ' '.join(str(text).split())
+
+
+def command_tree(cli) -> dict:
+    """
+    Completions of every parser of a built CLI.
+
+    Every placeholder parser is filled in first, importing lazy commands.
+
+    Parameters
+    ----------
+    cli : :py:obj:`NumpyDocCLI`
+        Built CLI.
+
+    Returns
+    -------
+    dict
+        Maps the path of each parser, the command names leading to it
+        joined by ``/`` after a leading ``/``, to its :py:obj:`Node`. The
+        program's path is ''.
+
+    """
+    cli._populate_all(lazy_commands=True)
+    tree = {}
+    todo = [('', cli.program_parser)]
+    while todo:
+        path, parser = todo.pop(0)
+        commands = []
+        options = []
+        choices = []
+        for action in parser._actions:
+            if isinstance(action, _ap._SubParsersAction):
+                helps = {a.dest: a.help for a in action._choices_actions}
+                for name, child in action.choices.items():
+                    # Placeholders of lazy builds have no help, use the
+                    # summary of the parser filled in since.
+                    help = helps.get(name) or (
+                        child.description or '').strip().split('\n')[0]
+                    commands.append((name, _help(help)))
+                    todo.append((path + '/' + name, child))
+            elif action.option_strings:
+                if action.help == _ap.SUPPRESS:
+                    continue
+                options.append(Option(
+                    tuple(action.option_strings),
+                    action.nargs != 0,
+                    [str(c) for c in action.choices or ()],
+                    _help(action.help)))
+            elif action.choices:
+                choices += [str(c) for c in action.choices]
+        tree[path] = Node(commands, options, choices)
+    return tree
+
+
+def _function_name(prog: str) -> str:
+    return '_' + _re.sub(r'\W', '_', prog) + '_complete'
+
+
+def _words(words) -> str:
+    """Words joined for compgen/compadd, quoted for the script."""
+    return ' '.join(w.replace('\\', '\\\\').replace('"', '\\"')
+                    .replace('$', '\\$').replace('`', '\\`') for w in words)
+
+
+def _path_case(tree: dict, word: str, indent: str) -> list:
+    """Case statement descending into a command named by ``word``."""
+    paths = [p for p in tree if p]
+    if not paths:
+        return []
+    return [
+        indent + 'case "$cmdpath/{}" in'.format(word),
+        indent + '    ' + '|'.join('"{}"'.format(p) for p in paths)
+        + ') cmdpath="$cmdpath/{}";;'.format(word),
+        indent + 'esac',
+    ]
+
+
+def bash(tree: dict, prog: str) -> str:
+    """Bash completion script, see :py:func:`completion_script`."""
+    func = _function_name(prog)
+    lines = [
+        '# bash completion for {}, generated by npdoc-cli'.format(prog),
+        '{}() {{'.format(func),
+        '    local cur="${COMP_WORDS[COMP_CWORD]}"',
+        '    local prev="${COMP_WORDS[COMP_CWORD-1]}"',
+        '    local cmdpath="" i',
+        '    for ((i=1; i<COMP_CWORD; i++)); do',
+    ]
+    lines += _path_case(tree, '${COMP_WORDS[i]}', ' ' * 8)
+    lines += ['    done', '    case "$cmdpath:$prev" in']
+    for path, node in tree.items():
+        for o in node.options:
+            if not o.takes_value:
+                continue
+            pattern = '|'.join('"{}:{}"'.format(path, f) for f in o.flags)
+            if o.choices:
+                reply = 'COMPREPLY=($(compgen -W "{}" -- "$cur"))'.format(
+                    _words(o.choices))
+            else:
+                reply = 'COMPREPLY=($(compgen -f -- "$cur"))'
+            lines.append('        {}) {}; return;;'.format(pattern, reply))
+    lines += [
+        '    esac',
+        '    local words',
+        '    if [[ "$cur" == -* ]]; then',
+        '        case "$cmdpath" in',
+    ]
+    for path, node in tree.items():
+        lines.append('            "{}") words="{}";;'.format(path, _words(
+            f for o in node.options for f in o.flags)))
+    lines += ['        esac', '    else', '        case "$cmdpath" in']
+    for path, node in tree.items():
+        lines.append('            "{}") words="{}";;'.format(path, _words(
+            [n for n, _ in node.commands] + node.choices)))
+    lines += [
+        '        esac',
+        '    fi',
+        '    COMPREPLY=($(compgen -W "$words" -- "$cur"))',
+        '}',
+        'complete -o default -F {} {}'.format(func, prog),
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def zsh(tree: dict, prog: str) -> str:
+    """Zsh completion script, see :py:func:`completion_script`."""
+    func = _function_name(prog)
+    lines = [
+        '#compdef {}'.format(prog),
+        '# zsh completion for {}, generated by npdoc-cli'.format(prog),
+        '{}() {{'.format(func),
+        '    local cur="${words[CURRENT]}"',
+        '    local prev="${words[CURRENT-1]}"',
+        '    local cmdpath="" i',
+        '    for ((i=2; i<CURRENT; i++)); do',
+    ]
+    lines += _path_case(tree, '${words[i]}', ' ' * 8)
+    lines += ['    done', '    case "$cmdpath:$prev" in']
+    for path, node in tree.items():
+        for o in node.options:
+            if not o.takes_value:
+                continue
+            pattern = '|'.join('"{}:{}"'.format(path, f) for f in o.flags)
+            if o.choices:
+                reply = 'compadd -- {}'.format(' '.join(
+                    '"{}"'.format(_words([c])) for c in o.choices))
+            else:
+                reply = '_files'
+            lines.append('        {}) {}; return;;'.format(pattern, reply))
+    lines += [
+        '    esac',
+        '    if [[ "$cur" == -* ]]; then',
+        '        case "$cmdpath" in',
+    ]
+    for path, node in tree.items():
+        flags = [f for o in node.options for f in o.flags]
+        lines.append('            "{}") compadd -- {};;'.format(
+            path, ' '.join(flags)))
+    lines += ['        esac', '    else', '        case "$cmdpath" in']
+    for path, node in tree.items():
+        words = [n for n, _ in node.commands] + node.choices
+        if words:
+            lines.append('            "{}") compadd -- {};;'.format(
+                path, ' '.join('"{}"'.format(_words([w])) for w in words)))
+        else:
+            lines.append('            "{}") _files;;'.format(path))
+    lines += [
+        '        esac',
+        '    fi',
+        '}',
+        'compdef {} {}'.format(func, prog),
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def _fish_quote(text: str) -> str:
+    return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def fish(tree: dict, prog: str) -> str:
+    """Fish completion script, see :py:func:`completion_script`."""
+    func = _function_name(prog)
+    lines = [
+        '# fish completion for {}, generated by npdoc-cli'.format(prog),
+        'function {}_path'.format(func),
+        '    set -l cmdpath ""',
+        '    for w in (commandline -opc)[2..-1]',
+        '        switch "$cmdpath/$w"',
+    ]
+    paths = [p for p in tree if p]
+    if paths:
+        lines += [
+            '            case ' + ' '.join(_fish_quote(p) for p in paths),
+            '                set cmdpath "$cmdpath/$w"',
+        ]
+    lines += [
+        '        end',
+        '    end',
+        '    echo $cmdpath',
+        'end',
+        'function {}_at'.format(func),
+        '    set -l cmdpath ({}_path)'.format(func),
+        '    test "$cmdpath" = "$argv[1]"',
+        'end',
+        'complete -c {} -f'.format(prog),
+    ]
+    for path, node in tree.items():
+        condition = "-n {}".format(_fish_quote(
+            '{}_at {}'.format(func, _fish_quote(path))))
+        for name, help in node.commands:
+            lines.append('complete -c {} {} -a {} -d {}'.format(
+                prog, condition, _fish_quote(name), _fish_quote(help)))
+        for c in node.choices:
+            lines.append('complete -c {} {} -a {}'.format(
+                prog, condition, _fish_quote(c)))
+        for o in node.options:
+            flags = []
+            for f in o.flags:
+                if f.startswith('--'):
+                    flags.append('-l ' + _fish_quote(f[2:]))
+                elif len(f) == 2:
+                    flags.append('-s ' + _fish_quote(f[1:]))
+                else:
+                    flags.append('-o ' + _fish_quote(f[1:]))
+            if o.choices:
+                flags.append('-x -a ' + _fish_quote(' '.join(o.choices)))
+            elif o.takes_value:
+                flags.append('-r -F')
+            lines.append('complete -c {} {} {} -d {}'.format(
+                prog, condition, ' '.join(flags), _fish_quote(o.help)))
+    return '\n'.join(lines) + '\n'
+
+
+SHELLS = {'bash': bash, 'zsh': zsh, 'fish': fish}
+"""Script generator of each shell."""
+
+
+def completion_script(cli, shell: str = 'bash', prog: str = None) -> str:
+    """
+    Completion script of a built CLI.
+
+    See :py:meth:`NumpyDocCLI.completion`.
+    """
+    if shell not in SHELLS:
+        raise CLIArgError('Unknown shell : ' + str(shell))
+    if prog is None:
+        prog = cli.program_parser.prog
+    return SHELLS[shell](command_tree(cli), prog)
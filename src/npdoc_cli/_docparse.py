@@ -0,0 +1,192 @@
+"""
+Single pass parser for the parts of numpy doc strings used by npdoc-cli.
+
+Only the summary, extended summary and parameters are extracted, the other
+sections are skipped over. Doc strings this parser isn't sure to read the
+same way as numpydoc return None, so the caller can fall back on numpydoc.
+"""
+import re as _re
+from collections import namedtuple as _namedtuple
+
+Parameter = _namedtuple('Parameter', ['name', 'type', 'desc'])
+"""Entry of the Parameters section, like numpydoc's ``Parameter``."""
+
+_SECTIONS = {
+    'Parameters', 'Attributes', 'Methods', 'Returns', 'Yields',
+    'Other Parameters', 'Raises', 'Warns', 'Warnings', 'Notes',
+    'References', 'Examples',
+}
+"""Sections the parser knows, any other falls back on numpydoc."""
+
+_SIGNATURE = _re.compile(r'^([\w., ]+=)?\s*[\w\.]+\(.*\)$')
+_WHITESPACE = _re.compile(r'\s{2,}')
+
+
+def _is_underline(line: str) -> bool:
+    line = line.strip()
+    return len(line) >= 3 and set(line) in ({'-'}, {'='})
+
+
+def _dedent(lines: list) -> list:
+    """Remove common indentation, like textwrap.dedent on joined lines."""
+    margin = None
+    out = []
+    for line in lines:
+        stripped = line.lstrip(' \t')
+        if stripped:
+            indent = len(line) - len(stripped)
+            if margin is None or indent < margin:
+                margin = indent
+            out.append(line)
+        else:
+            out.append('')
+    if margin:
+        out = [line[margin:] for line in out]
+    return out
+
+
+def _strip(lines: list) -> list:
+    i = 0
+    j = len(lines)
+    while i < j and not lines[i].strip():
+        i += 1
+    while j > i and not lines[j - 1].strip():
+        j -= 1
+    return lines[i:j]
+
+
+def _blocks(lines: list) -> list:
+    """Split lines into paragraphs separated by blank lines."""
+    blocks = []
+    block = []
+    for line in lines:
+        if line.strip():
+            block.append(line)
+        elif block:
+            blocks.append(block)
+            block = []
+    if block:
+        blocks.append(block)
+    return blocks
+
+
+def _header(block: list):
+    """
+    Name of the section a paragraph starts.
+
+    Returns
+    -------
+    str
+        Section name, None if the paragraph doesn't start a section.
+
+    Raises
+    ------
+    ValueError
+        If the header is unusual, i.e. numpydoc would warn about it.
+
+    """
+    title = block[0].strip()
+    if title.startswith('..'):
+        raise ValueError(title)
+    if len(block) < 2:
+        return None
+    underline = block[1].strip()
+    if _is_underline(underline) and len(underline) != len(title):
+        raise ValueError(title)
+    if not (underline.startswith('-' * len(title))
+            or underline.startswith('=' * len(title))):
+        return None
+    return title
+
+
+def _parse_params(content: list) -> list:
+    """Parse the lines of a Parameters section."""
+    content = _dedent(content)
+    params = []
+    i = 0
+    n = len(content)
+    while i < n:
+        header = content[i].strip()
+        i += 1
+        j = i
+        while j < n and not (
+                content[j].strip()
+                and len(content[j].lstrip()) == len(content[j])):
+            j += 1
+        desc = _strip(_dedent(content[i:j]))
+        i = j
+
+        if ' : ' in header:
+            name, ptype = header.split(' : ', maxsplit=1)
+            ptype = _WHITESPACE.sub(' ', ptype)
+        else:
+            if header.endswith(' :'):
+                header = header[:-2]
+            name, ptype = header, ''
+        params.append(Parameter(name, ptype, desc))
+    return params
+
+
+def parse(doc: str) -> dict:
+    """
+    Parse the summary, extended summary and parameters of a doc string.
+
+    Parameters
+    ----------
+    doc : str
+        Cleaned doc string, as returned by inspect.getdoc.
+
+    Returns
+    -------
+    dict
+        Maps ``Summary``, ``Extended Summary`` and ``Parameters`` to their
+        content, in the same form as numpydoc.docscrape.FunctionDoc. None if
+        the doc string has anything numpydoc might treat differently.
+
+    """
+    lines = _dedent(doc.split('\n'))
+    blocks = _blocks(lines)
+    out = {'Summary': [''], 'Extended Summary': [], 'Parameters': []}
+
+    try:
+        headers = [_header(b) for b in blocks]
+    except ValueError:
+        return None
+
+    i = 0
+    n = len(blocks)
+    if not n:
+        out['Summary'] = []
+    elif headers[0] is None:
+        summary = blocks[0]
+        if _SIGNATURE.match(' '.join(s.strip() for s in summary).strip()):
+            return None
+        out['Summary'] = summary
+        i = 1
+        extended = []
+        while i < n and headers[i] is None:
+            if extended:
+                extended.append('')
+            extended += blocks[i]
+            i += 1
+        if extended:
+            out['Extended Summary'] = _dedent(extended)
+
+    seen = set()
+    while i < n:
+        name = ' '.join(s.capitalize() for s in headers[i].split(' '))
+        if name in seen or name not in _SECTIONS:
+            return None
+        seen.add(name)
+        section = list(blocks[i])
+        i += 1
+        while i < n and headers[i] is None:
+            section.append('')
+            section += blocks[i]
+            i += 1
+        content = _strip(_dedent(section)[2:])
+        if any(_is_underline(line) for line in content):
+            return None
+        if name == 'Parameters':
+            out['Parameters'] = _parse_params(content)
+    return out
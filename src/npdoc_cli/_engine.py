@@ -0,0 +1,313 @@
+"""
+Lightweight parsing engine for built parser trees.
+
+argparse classifies every argument with patterns and matches positionals
+with regular expressions. The arguments npdoc-cli generates only need
+hash lookups of flags and command names, so this engine plans a parse
+with those, converting values and checking choices as argparse does, and
+then calls the parsers' own actions with the same values. Anything it
+can't be sure to parse exactly as argparse would, e.g. help, errors,
+abbreviated flags, ``--`` or negative numbers, is handed to argparse.
+"""
+import argparse as _ap
+from bisect import bisect_left as _bisect_left
+from npdoc_cli._index import CommandsAction as _CommandsAction
+from npdoc_cli._invoke import record as _record
+
+_FALLBACK_ACTIONS = (_ap._HelpAction, _ap._VersionAction)
+"""Actions always handed to argparse."""
+
+
+class _Fallback(Exception):
+    """Raised when argparse has to parse the arguments."""
+
+
+def _option_like(token: str) -> bool:
+    return token[:1] == '-' and len(token) > 1
+
+
+class Level():
+    """
+    What the engine needs of one parser, derived when first used.
+    """
+
+    __slots__ = ('parser', 'options', 'sorted_options', 'positionals',
+                 'required', 'str_defaults', 'supported')
+
+    def __init__(self, parser: _ap.ArgumentParser):
+        """
+        Initialize a :py:obj:`Level`.
+
+        Parameters
+        ----------
+        parser : ArgumentParser
+            Parser of the program, a command or a subcommand.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.parser = parser
+        """The parser."""
+        self.options = parser._option_string_actions
+        """Flag -> action, argparse's own map."""
+        self.sorted_options = sorted(self.options)
+        """Flags in order, to find those starting with an argument."""
+        self.positionals = [a for a in parser._actions if not a.option_strings]
+        """Positional actions, in order."""
+        self.required = [
+            a for a in parser._actions if a.option_strings and a.required]
+        """Required flags."""
+        self.str_defaults = [
+            a for a in parser._actions if isinstance(a.default, str)]
+        """Actions whose default argparse converts when not given."""
+        self.supported = self._supported()
+        """False if argparse must parse for this parser."""
+
+    def _supported(self) -> bool:
+        parser = self.parser
+        if (parser._mutually_exclusive_groups
+                or parser.prefix_chars != '-'
+                or parser.fromfile_prefix_chars is not None):
+            return False
+        for a in parser._actions:
+            if isinstance(a, _FALLBACK_ACTIONS):
+                continue
+            if a.option_strings:
+                if a.nargs not in (None, 0, '+'):
+                    return False
+        # single values, then a list or commands
+        nargs = [a.nargs for a in self.positionals]
+        while nargs and nargs[0] is None:
+            nargs.pop(0)
+        return nargs in ([], ['+'], [_ap.PARSER])
+
+    def convert(self, action: _ap.Action, token: str, check: bool = True):
+        """Token converted as argparse would, raising _Fallback if not."""
+        convert = self.parser._registry_get('type', action.type, action.type)
+        try:
+            value = convert(token)
+        except Exception:
+            raise _Fallback
+        if (check and action.choices is not None
+                and value not in action.choices):
+            raise _Fallback
+        return value
+
+
+class Engine():
+    """
+    Parser of a built CLI's arguments, see :py:meth:`NumpyDocCLI.build`.
+    """
+
+    def __init__(self, cli):
+        """
+        Initialize an :py:obj:`Engine`.
+
+        Parameters
+        ----------
+        cli : :py:obj:`NumpyDocCLI`
+            CLI whose parsers are used.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.cli = cli
+        """CLI whose parsers are used."""
+        self._levels = {}
+
+    def forget(self, parser: _ap.ArgumentParser):
+        """Derive a parser's :py:obj:`Level` again, once it has changed."""
+        self._levels.pop(parser, None)
+
+    def _level(self, parser: _ap.ArgumentParser) -> Level:
+        level = self._levels.get(parser)
+        if level is None:
+            level = self._levels[parser] = Level(parser)
+        return level
+
+    def _optional(self, level: Level, args: list, i: int, calls: list,
+                  seen: set) -> int:
+        """Plan a flag and its values, returning the next argument index."""
+        token = args[i]
+        action = level.options.get(token)
+        option_string = token
+        explicit = None
+        if action is None:
+            if '=' in token:
+                option_string, explicit = token.split('=', 1)
+                action = level.options.get(option_string)
+            elif token[1] != '-':
+                # -xVALUE or -xyz, unless other flags start with it
+                option_string, explicit = token[:2], token[2:]
+                action = level.options.get(option_string)
+                k = _bisect_left(level.sorted_options, token)
+                if (k < len(level.sorted_options)
+                        and level.sorted_options[k].startswith(token)):
+                    raise _Fallback
+            if action is None:
+                raise _Fallback
+
+        while explicit is not None:
+            if isinstance(action, _FALLBACK_ACTIONS):
+                raise _Fallback
+            if action.nargs == 0:
+                # argparse versions differ on -f=x and -f-x
+                if (option_string[1] == '-' or explicit[:1] in ('', '-')
+                        or '=' in token):
+                    raise _Fallback
+                calls.append((action, [], option_string, None))
+                seen.add(action)
+                option_string = '-' + explicit[0]
+                explicit = explicit[1:] or None
+                action = level.options.get(option_string)
+                if action is None:
+                    raise _Fallback
+                continue
+            value = level.convert(action, explicit)
+            calls.append((action, value if action.nargs is None else [value],
+                          option_string, None))
+            seen.add(action)
+            return i + 1
+
+        if isinstance(action, _FALLBACK_ACTIONS):
+            raise _Fallback
+        i += 1
+        if action.nargs == 0:
+            values = []
+        elif action.nargs is None:
+            if i == len(args) or _option_like(args[i]):
+                raise _Fallback
+            values = level.convert(action, args[i])
+            i += 1
+        else:
+            j = i
+            while j < len(args) and not _option_like(args[j]):
+                j += 1
+            if j == i:
+                raise _Fallback
+            values = [level.convert(action, t) for t in args[i:j]]
+            i = j
+        calls.append((action, values, option_string, None))
+        seen.add(action)
+        return i
+
+    def _plan(self, parser: _ap.ArgumentParser, args: list) -> tuple:
+        """
+        Plan the parse of one parser's arguments.
+
+        Returns
+        -------
+        tuple
+            The level, its actions to call in order as (action, values,
+            option string, plan of a command) and converted defaults.
+
+        """
+        if parser in self.cli._pending:
+            raise _Fallback
+        level = self._level(parser)
+        if not level.supported:
+            raise _Fallback
+        calls = []
+        seen = set()
+        positionals = level.positionals
+        p = 0
+        i = 0
+        n = len(args)
+        while i < n:
+            if _option_like(args[i]):
+                if args[i] == '--':
+                    raise _Fallback
+                i = self._optional(level, args, i, calls, seen)
+                continue
+            j = i
+            while j < n and not _option_like(args[j]):
+                j += 1
+            while i < j and p < len(positionals):
+                action = positionals[p]
+                p += 1
+                seen.add(action)
+                if action.nargs is None:
+                    calls.append(
+                        (action, level.convert(action, args[i]), None, None))
+                    i += 1
+                elif action.nargs == '+':
+                    calls.append((action, [level.convert(action, t)
+                                           for t in args[i:j]], None, None))
+                    i = j
+                else:
+                    name = args[i]
+                    if isinstance(action, _CommandsAction):
+                        try:
+                            name = action.lookup(name, parser.allow_abbrev)
+                        except _ap.ArgumentError:
+                            raise _Fallback
+                    name = level.convert(action, name)
+                    child = action.choices[name]
+                    calls.append((action, [name] + args[i + 1:], None,
+                                  self._plan(child, args[i + 1:])))
+                    i = j = n
+            if i < j:
+                raise _Fallback
+        for action in positionals[p:]:
+            if action.required:
+                raise _Fallback
+        for action in level.required:
+            if action not in seen:
+                raise _Fallback
+        defaults = [(a, level.convert(a, a.default, check=False))
+                    for a in level.str_defaults if a not in seen]
+        return level, calls, defaults
+
+    def _apply(self, plan: tuple) -> _ap.Namespace:
+        """Call the actions of a plan as argparse does."""
+        level, calls, defaults = plan
+        parser = level.parser
+        _record(parser)
+        namespace = _ap.Namespace()
+        for action in parser._actions:
+            if (action.dest is not _ap.SUPPRESS
+                    and not hasattr(namespace, action.dest)
+                    and action.default is not _ap.SUPPRESS):
+                setattr(namespace, action.dest, action.default)
+        for dest, value in parser._defaults.items():
+            if not hasattr(namespace, dest):
+                setattr(namespace, dest, value)
+        for action, values, option_string, child in calls:
+            if child is None:
+                action(parser, namespace, values, option_string)
+                continue
+            if action.dest is not _ap.SUPPRESS:
+                setattr(namespace, action.dest, values[0])
+            for k, v in vars(self._apply(child)).items():
+                setattr(namespace, k, v)
+        for action, value in defaults:
+            if (hasattr(namespace, action.dest)
+                    and action.default is getattr(namespace, action.dest)):
+                setattr(namespace, action.dest, value)
+        return namespace
+
+    def parse_args(self, args: list) -> _ap.Namespace:
+        """
+        Parse arguments, as the program parser's parse_args does.
+
+        Parameters
+        ----------
+        args : list[str]
+            Arguments to parse.
+
+        Returns
+        -------
+        argparse.Namespace
+            Parsed arguments.
+
+        """
+        args = list(args)
+        try:
+            plan = self._plan(self.cli.program_parser, args)
+        except _Fallback:
+            return self.cli.program_parser.parse_args(args)
+        return self._apply(plan)
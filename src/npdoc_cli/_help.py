@@ -0,0 +1,261 @@
+"""
+Help output rendered once and served from an on-disk cache.
+
+Asking for help is the most frequent interactive action and its output is
+the same on every run, so the formatted help of the program and of each
+command and subcommand is stored next to a digest of the doc strings and
+signatures it was rendered from. Serving it skips scraping, importing lazy
+commands and formatting with argparse.
+"""
+import argparse as _ap
+import os as _os
+import sys as _sys
+
+_HELP_VERSION = 1
+"""Bump when the layout of cached help or its digest changes."""
+
+HELP_FLAGS = ('-h', '--help')
+"""Arguments asking for help."""
+
+
+def help_path(argv: list) -> list:
+    """
+    Command names of arguments asking for help.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Arguments about to be parsed.
+
+    Returns
+    -------
+    list[str]
+        Names of the command and subcommand the help is asked for, empty
+        for the program. None if ``argv`` isn't only names followed by
+        ``-h`` or ``--help``.
+
+    """
+    if not argv or argv[-1] not in HELP_FLAGS:
+        return None
+    names = list(argv[:-1])
+    if any(n.startswith('-') for n in names):
+        return None
+    return names
+
+
+def _fingerprint(obj: object) -> str:
+    """
+    Doc string and signature of a command, without importing inspect.
+
+    Callables without code objects fall back on the digest of
+    :py:class:`ScrapeCache`.
+    """
+    func = obj.__init__ if isinstance(obj, type) else obj
+    func = getattr(func, '__func__', func)
+    code = getattr(func, '__code__', None)
+    if code is None:
+        from npdoc_cli._cache import digest
+
+        return digest(obj, {})
+    nargs = code.co_argcount + code.co_kwonlyargcount
+    return '\0'.join((
+        getattr(obj, '__module__', '') or '',
+        getattr(obj, '__qualname__', '') or '',
+        getattr(obj, '__doc__', '') or '',
+        repr(code.co_varnames[:nargs]),
+        repr(getattr(func, '__defaults__', None)),
+        repr(getattr(func, '__kwdefaults__', None)),
+        repr(getattr(func, '__annotations__', None)),
+    ))
+
+
+def _stamp(module: str) -> str:
+    """Path, size and modification time of a module, without importing it."""
+    import importlib.util
+
+    try:
+        spec = importlib.util.find_spec(module)
+        st = _os.stat(spec.origin)
+    except (ImportError, ValueError, AttributeError, TypeError, OSError):
+        return ''
+    return '{}:{}:{}'.format(spec.origin, st.st_size, st.st_mtime_ns)
+
+
+def _part(npdoc_command) -> str:
+    """What a command's help is rendered from."""
+    if getattr(npdoc_command, 'loaded', True):
+        return _fingerprint(npdoc_command.obj)
+    return '\0'.join((npdoc_command.target, npdoc_command.summary or '',
+                      _stamp(npdoc_command.module)))
+
+
+def _names(cli, npdoc_commands: list) -> dict:
+    from npdoc_cli._interface import _cli_name
+
+    settings = cli._help_settings
+    return {_cli_name(c, settings): c for c in npdoc_commands}
+
+
+def _resolve(cli, names: list) -> tuple:
+    """
+    Commands and parser named by a help path.
+
+    Returns
+    -------
+    tuple
+        Commands named, from the program on, stopping at a lazy command
+        not yet imported, and the parser of the last name if it was built.
+        None if a name isn't a command.
+
+    """
+    path = [cli.entry]
+    parser = cli.program_parser
+    children = _names(cli, cli.commands)
+    for name in names:
+        if parser is not None:
+            parser = cli._children.get(parser, {}).get(name)
+        if not getattr(path[-1], 'loaded', True):
+            continue
+        c = children.get(name)
+        if c is None:
+            return None
+        path.append(c)
+        children = _names(cli, cli._subcommands_of(c))
+    return path, parser
+
+
+def help_key(cli, names: list) -> str:
+    """
+    Digest of what the help of a command path is rendered from.
+
+    That is the build settings, terminal width, doc strings and signatures
+    of the commands named, and the names and summaries of the commands
+    listed in the help. Lazy commands not yet imported stand for their
+    module's size and modification time.
+
+    Parameters
+    ----------
+    cli : :py:obj:`NumpyDocCLI`
+        Built CLI.
+    names : list[str]
+        Names of the command and subcommand, empty for the program.
+
+    Returns
+    -------
+    str
+        Hex digest, None if a name isn't a command.
+
+    """
+    import hashlib
+    import shutil
+    from npdoc_cli._cache import versions
+
+    resolved = _resolve(cli, names)
+    if resolved is None:
+        return None
+    path, parser = resolved
+    parts = [
+        str(_HELP_VERSION),
+        versions(),
+        _sys.version,
+        str(shutil.get_terminal_size().columns),
+        repr(sorted(cli._help_settings.items())),
+        repr(names),
+    ]
+    parts += [_part(c) for c in path]
+
+    last = path[-1]
+    if getattr(last, 'loaded', True):
+        # the commands registered, whether or not they're built yet
+        listed = _names(cli, cli.commands if last is cli.entry else (
+            cli._subcommands_of(last)))
+        parts.append(repr(sorted(listed)))
+        parts += [_part(c) for c in listed.values()]
+    if parser is not None and parser not in cli._pending:
+        # listed exactly as the built parser lists them
+        for action in parser._actions:
+            if isinstance(action, _ap._SubParsersAction):
+                parts.append(repr(list(action.choices)))
+                parts += ['{}\0{}'.format(a.dest, a.help)
+                          for a in action._choices_actions]
+    return hashlib.sha256('\0'.join(parts).encode()).hexdigest()
+
+
+def _render(cli, names: list) -> str:
+    """Help of a command path formatted by argparse, None if not found."""
+    if cli._pending:
+        cli._populate_argv(names)
+    parser = cli.program_parser
+    for name in names:
+        parser = cli._children.get(parser, {}).get(name)
+        if parser is None:
+            return None
+        if parser in cli._pending:
+            cli._populate_subparser(parser)
+    return parser.format_help()
+
+
+def help_text(cli, names: list) -> str:
+    """
+    Help of a command path, from :py:attr:`NumpyDocCLI.help_cache`.
+
+    Help not cached yet, or rendered from other doc strings and
+    signatures, is rendered by argparse and stored.
+
+    Parameters
+    ----------
+    cli : :py:obj:`NumpyDocCLI`
+        CLI built with a help cache.
+    names : list[str]
+        Names of the command and subcommand, empty for the program.
+
+    Returns
+    -------
+    str
+        The help, None if a name isn't a command.
+
+    """
+    key = help_key(cli, names)
+    if key is None:
+        return None
+    entry = cli.entry.obj
+    name = 'help:{}:{} {}'.format(
+        getattr(entry, '__module__', ''), entry.__qualname__, ' '.join(names))
+    text = cli.help_cache.load(name, key)
+    if text is None:
+        text = _render(cli, names)
+        if text is None:
+            return None
+        cli.help_cache.store(name, key, text)
+    return text
+
+
+def serve_help(cli, argv: list):
+    """
+    Print the cached help and exit if the arguments ask for it.
+
+    Parameters
+    ----------
+    cli : :py:obj:`NumpyDocCLI`
+        CLI built with a help cache.
+    argv : list[str]
+        Arguments about to be parsed.
+
+    Raises
+    ------
+    SystemExit
+        With status 0 once the help is printed, as argparse does.
+
+    Returns
+    -------
+    None.
+
+    """
+    names = help_path(argv)
+    if names is None:
+        return
+    text = help_text(cli, names)
+    if text is None:
+        return
+    _sys.stdout.write(text)
+    raise SystemExit(0)
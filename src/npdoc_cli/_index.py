@@ -0,0 +1,200 @@
+"""
+Index of the names of a parser's commands or subcommands.
+
+Built with the parsers, it resolves unique prefixes such as ``tra`` for
+``train`` by bisecting the sorted names, and suggests names close to a
+mistyped one from the names left after deleting a character, so neither
+scans every name.
+"""
+import argparse as _ap
+from bisect import bisect_left as _bisect_left
+
+MAX_LISTED = 5
+"""Most names listed in an error."""
+
+_LAST = chr(0x10FFFF)
+# sorts after every character of a name
+
+
+def _deletes(name: str) -> list:
+    """
+    The name and the names left after deleting one character, as (name,
+    position deleted), -1 for the name itself.
+    """
+    return [(name, -1)] + [(name[:i] + name[i + 1:], i)
+                           for i in range(len(name))]
+
+
+def _distance(a: str, i: int, b: str, j: int) -> int:
+    """
+    Edits between two names left the same after deleting a character at
+    ``i`` of ``a`` and ``j`` of ``b``, -1 meaning none.
+    """
+    if i == j:
+        # the same name, or a character replaced
+        return 0 if i == -1 else 1
+    if i == -1 or j == -1:
+        # a character inserted
+        return 1
+    if abs(i - j) == 1 and a[i] == b[j]:
+        # adjacent characters swapped
+        return 1
+    return 2
+
+
+class CommandIndex():
+    """
+    Prefixes and near misses of a set of command names.
+    """
+
+    def __init__(self, names: list):
+        """
+        Initialize a :py:obj:`CommandIndex`.
+
+        Parameters
+        ----------
+        names : list[str]
+            Names of the commands.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.names = []
+        """Names of the commands, sorted."""
+        self._deletes = {}
+        # name with a character deleted -> (name it's left from, position)
+        self.update(names)
+
+    def update(self, names: list):
+        """
+        Index these names instead, adding and removing the names changed.
+
+        Parameters
+        ----------
+        names : list[str]
+            Names of the commands.
+
+        Returns
+        -------
+        None.
+
+        """
+        new = set(names)
+        old = set(self.names)
+        if new == old:
+            return
+        for name in old - new:
+            for d, i in _deletes(name):
+                entries = self._deletes[d]
+                entries.remove((name, i))
+                if not entries:
+                    del self._deletes[d]
+        for name in new - old:
+            for d, i in _deletes(name):
+                self._deletes.setdefault(d, []).append((name, i))
+        self.names = sorted(new)
+
+    def complete(self, prefix: str) -> list:
+        """Names starting with a prefix, sorted."""
+        names = self.names
+        start = _bisect_left(names, prefix)
+        stop = _bisect_left(names, prefix + _LAST, start)
+        return names[start:stop]
+
+    def unique(self, prefix: str) -> str:
+        """Name that is or is the only one starting with a prefix, else None."""
+        names = self.names
+        k = _bisect_left(names, prefix)
+        if k == len(names) or not names[k].startswith(prefix):
+            return None
+        if names[k] == prefix:
+            return prefix
+        if k + 1 < len(names) and names[k + 1].startswith(prefix):
+            return None
+        return names[k]
+
+    def suggest(self, name: str, limit: int = 3) -> list:
+        """
+        Names a mistyped name is likely meant to be.
+
+        Parameters
+        ----------
+        name : str
+            Mistyped name.
+        limit : int, optional
+            Most names suggested. The default is 3.
+
+        Returns
+        -------
+        list[str]
+            Names two edits away at most, closest first: those left the
+            same as ``name`` after deleting a character from either. An
+            edit is inserting, deleting or replacing a character, or
+            swapping two adjacent ones.
+
+        """
+        best = {}
+        for d, i in _deletes(name):
+            for c, j in self._deletes.get(d, ()):
+                edits = _distance(name, i, c, j)
+                if edits < best.get(c, 3):
+                    best[c] = edits
+        best.pop(name, None)
+        return [c for _, c in sorted((e, c) for c, e in best.items())][:limit]
+
+
+def _listed(names: list) -> str:
+    if len(names) > MAX_LISTED:
+        return ', '.join(names[:MAX_LISTED]) + ', ...'
+    return ', '.join(names)
+
+
+class CommandsAction(_ap._SubParsersAction):
+    """
+    Subparsers action resolving abbreviated and mistyped command names.
+    """
+
+    index = None
+    """:py:obj:`CommandIndex` of the commands, None until built."""
+
+    def lookup(self, name: str, allow_abbrev: bool = True) -> str:
+        """
+        Command named, resolving a unique prefix.
+
+        Parameters
+        ----------
+        name : str
+            Name or prefix given on the command line.
+        allow_abbrev : bool, optional
+            Resolve prefixes. The default is True.
+
+        Raises
+        ------
+        argparse.ArgumentError
+            If the prefix is ambiguous, or the name isn't a command and
+            others are close to it.
+
+        Returns
+        -------
+        str
+            Name of the command, ``name`` if argparse is left to report it.
+
+        """
+        if name in self._name_parser_map or self.index is None:
+            return name
+        if allow_abbrev:
+            matches = self.index.complete(name)
+            if len(matches) == 1:
+                return matches[0]
+            if matches:
+                raise _ap.ArgumentError(
+                    self, 'ambiguous choice: {!r} could match {}'.format(
+                        name, _listed(matches)))
+        suggestions = self.index.suggest(name)
+        if suggestions:
+            raise _ap.ArgumentError(
+                self, 'invalid choice: {!r}, maybe you meant {}?'.format(
+                    name, ' or '.join(repr(s) for s in suggestions)))
+        return name
@@ -1,12 +1,24 @@
 """
 Interface module for npdoc-cli.
+
+numpydoc, inspect and typing are imported where they are used so that
+importing npdoc_cli stays cheap for CLIs that never need to scrape.
 """
 import argparse as _ap
-import inspect as _inspect
-import typing as _typing
 import re as _re
+import sys as _sys
+import time as _time
 from npdoc_cli._errors import CLIArgError
-from numpydoc.docscrape import FunctionDoc as _scrape
+from npdoc_cli._async import is_async as _is_async, resolve as _resolve
+from npdoc_cli._cache import ScrapeCache
+from npdoc_cli._compile import compile_cli as _compile_cli
+from npdoc_cli._index import CommandIndex as _CommandIndex
+from npdoc_cli._index import CommandsAction as _CommandsAction
+from npdoc_cli._invoke import Outcome, Parser as _Parser
+from npdoc_cli._invoke import ReadWriteLock as _ReadWriteLock
+from npdoc_cli._profile import Profiler, NULL_TIMER as _NULL_TIMER
+from npdoc_cli._profile import destination as _profile_destination
+from npdoc_cli._spec import ArgSpec, CommandSpec
 
 class FunctionInput():
     """Class for organizing function inputs."""
@@ -58,6 +70,10 @@ class NumpyDocCommand():
         """Object called to and called during cli dispatch."""
         self.fname = obj.__name__
         """Name of ``obj``."""
+        self.qualname = getattr(obj, '__qualname__', self.fname)
+        """Qualified name of ``obj``, the key of its subcommands."""
+        self._signature = None
+        self._specs = {}
 
     def __repr__(self):
         return 'NumpDocCommand:'+str(self.obj.__qualname__)
@@ -65,29 +81,54 @@ class NumpyDocCommand():
     def __str__(self):
         return self.fname
 
+    def refers_to(self, obj: object) -> bool:
+        """
+        True if ``obj`` has the module, qualified name and name of the
+        command. Objects made by a factory share a qualified name, but are
+        named apart.
+        """
+        if obj is self.obj:
+            return True
+        qualname = getattr(obj, '__qualname__', None)
+        return (qualname is not None
+                and qualname == getattr(self.obj, '__qualname__', None)
+                and getattr(obj, '__name__', None) == self.fname
+                and getattr(obj, '__module__', None)
+                == getattr(self.obj, '__module__', None))
+
+    def _replace(self, obj: object):
+        """Refer to ``obj`` instead, e.g. once its module is reloaded."""
+        self.obj = obj
+        self.fname = obj.__name__
+        self.qualname = getattr(obj, '__qualname__', self.fname)
+        self._forget()
+
+    def _forget(self):
+        """Drop the memoized signature and specs, once ``obj`` changed."""
+        self._signature = None
+        self._specs = {}
+
+    @property
+    def signature(self):
+        """Signature of ``obj``, computed once."""
+        if self._signature is None:
+            import inspect
+
+            func = self.obj
+            if type(func) == classmethod:
+                raise CLIArgError('class methods not currently supported : ' + func.__qualname__)
+            self._signature = inspect.signature(func)
+        return self._signature
+
     @property
     def defaults(self) -> dict:
         """Dictionairy of keyword arguments and their default value"""
-        func = self.obj
-        if type(func) == classmethod:
-            raise CLIArgError('class methods not currently supported : ' + func.__qualname__)
-        signature = _inspect.signature(func)
-
-        return {
-            k: v.default
-            for k, v in signature.parameters.items()
-            if v.default is not _inspect.Parameter.empty
-        }
+        return _defaults(self.signature)
 
     @property
     def types(self) -> dict:
         """Dictionairy of arguments and types."""
-        func = self.obj
-        signature = _inspect.signature(func)
-        return {
-            k: v.annotation
-            for k, v in signature.parameters.items()
-        }
+        return _types(self.signature)
 
     def disp(self):
         """Print scraped settings for debugging."""
@@ -99,19 +140,26 @@ class NumpyDocCommand():
 
     def scrape(
             self,
-            replace_underscores: bool = True
+            replace_underscores: bool = True,
+            doc_parser: str = 'numpydoc'
     ) -> FunctionInput:
         """
         Scrape doc strings and functions signature.
 
         Turns doc strings and function signatures into settings that can be
-        passed into argparse to generate a command line interface.
+        passed into argparse to generate a command line interface. The
+        settings are scraped as a :py:obj:`CommandSpec`, see
+        :py:meth:`NumpyDocCommand.spec`, and converted.
 
         Parameters
         ----------
         replace_underscores : bool, optional
             Replace underscores in argument/function names with
             dashes, stylistic choice. The default is True.
+        doc_parser : str, {numpydoc, fast}
+            Parser for the doc string. ``fast`` only reads the sections
+            used here and falls back on numpydoc for unusual doc strings.
+            The default is numpydoc.
 
 
         Raises
@@ -127,18 +175,55 @@ class NumpyDocCommand():
             Inputs to be passed into argparse.ArgumentParser.add_argument
 
         """
+        spec = self._scrape(
+            replace_underscores=replace_underscores, doc_parser=doc_parser)
+        parser_ins = FunctionInput()
+        parser_ins.pa, parser_ins.kwa = spec.to_argparse()
+        parser_ins.pa = list(parser_ins.pa)
+        arg_ins_ls = []
+        for a in spec.args:
+            arg_ins = FunctionInput()
+            arg_ins.pa, arg_ins.kwa = a.to_argparse()
+            arg_ins.pa = list(arg_ins.pa)
+            if 'choices' in arg_ins.kwa:
+                arg_ins.kwa['choices'] = list(arg_ins.kwa['choices'])
+            arg_ins_ls.append(arg_ins)
+        return parser_ins, arg_ins_ls
+
+    def _scrape(
+            self,
+            replace_underscores: bool = True,
+            doc_parser: str = 'numpydoc'
+    ) -> CommandSpec:
+        """Scrape settings, see :py:meth:`NumpyDocCommand.scrape`."""
+        import array
+        import collections.abc
+        import typing
+        from npdoc_cli._ndarray import ndarray_dtype
+
         function = self.obj
 
         # output
-        parser_ins = FunctionInput()
-        arg_ins_ls = []
+        args = []
 
         # scrape signature and doc strings
-        doc = _scrape(function)
+        doc = None
+        if doc_parser == 'fast':
+            import inspect
+            from npdoc_cli._docparse import parse
+
+            doc = parse(inspect.getdoc(function) or '')
+        elif doc_parser != 'numpydoc':
+            raise CLIArgError('Unknown doc parser : ' + str(doc_parser))
+        if doc is None:
+            from numpydoc.docscrape import FunctionDoc
+
+            doc = FunctionDoc(function)
         params = doc['Parameters']
         summary = ' '.join(doc['Summary'] + doc['Extended Summary'])
-        defaults = self.defaults
-        types = self.types
+        signature = self.signature
+        defaults = _defaults(signature)
+        types = _types(signature)
 
         # parser inputs
 
@@ -146,12 +231,14 @@ class NumpyDocCommand():
         cli_name = function.__name__
         if replace_underscores:
             cli_name = cli_name.replace('_', '-')
-        parser_ins.pa.append(cli_name)
-        parser_ins.kwa['description'] = ''.join(summary)
+        name = cli_name
+        description = ''.join(summary)
 
         used_flags = []
         for p in params:
-            arg_ins = FunctionInput()
+            flags = []
+            kwargs = {}
+            array_item = None
 
             # add command line name
             cli_name = p.name
@@ -160,7 +247,7 @@ class NumpyDocCommand():
 
             # positional arguments
             if p.name not in defaults:
-                arg_ins.pa.append(cli_name)
+                flags.append(cli_name)
 
             # not positional, so has a flag
             else:
@@ -171,11 +258,11 @@ class NumpyDocCommand():
                     if short not in used_flags:
                         used_flags += [short]
                         break
-                arg_ins.pa.append('-' + short)
-                arg_ins.pa.append('--' + cli_name)
+                flags.append('-' + short)
+                flags.append('--' + cli_name)
 
                 # flag as a required key word argument or not
-                arg_ins.kwa['default'] = defaults[p.name]
+                kwargs['default'] = defaults[p.name]
 
             # bool flags require a default
             # check for matching names
@@ -191,31 +278,66 @@ class NumpyDocCommand():
                     raise CLIArgError('Booleans must provide a default value.')
 
                 # set flag action, opposite of default
-                arg_ins.kwa['action'] = 'store_true'
+                kwargs['action'] = 'store_true'
                 if default:
-                    arg_ins.kwa['action'] = 'store_false'
+                    kwargs['action'] = 'store_false'
 
             # handle typing, choices on non-bool things
             else:
                 # handle nargs and type assignment
                 ptype = types[p.name]
-                if list == _typing.get_origin(ptype):
-                    arg_ins.kwa['nargs'] = '+'
-                    arg_ins.kwa['action'] =  'extend'
-                    type_args = _typing.get_args(ptype)
-                    arg_ins.kwa['type'] = type_args[0]
+                origin = typing.get_origin(ptype)
+                is_ndarray, dtype = ndarray_dtype(ptype)
+                if list == origin:
+                    kwargs['nargs'] = '+'
+                    kwargs['action'] =  'extend'
+                    type_args = typing.get_args(ptype)
+                    kwargs['type'] = type_args[0]
+                # iterators are streamed, from @file or - for stdin
+                elif origin in (
+                        collections.abc.Iterator, collections.abc.Iterable):
+                    from npdoc_cli._stream import StreamAction
+
+                    type_args = typing.get_args(ptype)
+                    kwargs['nargs'] = '+'
+                    kwargs['action'] = StreamAction
+                    kwargs['item_type'] = (
+                        type_args[0] if type_args else str)
+                # arrays are converted in bulk, typecode resolved below
+                elif ptype is array.array or origin is array.array:
+                    from npdoc_cli._array import ArrayAction
+
+                    type_args = typing.get_args(ptype)
+                    kwargs['nargs'] = '+'
+                    kwargs['action'] = ArrayAction
+                    kwargs['typecode'] = None
+                    array_item = type_args[0] if type_args else None
+                # numpy arrays, inline or memory mapped from a file
+                elif is_ndarray:
+                    from npdoc_cli._ndarray import NDArrayAction
+
+                    kwargs['nargs'] = '+'
+                    kwargs['action'] = NDArrayAction
+                    kwargs['dtype'] = dtype
                 # not a special type of input, pass as given
                 else:
-                    arg_ins.kwa['type'] = ptype
+                    kwargs['type'] = ptype
                 
                 # look for choices option
                 # expecting {a, b, c}
                 choices = _re.search(r'\{(.*?)\}', p.type)
+                if choices is not None and (
+                        'item_type' in kwargs
+                        or 'typecode' in kwargs
+                        or 'dtype' in kwargs):
+                    raise CLIArgError(
+                        str(function) + ': choices of streamed and array '
+                        'arguments are not supported')
                 if choices is not None:
                     choices = choices.group(0).replace('{','').replace('}','')
                     choices = choices.split(', ')
-                    arg_ins.kwa['choices'] = [
-                        arg_ins.kwa['type'](c) for c in choices
+                    kwargs['choices'] = [
+                        kwargs['type'](c) for c in choices
                         ]
 
             # look for additional arguments CLI argument settings
@@ -238,7 +360,7 @@ class NumpyDocCommand():
                             )
                     extras[pair[0]] = pair[1]
                 # check validity
-                valid = 'required', 'nargs', 'action'
+                valid = 'required', 'nargs', 'action', 'typecode'
                 if any([k not in valid for k in extras]):
                     raise CLIArgError('Unexpected key in "For CLI argument" ' + str(function))
 
@@ -251,28 +373,284 @@ class NumpyDocCommand():
                     else:
                         raise CLIArgError('required should be True or False ' + str(function))
 
+                # typecode makes lists arrays converted in bulk
+                if 'typecode' in extras:
+                    if kwargs.get('action') == 'extend':
+                        from npdoc_cli._array import ArrayAction
+
+                        if 'choices' in kwargs:
+                            raise CLIArgError(
+                                str(function) + ': choices of array '
+                                'arguments are not supported')
+                        array_item = kwargs.pop('type')
+                        kwargs['action'] = ArrayAction
+                    elif 'typecode' not in kwargs:
+                        raise CLIArgError(
+                            'typecode expects a list or array argument '
+                            + str(function))
+
                 # add back to ouput
-                for k in extras: arg_ins.kwa[k] = extras[k]
+                for k in extras: kwargs[k] = extras[k]
+                if 'typecode' in extras:
+                    from npdoc_cli._array import typecode
+
+                    kwargs['typecode'] = typecode(
+                        array_item, extras['typecode'])
 
 
+            if kwargs.get('typecode', '') is None:
+                from npdoc_cli._array import typecode
+
+                kwargs['typecode'] = typecode(array_item)
+
             # help
-            arg_ins.kwa['help'] = ''.join(p.desc)
+            kwargs['help'] = ''.join(p.desc)
 
             # handle special cases where things populated that shouldn't be
             # passed to the parser
 
             # count actions shouldn't pass there type
-            if 'action' in arg_ins.kwa:
+            if 'action' in kwargs:
                 # this means it's a count
-                if arg_ins.kwa['action'] == 'count':
-                    if 'type' not in arg_ins.kwa or arg_ins.kwa['type'] != int:
+                if kwargs['action'] == 'count':
+                    if 'type' not in kwargs or kwargs['type'] != int:
                         raise CLIArgError(str(function)+': count action expected type int')
-                    arg_ins.kwa.pop('type')
+                    kwargs.pop('type')
 
-            # append to list
-            arg_ins_ls.append(arg_ins)
+            args.append(ArgSpec(flags, kwargs))
+
+        return CommandSpec(name, {'description': description}, args)
+
+    def spec(
+            self,
+            cache: ScrapeCache = None,
+            **scrape_settings
+    ) -> CommandSpec:
+        """
+        Scraped settings as a :py:obj:`CommandSpec`.
+
+        The spec is computed once for each set of scrape settings, and
+        reused afterwards, until the command changes.
+
+        Parameters
+        ----------
+        cache : :py:obj:`ScrapeCache`, optional
+            Persistent cache to look the spec up in before scraping.
+            The default is None.
+        **scrape_settings
+            Settings passed to :py:meth:`NumpyDocCommand.scrape`.
+
+        Returns
+        -------
+        :py:obj:`CommandSpec`
+            Settings of the command's parser and arguments.
+
+        """
+        key = _spec_key(scrape_settings)
+        spec = self._specs.get(key)
+        if spec is None:
+            if cache is None:
+                spec = self._scrape(**scrape_settings)
+            else:
+                spec = cache.spec(self, scrape_settings)
+            self._specs[key] = spec
+        return spec
+
+
+class LazyNumpyDocCommand(NumpyDocCommand):
+    """
+    :py:obj:`NumpyDocCommand` whose object is imported when first needed.
+    """
+
+    def __init__(self, target: str, summary: str = None):
+        """
+        Initialize a :py:obj:`LazyNumpyDocCommand`.
+
+        Parameters
+        ----------
+        target : str
+            Import path of the command's function or class definition,
+            ``module:qualname``.
+        summary : str, optional
+            One line summary shown in the program help before the command is
+            imported. The default is None.
+
+        Raises
+        ------
+        CLIArgError
+            If ``target`` isn't formatted as ``module:qualname``.
+
+        Returns
+        -------
+        None.
+
+        """
+        module, _, qualname = target.partition(':')
+        if not module or not qualname:
+            raise CLIArgError('Expected module:qualname, got ' + target)
+        self.target = target
+        """Import path of the command."""
+        self.module = module
+        """Module defining the command."""
+        self.qualname = qualname
+        """Qualified name of the command in ``module``."""
+        self.fname = qualname.split('.')[-1]
+        """Name of ``obj``."""
+        self.summary = summary
+        """One line summary for the program help."""
+        self._obj = None
+        self._signature = None
+        self._specs = {}
+
+    def __repr__(self):
+        return 'LazyNumpDocCommand:' + self.target
+
+    @property
+    def obj(self) -> callable:
+        """Object called during cli dispatch, imported on first access."""
+        if self._obj is None:
+            import importlib
+
+            obj = importlib.import_module(self.module)
+            for name in self.qualname.split('.'):
+                obj = getattr(obj, name)
+            self._obj = obj
+        return self._obj
+
+    @property
+    def loaded(self) -> bool:
+        """True once ``obj`` has been imported."""
+        return self._obj is not None
+
+    def refers_to(self, obj: object) -> bool:
+        """True if ``obj`` is the object ``target`` points to."""
+        return (getattr(obj, '__module__', None) == self.module
+                and getattr(obj, '__qualname__', None) == self.qualname)
+
+
+def _defaults(signature) -> dict:
+    """Keyword arguments of a signature and their default value."""
+    import inspect
+
+    return {
+        k: v.default
+        for k, v in signature.parameters.items()
+        if v.default is not inspect.Parameter.empty
+    }
 
-        return parser_ins, arg_ins_ls
+
+def _types(signature) -> dict:
+    """Arguments of a signature and their type."""
+    return {
+        k: v.annotation
+        for k, v in signature.parameters.items()
+    }
+
+
+def _option_like(token: str) -> bool:
+    return token[:1] == '-' and len(token) > 1
+
+
+def _option_values(parser: _ap.ArgumentParser, args: list, i: int) -> tuple:
+    """
+    Action of the option at ``args[i]``, None if unknown, and the number of
+    arguments after it argparse gives it as values.
+    """
+    token = args[i]
+    name, explicit, _ = token.partition('=')
+    explicit = bool(explicit)
+    options = parser._option_string_actions
+    action = options.get(name)
+    if action is None and name.startswith('--') and parser.allow_abbrev:
+        matches = [o for o in options if o.startswith(name)]
+        if len(matches) == 1:
+            action = options[matches[0]]
+    elif action is None and not name.startswith('--') and len(name) > 2:
+        # -xVALUE, or flags -xyz whose last may take the next argument
+        rest = name[1:]
+        while rest:
+            action = options.get('-' + rest[0])
+            rest = rest[1:]
+            if action is None or action.nargs != 0:
+                break
+        explicit = bool(rest)
+    if action is None or explicit or action.nargs == 0:
+        return action, 0
+    if action.nargs is None:
+        return action, 1
+    if isinstance(action.nargs, int):
+        return action, action.nargs
+    j = i + 1
+    while j < len(args) and not _option_like(args[j]):
+        j += 1
+    if action.nargs == _ap.OPTIONAL:
+        return action, min(j - i - 1, 1)
+    return action, j - i - 1
+
+
+_SCRAPE_DEFAULTS = {'replace_underscores': True, 'doc_parser': 'numpydoc'}
+"""Settings :py:meth:`NumpyDocCommand.scrape` defaults to."""
+
+
+def _spec_key(scrape_settings: dict) -> tuple:
+    """Hashable key of a set of scrape settings, defaults filled in."""
+    return tuple(sorted(dict(_SCRAPE_DEFAULTS, **scrape_settings).items()))
+
+
+def _try_spec(
+        npdoc_command: NumpyDocCommand,
+        cache: ScrapeCache,
+        scrape_settings: dict) -> tuple:
+    """Spec of a command and None, or None and the error raised."""
+    try:
+        return npdoc_command.spec(cache, **scrape_settings), None
+    except Exception as e:
+        return None, e
+
+
+_scrape_job_args = None
+# (commands, cache, scrape settings) inherited by forked scrape workers
+
+
+def _scrape_job(i: int) -> object:
+    """Spec of one command in a forked worker, None if it can't be sent."""
+    import pickle
+
+    commands, cache, scrape_settings = _scrape_job_args
+    spec, error = _try_spec(commands[i], cache, scrape_settings)
+    if error is not None:
+        return None
+    try:
+        pickle.dumps(spec)
+    except Exception:
+        return None
+    return spec
+
+
+def _profile_name(npdoc_command: NumpyDocCommand) -> str:
+    """Name of a command in profile reports, without importing it."""
+    if isinstance(npdoc_command, LazyNumpyDocCommand):
+        return npdoc_command.target
+    obj = npdoc_command.obj
+    return '{}:{}'.format(
+        getattr(obj, '__module__', ''),
+        getattr(obj, '__qualname__', npdoc_command.fname))
+
+
+def _revision(npdoc_command: NumpyDocCommand) -> tuple:
+    """What a command's parser is built from, compared between builds."""
+    if isinstance(npdoc_command, LazyNumpyDocCommand) and not npdoc_command.loaded:
+        return npdoc_command.target, npdoc_command.summary
+    obj = npdoc_command.obj
+    return obj, getattr(obj, '__doc__', None)
+
+
+def _cli_name(npdoc_command: NumpyDocCommand, scrape_settings: dict) -> str:
+    """Name of a command on the command line."""
+    cli_name = npdoc_command.fname
+    if scrape_settings.get('replace_underscores', True):
+        cli_name = cli_name.replace('_', '-')
+    return cli_name
 
 
 class NumpyDocCLI():
@@ -293,6 +671,35 @@ class NumpyDocCLI():
         """ArgumentParser for each command."""
         self.subcommand_parsers = {}
         """ArgumentParser for each subcommand"""
+        self.scrape_cache = None
+        """:py:obj:`ScrapeCache` used during build, None if not caching."""
+        self.help_cache = None
+        """:py:obj:`ScrapeCache` of rendered help, None if not caching."""
+        self.profiler = None
+        """:py:obj:`Profiler` timing the CLI, None if not profiling."""
+        self.uvloop = True
+        """Run async routines on uvloop when it's installed."""
+        self._runners = None
+        # event loop of each thread for async routines, made when first used
+        self._pending = {}
+        # placeholder parser -> (command, instance, scrape settings, sort,
+        # is a command) for parsers of a lazy build not yet populated
+        self._children = {}
+        # parser -> {cli name: parser} of its commands/subcommands
+        self._indexes = {}
+        # parser -> CommandIndex of the names of its commands/subcommands
+        self._help_settings = {}
+        # build settings the rendered help depends on
+        self._built = {}
+        # command -> (revision, parser) of every command with a parser
+        self._build_state = None
+        # (settings, instances) of the last build
+        self._lock = _ReadWriteLock()
+        # held to parse, held alone to build and fill in placeholders
+        self._memo = None
+        # Memo of arguments parsed by invoke, None if not memoizing
+        self._engine = None
+        # Engine parsing arguments instead of argparse, None if argparse
 
 
     def reset(self):
@@ -341,19 +748,68 @@ class NumpyDocCLI():
             Same object passed as input, unmodified.
 
         """
+        for c in self.commands:
+            if not c.refers_to(obj):
+                continue
+            # imported by a lazy command, which already registered it, or
+            # registered again by a reloaded module, rebuilt by next build
+            if not isinstance(c, LazyNumpyDocCommand):
+                c._replace(obj)
+            elif c.loaded:
+                c._obj = obj
+            return obj
         c = NumpyDocCommand(obj)
         self.commands.append(c)
         return obj
 
+    def lazy_command(self, target: str, summary: str = None) -> NumpyDocCommand:
+        """
+        Define a command by import path, imported only when it is used.
+
+        The module defining the command is imported when the command is
+        named on the command line, so the program help and other commands
+        don't pay for importing it. The help lists ``summary`` for the
+        command, or the summary stored in the scrape cache the last time
+        the command was used.
+
+        Parameters
+        ----------
+        target : str
+            Import path of the command's function or class definition,
+            ``module:qualname``, e.g. ``mypkg.train:fit``.
+        summary : str, optional
+            One line summary shown in the program help. The default is None.
+
+        Returns
+        -------
+        :py:obj:`LazyNumpyDocCommand`
+            The registered command.
+
+        """
+        c = LazyNumpyDocCommand(target, summary)
+        self.commands.append(c)
+        return c
+
     def subcommand(self, function: callable) -> callable:
         """
         Wrapper function to define subcommands for a command.
 
+        Subcommands nest to any depth: a class defined in a command's
+        class and wrapped in subcommand is a group, whose own wrapped
+        functions and classes are its subcommands, e.g. ``cluster node
+        disk scrub``.
+
         Parameters
         ----------
         function : object
-            Function to be called as subcommand. Should belong as submethod
-            to its parent commmand's class definition.
+            Function to be called as subcommand, or class definition if
+            using subcommands of its own. Should belong as submethod
+            to its parent commmand's or group's class definition.
+
+        Raises
+        ------
+        CLIArgError
+            If ``function`` isn't defined in a class.
 
         Returns
         -------
@@ -361,7 +817,16 @@ class NumpyDocCLI():
             Same function passed, unmodified.
 
         """
-        parent = function.__qualname__.split('.')[-2]
+        parent, _, _ = function.__qualname__.rpartition('.')
+        if not parent or parent.endswith('<locals>'):
+            raise CLIArgError(
+                'subcommands must be defined in a class : '
+                + function.__qualname__)
+        for sc in self.subcommands.get(parent, []):
+            # registered again by a reloaded module, rebuilt by next build
+            if sc.refers_to(function):
+                sc._replace(function)
+                return function
         sc = NumpyDocCommand(function)
         try:
             self.subcommands[parent].append(sc)
@@ -382,18 +847,174 @@ class NumpyDocCLI():
         print('CLI Command Tree')
         print('----------------')
         print(self.entry.fname)
-        for c in self.commands:
-            print('   >', c)
-            for s in self.subcommands[c.fname]:
-                print(' '*7, '>', s)
+        todo = [(c, 1) for c in self.commands]
+        while todo:
+            c, depth = todo.pop(0)
+            if depth == 1:
+                print('   >', c)
+            else:
+                print(' '*(4*depth-1), '>', c)
+            todo[:0] = [(s, depth + 1) for s in self._subcommands_of(c)]
         print('----------------')
 
+    def _subcommands_of(self, npdoc_command: NumpyDocCommand) -> list:
+        """Subcommands registered in a command's or group's class."""
+        return self.subcommands.get(npdoc_command.qualname, [])
+
+    def _descendants(self, npdoc_command: NumpyDocCommand) -> list:
+        """Subcommands below a command or group, at any depth."""
+        found = []
+        todo = list(self._subcommands_of(npdoc_command))
+        while todo:
+            c = todo.pop(0)
+            found.append(c)
+            todo += self._subcommands_of(c)
+        return found
+
+    def _timed(self, phase: str, what: object):
+        """
+        Time a phase with :py:attr:`profiler`, if profiling.
+
+        Parameters
+        ----------
+        phase : str
+            Phase being timed.
+        what : str, :py:obj:`NumpyDocCommand` or callable
+            What the phase is run on.
+
+        Returns
+        -------
+        context manager
+            Timer of its block.
+
+        """
+        if self.profiler is None:
+            return _NULL_TIMER
+        if isinstance(what, NumpyDocCommand):
+            what = _profile_name(what)
+        elif not isinstance(what, str):
+            what = getattr(what, '__qualname__', None) or repr(what)
+        return self.profiler.time(phase, what)
+
+    def _command_spec(
+            self,
+            npdoc_command: NumpyDocCommand,
+            scrape_settings: dict) -> CommandSpec:
+        """
+        Spec of a command, through :py:attr:`scrape_cache` if one is set.
+
+        Parameters
+        ----------
+        npdoc_command : :py:obj`NumpyDocCommand`.
+            Command to scrape.
+        scrape_settings : dict
+            Additional settings to pass to :py:obj`NumpyDocCommand`.scrape.
+
+        Returns
+        -------
+        :py:obj:`CommandSpec`
+            Output of :py:obj`NumpyDocCommand`.spec.
+
+        """
+        spec = npdoc_command._specs.get(_spec_key(scrape_settings))
+        if spec is not None:
+            return spec
+        with self._timed('scrape', npdoc_command):
+            return npdoc_command.spec(self.scrape_cache, **scrape_settings)
+
+    def _scrape_all(
+            self,
+            npdoc_commands: list,
+            scrape_settings: dict,
+            workers: int,
+            pool: str):
+        """
+        Scrape commands concurrently before building their parsers.
+
+        Specs are memoized on each command, so the parsers are then built
+        from them in order. Doc string errors are collected from every
+        command and raised together.
+
+        Parameters
+        ----------
+        npdoc_commands : list[:py:obj:`NumpyDocCommand`]
+            Commands to scrape.
+        scrape_settings : dict
+            Additional settings to pass to :py:obj`NumpyDocCommand`.scrape.
+        workers : int
+            Number of workers.
+        pool : str, {thread, process}
+            Scrape in a thread pool or a pool of forked processes. Forked
+            processes aren't available on every platform, in which case
+            threads are used.
+
+        Raises
+        ------
+        CLIArgError
+            If doc strings of any commands have problems, listing them all.
+
+        Returns
+        -------
+        None.
+
+        """
+        global _scrape_job_args
+
+        cache = self.scrape_cache
+        if pool not in ('thread', 'process'):
+            raise CLIArgError('Unknown pool : ' + str(pool))
+
+        results = None
+        if pool == 'process':
+            import multiprocessing
+
+            try:
+                context = multiprocessing.get_context('fork')
+            except ValueError:
+                context = None
+            if context is not None:
+                _scrape_job_args = (npdoc_commands, cache, scrape_settings)
+                try:
+                    with context.Pool(workers) as p:
+                        specs = p.map(_scrape_job, range(len(npdoc_commands)))
+                finally:
+                    _scrape_job_args = None
+                # memoize specs from the workers, redo the rest here to get
+                # the errors or the unpicklable specs
+                key = _spec_key(scrape_settings)
+                results = []
+                for c, spec in zip(npdoc_commands, specs):
+                    if spec is None:
+                        results.append(_try_spec(c, cache, scrape_settings))
+                    else:
+                        c._specs[key] = spec
+                        results.append((spec, None))
+
+        if results is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(workers) as executor:
+                results = list(executor.map(
+                    lambda c: _try_spec(c, cache, scrape_settings),
+                    npdoc_commands))
+
+        errors = []
+        for spec, error in results:
+            if error is None:
+                continue
+            if not isinstance(error, CLIArgError):
+                raise error
+            errors.append(str(error))
+        if errors:
+            raise CLIArgError('\n'.join(errors))
+
     def _build_subparser(
             self,
             npdoc_command: NumpyDocCommand,
             parent_subparsers: _ap.ArgumentParser,
             scrape_settings: dict,
-            instance: object = None):
+            instance: object = None,
+            lazy: bool = False):
         """
         Build a argparse subparser.
 
@@ -409,6 +1030,11 @@ class NumpyDocCLI():
         instance: object
             If provided, will assign the class instance as the function to be
             called instead of the class itself.
+        lazy : bool, optional
+            Only add an empty placeholder parser named after the command,
+            without scraping it. It is filled in by
+            :py:meth:`_populate_subparser` once needed. Lazy commands get
+            their summary as help. The default is False.
 
         Returns
         -------
@@ -416,19 +1042,62 @@ class NumpyDocCLI():
             Parser object with settings defined by ``npdoc_command``.
 
         """
+        with self._timed('build_subparser', npdoc_command):
+            if lazy:
+                kwargs = {}
+                if isinstance(npdoc_command, LazyNumpyDocCommand):
+                    summary = npdoc_command.summary
+                    if summary is None and self.scrape_cache is not None:
+                        summary = self.scrape_cache.load_summary(
+                            npdoc_command.target)
+                    if summary is not None:
+                        kwargs['help'] = summary
+                return parent_subparsers.add_parser(
+                    _cli_name(npdoc_command, scrape_settings), **kwargs)
+
+            spec = self._command_spec(npdoc_command, scrape_settings)
+            parser_pa, parser_kwa = spec.to_argparse()
+
+            if parent_subparsers:
+                sparser = parent_subparsers.add_parser(
+                    *parser_pa,
+                    **parser_kwa
+                )
+            else:
+                sparser = _Parser(
+                    prog=parser_pa[0],
+                    **parser_kwa
+                )
+            self._add_arguments(sparser, npdoc_command, spec.args, instance)
 
-        parser_ins, arg_ins = npdoc_command.scrape(**scrape_settings)
+            return sparser
 
-        if parent_subparsers:
-            sparser = parent_subparsers.add_parser(
-                *parser_ins.pa,
-                **parser_ins.kwa
-            )
-        else:
-            sparser = _ap.ArgumentParser(
-                prog=parser_ins.pa[0],
-                **parser_ins.kwa
-            )
+    def _add_arguments(
+            self,
+            sparser: _ap.ArgumentParser,
+            npdoc_command: NumpyDocCommand,
+            arg_specs: tuple,
+            instance: object = None):
+        """
+        Add a command's routine and arguments to its parser.
+
+        Parameters
+        ----------
+        sparser : ArgumentParser
+            Parser of the command.
+        npdoc_command : :py:obj`NumpyDocCommand`.
+            Command the parser is for.
+        arg_specs : tuple[:py:obj:`ArgSpec`]
+            Scraped settings of each argument.
+        instance: object
+            If provided, will assign the class instance as the function to be
+            called instead of the class itself.
+
+        Returns
+        -------
+        None.
+
+        """
         if instance is None:
             sparser.set_defaults(__routine__=npdoc_command.obj)
         else:
@@ -443,22 +1112,396 @@ class NumpyDocCLI():
             else:
                 fun = getattr(instance,npdoc_command.fname)
             sparser.set_defaults(__routine__=fun)
-        for a in arg_ins:
+        for a in arg_specs:
+            pa, kwa = a.to_argparse()
             sparser.add_argument(
-                *a.pa,
-                **a.kwa
+                *pa,
+                **kwa
             )
 
-        return sparser
+    def _instance(self, npdoc_command: NumpyDocCommand,
+                  command_instances: tuple) -> object:
+        """Instance passed to build for a command's class, None if none."""
+        match = [i for i in command_instances
+                 if type(i).__name__ == npdoc_command.fname]
+        if len(match) > 1:
+            raise CLIArgError('Instances share same class name, cant resolve : ' + npdoc_command.fname)
+        return match[0] if match else None
+
+    def _drop_parser(self, action: _ap.Action, name: str):
+        """Remove a command's parser, and what's pending below it."""
+        parser = action.choices.pop(name)
+        action._choices_actions = [
+            a for a in action._choices_actions if a.dest != name]
+        todo = [parser]
+        while todo:
+            p = todo.pop()
+            self._pending.pop(p, None)
+            self._indexes.pop(p, None)
+            todo += self._children.pop(p, {}).values()
+
+    def _update_children(
+            self,
+            parser: _ap.ArgumentParser,
+            owner: NumpyDocCommand,
+            npdoc_commands: list,
+            scrape_settings: dict,
+            sort: str,
+            lazy: bool,
+            command_instances: tuple = (),
+            instance: object = None):
+        """
+        Build the parsers of a parser's commands or subcommands.
+
+        Parsers built by an earlier build are kept for commands unchanged
+        since, i.e. with the same object and doc string. Parsers of changed
+        commands are rebuilt, parsers of new ones added and parsers of
+        commands no longer registered removed.
+
+        Parameters
+        ----------
+        parser : ArgumentParser
+            Parser of the program, of a command or of a group.
+        owner : :py:obj`NumpyDocCommand`.
+            Program, command or group ``parser`` is built for.
+        npdoc_commands : list
+            Its commands or subcommands.
+        scrape_settings : dict
+            Additional settings to pass to :py:obj`NumpyDocCommand`.scrape.
+        sort : str, {None, alphabetical}
+            Sort subcommands by key.
+        lazy : bool
+            Add placeholder parsers instead of scraping each command.
+        command_instances : tuple, optional
+            Instances passed to build, for the program's commands.
+        instance: object, optional
+            Instance of the command's class, for its subcommands.
+
+        Returns
+        -------
+        None.
+
+        """
+        is_command = owner is self.entry
+        action = None
+        for a in parser._actions:
+            if isinstance(a, _ap._SubParsersAction):
+                action = a
+        if action is None:
+            if not npdoc_commands:
+                return
+            action = parser.add_subparsers(
+                action=_CommandsAction,
+                help='command help' if is_command else 'subcommand help')
+
+        # sort if asked to
+        if sort == 'alphabetical':
+            cnames = [c.fname for c in npdoc_commands]
+            npdoc_commands = [c for _, _, c in sorted(
+                zip(cnames, cnames, npdoc_commands))]
+
+        old = self._children.get(parser, {})
+        named = {_cli_name(c, scrape_settings): c for c in npdoc_commands}
+        for name in [n for n in old if n not in named]:
+            self._drop_parser(action, name)
+
+        children = {}
+        for name, c in named.items():
+            if is_command:
+                instance = self._instance(c, command_instances)
+            built = self._built.get(c)
+            sp = old.get(name)
+            if sp is not None and built is not None and built[1] is sp:
+                if built[0] == _revision(c):
+                    children[name] = sp
+                    if sp not in self._pending:
+                        self._update_subcommands(
+                            sp, c, scrape_settings, sort, lazy,
+                            instance if is_command else None)
+                    continue
+                # changed since, scrape it again
+                c._forget()
+            if sp is not None:
+                self._drop_parser(action, name)
+
+            # lazy commands aren't imported yet
+            clazy = lazy or (
+                isinstance(c, LazyNumpyDocCommand) and not c.loaded)
+            sp = self._build_subparser(
+                c,
+                action,
+                scrape_settings,
+                instance = instance,
+                lazy = clazy)
+            self._built[c] = (_revision(c), sp)
+            if clazy:
+                self._pending[sp] = (
+                    c, instance, scrape_settings, sort, is_command)
+            else:
+                self._update_subcommands(
+                    sp, c, scrape_settings, sort, False,
+                    instance if is_command else None)
+            children[name] = sp
+
+        # keep argparse's listing in the order of the commands
+        order = {n: i for i, n in enumerate(children)}
+        action._name_parser_map = action.choices = dict(
+            sorted(action.choices.items(), key=lambda kv: order[kv[0]]))
+        action._choices_actions.sort(key=lambda a: order[a.dest])
+        self._children[parser] = children
+        index = self._indexes.get(parser)
+        if index is None:
+            index = self._indexes[parser] = _CommandIndex(children)
+        else:
+            index.update(children)
+        action.index = index
+        if is_command:
+            self.command_parsers = list(children.values())
+        else:
+            self.subcommand_parsers[owner] = list(children.values())
+
+    def _populate_subparser(self, sparser: _ap.ArgumentParser):
+        """
+        Fill in a placeholder parser added by a lazy build.
+
+        Parameters
+        ----------
+        sparser : ArgumentParser
+            Placeholder parser.
+
+        Returns
+        -------
+        None.
+
+        """
+        c, inst, scrape_sets, sort, is_command = self._pending.pop(sparser)
+        if isinstance(c, LazyNumpyDocCommand) and not c.loaded:
+            with self._timed('import', c):
+                c.obj  # first access imports it
+        spec = self._command_spec(c, scrape_sets)
+        if (isinstance(c, LazyNumpyDocCommand)
+                and self.scrape_cache is not None):
+            lines = (c.obj.__doc__ or '').strip().splitlines()
+            self.scrape_cache.store_summary(
+                c.target, lines[0].strip() if lines else '')
+        for k, v in spec.kwargs:
+            setattr(sparser, k, v)
+        self._add_arguments(sparser, c, spec.args, inst)
+        self._built[c] = (_revision(c), sparser)
+        if self._engine is not None:
+            self._engine.forget(sparser)
+        self._update_subcommands(
+            sparser, c, scrape_sets, sort, True, inst if is_command else None)
+
+    def _update_subcommands(
+            self,
+            parser: _ap.ArgumentParser,
+            owner: NumpyDocCommand,
+            scrape_settings: dict,
+            sort: str,
+            lazy: bool,
+            instance: object = None):
+        """
+        Build the parsers of a command's or group's subcommands, if any.
+
+        Parameters
+        ----------
+        parser : ArgumentParser
+            Parser of the command or group.
+        owner : :py:obj`NumpyDocCommand`.
+            Command or group ``parser`` is built for.
+        scrape_settings : dict
+            Additional settings to pass to :py:obj`NumpyDocCommand`.scrape.
+        sort : str, {None, alphabetical}
+            Sort subcommands by key.
+        lazy : bool
+            Add placeholder parsers instead of scraping each subcommand.
+        instance: object, optional
+            Instance of the command's class, None for groups.
+
+        Returns
+        -------
+        None.
+
+        """
+        subs = self._subcommands_of(owner)
+        if subs or parser in self._children:
+            self._update_children(
+                parser, owner, subs, scrape_settings, sort, lazy,
+                instance=instance)
+
+    def _child(self, parser: _ap.ArgumentParser, name: str):
+        """
+        Parser of a command or subcommand named, or by a unique prefix.
+
+        Returns
+        -------
+        ArgumentParser
+            Parser of the command, None if ``name`` doesn't name one and
+            False if ``parser`` has no commands.
+
+        """
+        children = self._children.get(parser)
+        if not children:
+            return False
+        child = children.get(name)
+        if child is None and parser.allow_abbrev:
+            child = children.get(self._indexes[parser].unique(name))
+        return child
+
+    def _walk(self, args: list[str], populate: bool) -> bool:
+        """
+        Follow the commands and subcommands named by a list of arguments,
+        skipping the values of options as argparse does.
+
+        Parameters
+        ----------
+        args : list[str]
+            Arguments about to be parsed.
+        populate : bool
+            Fill in the placeholders named on the way, else stop at the
+            first one.
+
+        Returns
+        -------
+        bool
+            True if the whole tree is needed: no command is named, and the
+            program's help is asked for or an unknown command is named.
+            None if ``populate`` is False and a placeholder is named.
+
+        """
+        parser = self.program_parser
+        program = True
+        wants_help = False
+        i = 0
+        while True:
+            children = self._children.get(parser)
+            if not children:
+                return False
+            # positional values before the commands, None if unknown
+            skip = 0
+            for action in parser._actions:
+                if action.option_strings:
+                    continue
+                if action.nargs == _ap.PARSER:
+                    break
+                if action.nargs is None:
+                    skip += 1
+                elif isinstance(action.nargs, int):
+                    skip += action.nargs
+                else:
+                    skip = None
+                    break
+            child = None
+            unknown = False
+            options = True
+            while i < len(args):
+                a = args[i]
+                i += 1
+                if options and a == '--':
+                    options = False
+                    continue
+                if options and _option_like(a):
+                    action, values = _option_values(parser, args, i - 1)
+                    if program and isinstance(action, _ap._HelpAction):
+                        wants_help = True
+                    i += values
+                    continue
+                if skip:
+                    skip -= 1
+                    continue
+                child = self._child(parser, a)
+                if child is not None:
+                    break
+                if skip is not None:
+                    unknown = True
+                    break
+            if child is None:
+                return program and (wants_help or unknown)
+            if child in self._pending:
+                if not populate:
+                    return None
+                self._populate_subparser(child)
+            parser = child
+            program = False
+
+    def _populate_argv(self, args: list[str]):
+        """
+        Fill in the placeholder parsers named by a list of arguments.
+
+        Every placeholder other than those of lazy commands is filled in
+        when the program's help is asked for or an unknown command is
+        named, so they have the whole tree to work with.
+
+        Parameters
+        ----------
+        args : list[str]
+            Arguments about to be parsed.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self._walk(args, True):
+            self._populate_all()
+
+    def _needs_populate(self, args: list[str]) -> bool:
+        """True if :py:meth:`_populate_argv` would fill in a placeholder."""
+        if not self._pending:
+            return False
+        whole = self._walk(args, False)
+        return whole is None or bool(whole) and any(
+            not isinstance(c, LazyNumpyDocCommand)
+            for c, *_ in self._pending.values())
+
+    def _populate_all(self, lazy_commands: bool = False):
+        """
+        Fill in every placeholder parser.
+
+        Parameters
+        ----------
+        lazy_commands : bool, optional
+            Also import and fill in lazy commands. The default is False.
+
+        Returns
+        -------
+        None.
+
+        """
+        while True:
+            pending = [
+                p for p, (c, *_) in self._pending.items()
+                if lazy_commands or not isinstance(c, LazyNumpyDocCommand)]
+            if not pending:
+                break
+            for p in pending:
+                self._populate_subparser(p)
 
     def build(self,
               *command_instances: object,
               replace_underscores: bool = True,
-              sort: str = 'None'
+              sort: str = 'None',
+              cache: bool | str = False,
+              lazy: bool = False,
+              doc_parser: str = 'numpydoc',
+              workers: int = None,
+              pool: str = 'thread',
+              profile: bool | str = False,
+              shell: bool = False,
+              batch: bool = False,
+              help_cache: bool | str = False,
+              memo_size: int = 0,
+              engine: str = 'argparse'
               ):
         """
         Build a CLI.
 
+        Building again with the same program, settings and instances
+        updates the parsers of the last build in place. Only commands and
+        subcommands registered since are added, those whose object or doc
+        string changed rebuilt, and those no longer registered removed.
+
         Parameters
         ----------
         *instances : object
@@ -470,75 +1513,288 @@ class NumpyDocCLI():
             The default is True.
         sort : str, {None, alphabetical}
             Sort commands and subcommands by key.
+        cache : bool or str, optional
+            Cache scraped doc strings on disk between runs. If a str, the
+            directory to store the cache in, otherwise the user cache
+            directory is used. The default is False.
+        lazy : bool, optional
+            Only add placeholders for commands and subcommands, and scrape
+            the ones named on the command line when parsing arguments.
+            The default is False.
+        doc_parser : str, {numpydoc, fast}
+            Parser for doc strings. ``fast`` only reads the summary and
+            parameters, falling back on numpydoc for unusual doc strings.
+            The default is numpydoc.
+        workers : int, optional
+            Scrape commands concurrently with this many workers before
+            building their parsers, and report doc string errors of all
+            commands together. Not used by lazy builds. The default is None.
+        pool : str, {thread, process}
+            Pool of ``workers`` to scrape with. ``process`` forks workers
+            where available. The default is thread.
+        profile : bool or str, optional
+            Time importing lazy commands, scraping, building parsers,
+            parsing and dispatching, and report the timings slowest first
+            when the program exits. True reports to stderr, ``json`` reports
+            as JSON to stderr and other strs are files to write the report
+            to, as JSON if ending with ``.json``. If False, the
+            ``NPDOC_CLI_PROFILE`` environment variable is used the same way.
+            The default is False.
+        shell : bool, optional
+            Add a ``--shell`` flag to the program, dispatched to
+            :py:meth:`NumpyDocCLI.repl`. The default is False.
+        batch : bool, optional
+            Add ``--batch FILE`` and ``--batch-jobs N`` options to the
+            program, dispatched to :py:meth:`NumpyDocCLI.run_batch`. The
+            failures are reported to stderr and the program exits with the
+            combined status. The default is False.
+        help_cache : bool or str, optional
+            Cache the formatted help of the program and of each command and
+            subcommand on disk, next to a digest of the doc strings and
+            signatures it was rendered from. Arguments made of command
+            names followed by ``-h`` or ``--help``, and
+            :py:meth:`NumpyDocCLI.print_help`, are then served from the
+            cache without scraping, importing lazy commands or formatting.
+            Most useful with ``lazy``. If a str, the directory to store the
+            cache in, otherwise the user cache directory is used. The
+            default is False.
+        memo_size : int, optional
+            Keep the converted arguments of this many argument lists given
+            to :py:meth:`NumpyDocCLI.invoke`, least recently used first
+            out, so invoking them again skips parsing. Argument lists
+            parsed by streamed, numpy array or other custom converters are
+            never kept, and building again starts over. The default is 0,
+            which keeps none.
+        engine : str, {argparse, fast}
+            Parser of the arguments. ``fast`` looks flags and command names
+            up directly and calls the parsers' own actions, and hands
+            anything else, e.g. help, errors and abbreviated flags, to
+            argparse. The default is argparse.
 
         Returns
         -------
         None.
 
         """
+        with self._lock.write():
+            self._build(
+                command_instances, replace_underscores, sort, cache, lazy,
+                doc_parser, workers, pool, profile, shell, batch, help_cache,
+                memo_size, engine)
+
+    def _build(self, command_instances, replace_underscores, sort, cache,
+               lazy, doc_parser, workers, pool, profile, shell, batch,
+               help_cache, memo_size, engine):
+        """Body of :py:meth:`NumpyDocCLI.build`, holding the lock alone."""
+        if engine not in ('argparse', 'fast'):
+            raise CLIArgError('Unknown engine : ' + str(engine))
+        start = _time.perf_counter()
+        output = _profile_destination(profile)
+        if output is None:
+            self.profiler = None
+        elif self.profiler is None or self.profiler.output != output:
+            self.profiler = Profiler(output)
+
         scrape_sets = dict(
-            replace_underscores=replace_underscores
+            replace_underscores=replace_underscores,
+            doc_parser=doc_parser
         )
+        if cache is True:
+            self.scrape_cache = ScrapeCache()
+        elif cache:
+            self.scrape_cache = ScrapeCache(cache)
+        else:
+            self.scrape_cache = None
+        if help_cache is True:
+            self.help_cache = ScrapeCache()
+        elif help_cache:
+            self.help_cache = ScrapeCache(help_cache)
+        else:
+            self.help_cache = None
+        self._help_settings = dict(
+            scrape_sets, sort=sort, lazy=lazy, shell=shell, batch=batch)
+        self._memo = None
+        if memo_size:
+            from npdoc_cli._invoke import Memo
+
+            self._memo = Memo(memo_size)
+        self._engine = None
+        if engine == 'fast':
+            from npdoc_cli._engine import Engine
+
+            self._engine = Engine(self)
+
+        # settings every parser depends on, an earlier build is updated
+        # in place if they and the program are unchanged
+        state = (_spec_key(scrape_sets), sort, lazy, shell, batch)
+        built = self._built.get(self.entry)
+        incremental = (
+            self.program_parser is not None
+            and built is not None
+            and built[1] is self.program_parser
+            and built[0] == _revision(self.entry)
+            and self._build_state is not None
+            and self._build_state[0] == state
+            and len(self._build_state[1]) == len(command_instances)
+            and all(a is b for a, b in zip(
+                self._build_state[1], command_instances)))
+
+        if not incremental:
+            for c, (revision, _) in self._built.items():
+                if revision != _revision(c):
+                    c._forget()
+            self._built = {}
+            self._pending = {}
+            self._children = {}
+            self._indexes = {}
+            self.command_parsers = []
+            self.subcommand_parsers = {}
+
+        if workers and not lazy:
+            scrape = [] if incremental else [self.entry]
+            for c in self.commands:
+                if isinstance(c, LazyNumpyDocCommand) and not c.loaded:
+                    continue
+                for s in [c] + self._descendants(c):
+                    if (s not in self._built
+                            or self._built[s][0] != _revision(s)):
+                        scrape.append(s)
+            with self._timed('scrape_all', '{} commands, {} {} workers'.format(
+                    len(scrape), workers, pool)):
+                self._scrape_all(scrape, scrape_sets, workers, pool)
+
+        if incremental:
+            program = self.program_parser
+        else:
+            program = self._build_subparser(
+                self.entry,
+                None,
+                scrape_sets
+            )
+            self._built[self.entry] = (_revision(self.entry), program)
+
+        if shell and not incremental:
+            program.add_argument(
+                '--shell',
+                action='store_true',
+                dest='__shell__',
+                help='read and run commands interactively')
+        if batch and not incremental:
+            program.add_argument(
+                '--batch',
+                metavar='FILE',
+                dest='__batch__',
+                help='run each command line of FILE, - for stdin')
+            program.add_argument(
+                '--batch-jobs',
+                metavar='N',
+                type=int,
+                default=1,
+                dest='__batch_jobs__',
+                help='number of worker processes running the batch')
+
+        if sort == 'alphabetical':
+            cnames = [c.fname for c in self.commands]
+            self.commands = [c for _, _, c in sorted(
+                zip(cnames, cnames, self.commands))]
+        self._update_children(
+            program, self.entry, self.commands, scrape_sets, sort, lazy,
+            command_instances=command_instances)
+
+        # forget commands no longer registered
+        registered = {self.entry}
+        for c in self.commands:
+            registered.add(c)
+            registered.update(self._descendants(c))
+        self._built = {
+            c: b for c, b in self._built.items() if c in registered}
+        self._build_state = (state, command_instances)
+        self.program_parser = program
+        if self.profiler is not None:
+            self.profiler.record(
+                'build', _profile_name(self.entry),
+                _time.perf_counter() - start)
+
+    def compile(self,
+                path: str = None,
+                replace_underscores: bool = True,
+                sort: str = 'None'
+                ) -> str:
+        """
+        Compile the CLI into a static parser module.
 
-        program = self._build_subparser(
-            self.entry,
-            None,
-            scrape_sets
-        )
+        The generated module rebuilds the same parser tree as
+        :py:meth:`NumpyDocCLI.build` with literal argparse calls, and
+        references routines by their import path. Run it, or call its
+        ``main`` function, without needing numpydoc at runtime.
 
-        commands = []
-        subcommands = {}
+        Parameters
+        ----------
+        path : str, optional
+            File to write the module to. If None, it is only returned.
+        replace_underscores : bool, optional
+            Repace underscores in argument/command names with dashes.
+            The default is True.
+        sort : str, {None, alphabetical}
+            Sort commands and subcommands by key.
 
-        if self.commands:
-            program_subparsers = program.add_subparsers(help='command help')
-            if sort == 'alphabetical':
-                cnames = [c.fname for c in self.commands]
-                self.commands = [c for _, _, c in sorted(
-                    zip(cnames, cnames, self.commands))]
+        Raises
+        ------
+        CLIArgError
+            If a routine, type or default can't be written as source.
 
-            for c in self.commands:
-                # check that this isn't an instance
-                inst = None
-                match = [i for i in command_instances if type(i).__name__ == c.fname]
-                if len(match) > 1:
-                    raise CLIArgError('Instances share same class name, cant resolve : ' + c.fname)
-                if match:
-                    inst = match[0]
-
-
-                # add sparser for program
-                cparser = self._build_subparser(
-                    c,
-                    program_subparsers,
-                    scrape_sets,
-                    instance = inst)
-
-                subs = None
-                if c.fname in self.subcommands:
-                    subs = self.subcommands[c.fname]
-                if subs:
-                    # add subparser for subcommands
-                    subcommands[c] = []
-                    command_subparsers = cparser.add_subparsers(
-                        help='subcommand help')
-                    # sort if asked to
-                    if sort == 'alphabetical':
-                        cnames = [c.fname for c in subs]
-                        subs = [c for _, _, c in sorted(
-                            zip(cnames, cnames, subs))]
-
-                    # build parser for each subcommand
-                    for s in subs:
-                        sc = self._build_subparser(
-                            s,
-                            command_subparsers,
-                            scrape_sets,
-                            instance = inst)
-                        subcommands[c].append(sc)
+        Returns
+        -------
+        str
+            Source of the generated module.
 
-        self.program_parser = program
-        self.command_parsers = commands
-        self.subcommand_parsers = subcommands
+        """
+        return _compile_cli(
+            self,
+            path,
+            replace_underscores=replace_underscores,
+            sort=sort)
+
+    def completion(
+            self,
+            shell: str = 'bash',
+            path: str = None,
+            prog: str = None) -> str:
+        """
+        Generate a static shell completion script for the built CLI.
+
+        The script completes commands, subcommands, flags and choices
+        without starting python. Every parser is filled in to write it,
+        importing lazy commands, so generate it at install time rather
+        than at startup.
+
+        Parameters
+        ----------
+        shell : str, {bash, zsh, fish}
+            Shell the script is for. The default is bash.
+        path : str, optional
+            File to write the script to. If None, it is only returned.
+        prog : str, optional
+            Command the script completes. The default is the program name.
+
+        Raises
+        ------
+        CLIArgError
+            If the shell is unknown.
+
+        Returns
+        -------
+        str
+            The completion script.
+
+        """
+        from npdoc_cli._completion import completion_script
+
+        script = completion_script(self, shell, prog)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(script)
+        return script
 
     def parse_args(self, args: list[str] = None) -> _ap.Namespace:
         """
@@ -557,23 +1813,258 @@ class NumpyDocCLI():
             Parsed arguments.
 
         """
+        argv = _sys.argv[1:] if args is None else args
+        with self._timed('parse_args', ' '.join(argv)):
+            if self.help_cache is not None:
+                from npdoc_cli._help import serve_help
+
+                serve_help(self, argv)
+            if self._pending:
+                self._populate_argv(argv)
+            return self._parse_argv(argv)
+
+    def _parse_argv(self, args: list[str]) -> _ap.Namespace:
+        """Parse arguments with the engine built with, once populated."""
+        if self._engine is not None:
+            return self._engine.parse_args(args)
         return self.program_parser.parse_args(args)
 
+    def call(self, args: list[str]) -> Outcome:
+        """
+        Parse and dispatch arguments, returning what happened as a value.
+
+        Unlike :py:meth:`NumpyDocCLI.parse_args` and
+        :py:meth:`NumpyDocCLI.dispatch`, safe to use from many threads at
+        once and from routines. Nothing is printed or exited: parse errors,
+        help and exceptions raised by the routine are returned. Each call
+        parses against the parser tree as it was when parsing started;
+        :py:meth:`NumpyDocCLI.build` waits for calls parsing, and calls
+        wait for a build, while routines keep running during a build.
+
+        Parameters
+        ----------
+        args : list[str]
+            Arguments to parse.
+
+        Returns
+        -------
+        :py:obj:`Outcome`
+            Value returned by the routine, exception raised, None if none,
+            exit status, 2 for parse errors and 1 for exceptions, and the
+            help or usage error argparse would have printed.
+
+        """
+        from npdoc_cli._invoke import call
+
+        return call(self, args)
+
+    def invoke(self, args: list[str] | str) -> object:
+        """
+        Parse and dispatch arguments, returning the routine's value.
+
+        Like :py:meth:`NumpyDocCLI.dispatch` of
+        :py:meth:`NumpyDocCLI.parse_args`, but safe to use from many
+        threads at once as :py:meth:`NumpyDocCLI.call` is, and served from
+        the memo of converted arguments when built with ``memo_size``.
+
+        Parameters
+        ----------
+        args : list[str] or str
+            Arguments to parse, or a command line split like a shell does.
+
+        Raises
+        ------
+        SystemExit
+            If the arguments can't be parsed or ask for help, which is
+            printed as parse_args does.
+
+        Returns
+        -------
+        any
+            Output of dispatched function.
+
+        """
+        from npdoc_cli._invoke import invoke
+
+        return invoke(self, args)
+
+    def repl(self, prompt: str = None, history: str = None):
+        """
+        Run commands interactively with the built CLI.
+
+        Each line read is split like a shell command line, parsed and
+        dispatched in this process, reusing the parsers and command
+        instances of the last build. Parse errors and exceptions raised by
+        commands are reported without leaving the shell. Ends at end of
+        input, or with ``exit`` or ``quit``. Where readline is available,
+        lines are kept in a history and tab completes commands, options and
+        choices.
+
+        Parameters
+        ----------
+        prompt : str, optional
+            Prompt of each line. The default is the program name and ``>``.
+        history : str, optional
+            File to load the line history from and save it to. The default
+            is None, which keeps no history between sessions.
+
+        Returns
+        -------
+        None.
+
+        """
+        from npdoc_cli._shell import repl
+
+        repl(self, prompt, history)
+
+    def run_batch(
+            self,
+            source,
+            jobs: int = 1,
+            recycle: int = None,
+            chunksize: int = 1):
+        """
+        Parse and dispatch many command lines with the built CLI.
+
+        Lines are read one at a time and split like a shell command line.
+        Each is parsed and dispatched in this process, or in a pool of
+        ``jobs`` forked workers sharing the parsers built here, which are
+        sent a few chunks of lines ahead of the results read. Lines of the
+        chunk a worker was running when it died fail, and a new worker
+        takes its place. Where processes can't be forked, lines are run in
+        this process.
+
+        Parameters
+        ----------
+        source : str, path or iterable
+            File with one command line per line, ``-`` for stdin, or an
+            iterable of lines or of argument lists. Blank lines and lines
+            starting with ``#`` are skipped.
+        jobs : int, optional
+            Number of worker processes. The default is 1, which runs lines
+            in this process.
+        recycle : int, optional
+            Replace each worker after it ran this many chunks of lines. The
+            default is None, which keeps workers for the whole batch.
+        chunksize : int, optional
+            Lines sent to a worker at a time. The default is 1.
+
+        Returns
+        -------
+        :py:obj:`BatchResult`
+            Number of lines run, failed lines and combined exit status.
+
+        """
+        from npdoc_cli._batch import run_batch
+
+        return run_batch(self, source, jobs, recycle, chunksize)
+
+    def serve(self, path: str, backlog: int = 64):
+        """
+        Serve invocations of the built CLI as a fork server.
+
+        Every parser is filled in and every lazy command imported, then
+        the server listens on a Unix socket until interrupted. Clients,
+        e.g. ``python -m npdoc_zygote PATH ARGS...``, send their
+        arguments, environment, working directory and stdio. A forked
+        child parses and dispatches the arguments on the client's behalf
+        and sends back the exit status, so each invocation starts at the
+        cost of a fork instead of an interpreter start and a build.
+
+        Only available where ``os.fork`` and Unix sockets are.
+
+        Parameters
+        ----------
+        path : str
+            Socket file to listen on, replaced if it exists.
+        backlog : int, optional
+            Connections waiting to be accepted. The default is 64.
+
+        Returns
+        -------
+        None.
+
+        """
+        from npdoc_cli._zygote import serve
+
+        serve(self, path, backlog)
+
     def print_help(self):
         """
         Print help string for CLI
 
+        Served from :py:attr:`help_cache` when the CLI was built with one.
+
         Returns
         -------
         None.
 
         """
+        if self.help_cache is not None:
+            from npdoc_cli._help import help_text
+
+            text = help_text(self, [])
+            if text is not None:
+                _sys.stdout.write(text)
+                return
         self.program_parser.print_help()
 
     def dispatch(self, args: _ap.Namespace):
         """
         Dispatch command line arguments to a the right function.
 
+        Async routines, i.e. coroutine functions and async generators, are
+        run to completion on an event loop kept for the calling thread,
+        using uvloop if it's installed and :py:attr:`uvloop` is set. The
+        items of async generators are returned as a list.
+
+        Parameters
+        ----------
+        args : _ap.Namespace
+            Output of :py:meth:`NumpyDocCLI.parse_args`.
+
+        Returns
+        -------
+        any
+            Output of dispatched function.
+
+        """
+        return self._run(dict(vars(args)))
+
+    def _run(self, a: dict):
+        """Dispatch parsed arguments, as a dict it may change."""
+        routine = a.pop('__routine__')
+        if a.pop('__shell__', False):
+            return self.repl()
+        batch = a.pop('__batch__', None)
+        jobs = a.pop('__batch_jobs__', 1)
+        if batch is not None:
+            result = self.run_batch(batch, jobs=jobs)
+            if result.failures:
+                _sys.stderr.write(result.report())
+            if result.status:
+                raise SystemExit(result.status)
+            return result
+        with self._timed('dispatch', routine):
+            out = routine(**a)
+            if _is_async(out):
+                if self._runners is None:
+                    from npdoc_cli._async import Runners
+
+                    with self._lock.write():
+                        if self._runners is None:
+                            self._runners = Runners(self.uvloop)
+                out = self._runners.run(out)
+        return out
+
+    async def dispatch_async(self, args: _ap.Namespace):
+        """
+        Dispatch command line arguments from a running event loop.
+
+        Async routines are awaited on the running loop, and the items of
+        async generators returned as a list. Other routines are called
+        directly.
+
         Parameters
         ----------
         args : _ap.Namespace
@@ -585,9 +2076,15 @@ class NumpyDocCLI():
             Output of dispatched function.
 
         """
-        a = vars(args)
+        a = dict(vars(args))
         routine = a.pop('__routine__')
-        return routine(**a)
+        for k in ('__shell__', '__batch__', '__batch_jobs__'):
+            a.pop(k, None)
+        with self._timed('dispatch', routine):
+            out = routine(**a)
+            if _is_async(out):
+                out = await _resolve(out)
+        return out
 
 
 cli = NumpyDocCLI()
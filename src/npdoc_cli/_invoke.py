@@ -0,0 +1,332 @@
+"""
+Reentrant, thread safe invocation of a built CLI.
+
+Parsing holds a read lock on the parser tree, and building or filling in
+placeholder parsers holds it alone, so every call parses against a
+consistent tree while other threads rebuild it. Output argparse would
+print, help and usage errors, is captured for the calling thread only.
+
+Arguments invoked again and again can skip argparse altogether: a bounded
+LRU keeps the converted arguments of each argument list, as long as every
+parser involved converts tokens to values deterministically.
+"""
+import argparse as _ap
+import threading as _threading
+from collections import OrderedDict as _OrderedDict
+from collections import namedtuple as _namedtuple
+from contextlib import contextmanager as _contextmanager
+from npdoc_cli._index import CommandsAction as _CommandsAction
+
+Outcome = _namedtuple('Outcome', ['value', 'error', 'status', 'output'])
+"""
+Outcome of :py:meth:`NumpyDocCLI.call`: value returned by the routine, the
+exception raised parsing or running it, None if none, exit status and text
+argparse would have printed.
+"""
+
+_local = _threading.local()
+# output captured and parsers parsing in each thread, None when not
+
+
+class Parser(_ap.ArgumentParser):
+    """
+    ArgumentParser printing to the calling thread's capture, if any,
+    recording the parsers used by the calling thread's parse and resolving
+    abbreviated command names.
+    """
+
+    def _print_message(self, message, file=None):
+        output = getattr(_local, 'output', None)
+        if output is None:
+            return super()._print_message(message, file)
+        if message:
+            output.append(message)
+
+    def parse_known_args(self, args=None, namespace=None):
+        record(self)
+        return super().parse_known_args(args, namespace)
+
+    def _get_values(self, action, arg_strings):
+        if isinstance(action, _CommandsAction) and arg_strings:
+            arg_strings = [action.lookup(arg_strings[0], self.allow_abbrev)
+                           ] + arg_strings[1:]
+        return super()._get_values(action, arg_strings)
+
+
+@_contextmanager
+def capture():
+    """Capture the output of :py:class:`Parser` in this thread, as a list."""
+    previous = getattr(_local, 'output', None)
+    _local.output = output = []
+    try:
+        yield output
+    finally:
+        _local.output = previous
+
+
+def record(parser: _ap.ArgumentParser):
+    """Record a parser parsing in this thread, if tracking."""
+    parsers = getattr(_local, 'parsers', None)
+    if parsers is not None:
+        parsers.append(parser)
+
+
+@_contextmanager
+def track():
+    """Record the :py:class:`Parser` parsing in this thread, as a list."""
+    previous = getattr(_local, 'parsers', None)
+    _local.parsers = parsers = []
+    try:
+        yield parsers
+    finally:
+        _local.parsers = previous
+
+
+class ReadWriteLock():
+    """
+    Lock held by any number of readers, or by one writer.
+
+    Waiting writers go first, so readers can't starve a rebuild. Not
+    reentrant: a thread holding it must not acquire it again.
+    """
+
+    def __init__(self):
+        self._cond = _threading.Condition(_threading.Lock())
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    @_contextmanager
+    def read(self):
+        """Hold the lock shared for a block."""
+        with self._cond:
+            while self._writing or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @_contextmanager
+    def write(self):
+        """Hold the lock alone for a block."""
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writing or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+
+def _status(e: SystemExit) -> int:
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+    return 1
+
+
+def parse(cli, argv: list) -> _ap.Namespace:
+    """
+    Parse arguments against a consistent parser tree.
+
+    Placeholders on the way are filled in holding the lock alone first.
+
+    Parameters
+    ----------
+    cli : :py:obj:`NumpyDocCLI`
+        Built CLI.
+    argv : list[str]
+        Arguments to parse.
+
+    Returns
+    -------
+    argparse.Namespace
+        Parsed arguments.
+
+    """
+    while True:
+        with cli._lock.read():
+            if not cli._needs_populate(argv):
+                return cli._parse_argv(argv)
+        with cli._lock.write():
+            cli._populate_argv(argv)
+
+
+def call(cli, argv: list) -> Outcome:
+    """
+    Parse and dispatch arguments, see :py:meth:`NumpyDocCLI.call`.
+    """
+    with capture() as output:
+        try:
+            args = parse(cli, list(argv))
+        except SystemExit as e:
+            status = _status(e)
+            error = None if status == 0 else e
+            return Outcome(None, error, status, ''.join(output))
+    try:
+        value = cli._run(vars(args))
+    except SystemExit as e:
+        status = _status(e)
+        return Outcome(None, None if status == 0 else e, status, '')
+    except Exception as e:
+        return Outcome(None, e, 1, '')
+    return Outcome(value, None, 0, '')
+
+
+DETERMINISTIC_TYPES = (None, str, int, float, complex, bool)
+"""Converters always giving equal values for equal tokens."""
+
+_DETERMINISTIC_ACTIONS = {
+    _ap._StoreAction, _ap._StoreConstAction, _ap._StoreTrueAction,
+    _ap._StoreFalseAction, _ap._AppendAction, _ap._AppendConstAction,
+    _ap._ExtendAction, _ap._CountAction, _ap._HelpAction,
+    _ap._VersionAction, _ap._SubParsersAction, _ap.BooleanOptionalAction,
+    _CommandsAction,
+}
+
+
+def deterministic(parser: _ap.ArgumentParser) -> bool:
+    """
+    Whether a parser always converts equal tokens to equal values.
+
+    Streamed and numpy array arguments read files, and other converters
+    may do anything, so only arguments converted by
+    :py:obj:`DETERMINISTIC_TYPES` with argparse's actions or
+    :py:class:`ArrayAction` are.
+
+    Parameters
+    ----------
+    parser : ArgumentParser
+        Parser of the program, a command or a subcommand.
+
+    Returns
+    -------
+    bool
+        True if its own arguments are deterministic.
+
+    """
+    from npdoc_cli._array import ArrayAction
+
+    for a in parser._actions:
+        if type(a) not in _DETERMINISTIC_ACTIONS and type(a) is not ArrayAction:
+            return False
+        if a.type not in DETERMINISTIC_TYPES:
+            return False
+    return True
+
+
+def _fresh(arguments: dict) -> dict:
+    """Copy of memoized arguments a routine can change freely."""
+    import array
+
+    fresh = {}
+    for k, v in arguments.items():
+        if type(v) is list:
+            v = list(v)
+        elif type(v) is array.array:
+            v = v[:]
+        fresh[k] = v
+    return fresh
+
+
+class Memo():
+    """
+    Bounded LRU of the converted arguments of argument lists.
+
+    Shared by threads. A CLI gets a new one each build, so arguments
+    parsed by earlier parsers are never served.
+    """
+
+    def __init__(self, size: int):
+        """
+        Initialize a :py:obj:`Memo`.
+
+        Parameters
+        ----------
+        size : int
+            Most argument lists kept.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.size = size
+        """Most argument lists kept."""
+        self._entries = _OrderedDict()
+        self._deterministic = {}
+        self._lock = _threading.Lock()
+
+    def get(self, argv: tuple) -> dict:
+        """Copy of the arguments of ``argv``, None if not kept."""
+        with self._lock:
+            arguments = self._entries.get(argv)
+            if arguments is None:
+                return None
+            self._entries.move_to_end(argv)
+        return _fresh(arguments)
+
+    def put(self, argv: tuple, arguments: dict, parsers: list):
+        """
+        Keep the arguments of ``argv``, if ``parsers`` are deterministic.
+
+        Parameters
+        ----------
+        argv : tuple[str]
+            Arguments parsed.
+        arguments : dict
+            Parsed arguments, as given by ``vars`` of the namespace.
+        parsers : list[ArgumentParser]
+            Parsers that parsed ``argv``.
+
+        Returns
+        -------
+        None.
+
+        """
+        for p in parsers:
+            ok = self._deterministic.get(p)
+            if ok is None:
+                ok = self._deterministic[p] = deterministic(p)
+            if not ok:
+                return
+        arguments = _fresh(arguments)
+        with self._lock:
+            self._entries[argv] = arguments
+            self._entries.move_to_end(argv)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+def invoke(cli, args) -> object:
+    """
+    Parse, dispatch and return the routine's value.
+
+    See :py:meth:`NumpyDocCLI.invoke`.
+    """
+    if isinstance(args, str):
+        import shlex
+
+        args = shlex.split(args)
+    argv = tuple(args)
+    memo = cli._memo
+    if memo is not None:
+        arguments = memo.get(argv)
+        if arguments is not None:
+            return cli._run(arguments)
+    with track() as parsers:
+        arguments = vars(parse(cli, list(argv)))
+    if memo is not None:
+        memo.put(argv, arguments, parsers)
+    return cli._run(dict(arguments))
@@ -0,0 +1,133 @@
+"""
+NumPy array arguments, inline or memory mapped from files.
+
+Only used for parameters annotated with ``numpy.ndarray`` or
+``numpy.typing.NDArray[dtype]``, so numpy is already imported by the module
+defining the command whenever it is needed here.
+"""
+import argparse as _ap
+import os as _os
+import sys as _sys
+
+
+def ndarray_dtype(annotation: object) -> tuple:
+    """
+    Whether an annotation is a numpy array, and its dtype.
+
+    Parameters
+    ----------
+    annotation : object
+        Annotation of a parameter.
+
+    Returns
+    -------
+    tuple
+        True if ``annotation`` is ``numpy.ndarray`` or ``NDArray[dtype]``,
+        and the scalar type of its dtype, None if not given.
+
+    """
+    np = _sys.modules.get('numpy')
+    if np is None:
+        return False, None
+    import typing
+
+    if annotation is np.ndarray:
+        return True, None
+    if typing.get_origin(annotation) is not np.ndarray:
+        return False, None
+    args = typing.get_args(annotation)
+    if len(args) < 2:
+        return True, None
+    scalar = typing.get_args(args[1])
+    if not scalar or scalar[0] is typing.Any:
+        return True, None
+    return True, scalar[0]
+
+
+def _file(token: str) -> tuple:
+    """Path of a file argument and npz key, None if not a file."""
+    if _os.path.isfile(token):
+        return token, None
+    path, _, key = token.rpartition(':')
+    if path.endswith('.npz') and _os.path.isfile(path):
+        return path, key
+    return None, None
+
+
+def load(values: list, dtype: object = None):
+    """
+    Array of an argument's values.
+
+    Parameters
+    ----------
+    values : list[str]
+        Values given on the command line. A single path is loaded: ``.npy``
+        files are memory mapped read only, arrays of ``.npz`` files are
+        loaded, as ``path.npz:name`` if it holds more than one, and other
+        files are memory mapped as raw binary of ``dtype``. Otherwise the
+        values, split on commas and whitespace, are the items.
+    dtype : numpy scalar type, optional
+        dtype of the array. Files must already hold it. The default is
+        None, which means float64 for inline values and raw files.
+
+    Raises
+    ------
+    ValueError
+        If the values can't be converted, or a file doesn't hold ``dtype``.
+
+    Returns
+    -------
+    numpy.ndarray
+        The array, a read only memory map for ``.npy`` and raw files.
+
+    """
+    import numpy as np
+
+    path = key = None
+    if len(values) == 1:
+        path, key = _file(values[0])
+    if path is None:
+        items = ' '.join(values).replace(',', ' ').split()
+        return np.asarray(items).astype(
+            np.float64 if dtype is None else dtype)
+
+    if path.endswith('.npz'):
+        with np.load(path) as archive:
+            if key is None:
+                if len(archive.files) != 1:
+                    raise ValueError(
+                        '{} holds {}, name one as {}:name'.format(
+                            path, ', '.join(archive.files), path))
+                key = archive.files[0]
+            if key not in archive.files:
+                raise ValueError('{} has no array {}'.format(path, key))
+            array = archive[key]
+    elif path.endswith('.npy'):
+        array = np.load(path, mmap_mode='r')
+    else:
+        array = np.memmap(path, dtype=np.float64 if dtype is None else dtype,
+                          mode='r')
+    if dtype is not None and array.dtype != np.dtype(dtype):
+        raise ValueError('{} holds {}, expected {}'.format(
+            path, array.dtype, np.dtype(dtype)))
+    return array
+
+
+class NDArrayAction(_ap.Action):
+    """
+    Store a numpy array loaded by :py:func:`load`.
+    """
+
+    def __init__(self, option_strings, dest, dtype=None, **kwargs):
+        kwargs.setdefault('nargs', '+')
+        super().__init__(option_strings, dest, **kwargs)
+        self.dtype = dtype
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        try:
+            array = load(list(values), self.dtype)
+        except (ValueError, OSError) as e:
+            parser.error('argument {}: {}'.format(
+                '/'.join(self.option_strings) or self.metavar or self.dest,
+                e))
+        setattr(namespace, self.dest, array)
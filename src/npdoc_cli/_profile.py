@@ -0,0 +1,201 @@
+"""
+Timing of the phases of building and running a CLI.
+
+Enabled with ``NumpyDocCLI.build(profile=...)`` or the ``NPDOC_CLI_PROFILE``
+environment variable, see :py:func:`destination`.
+"""
+import atexit as _atexit
+import os as _os
+import sys as _sys
+import time as _time
+
+ENV_VAR = 'NPDOC_CLI_PROFILE'
+"""Environment variable enabling the profiler when build isn't told to."""
+
+
+def destination(profile: bool | str) -> str:
+    """
+    Where a profile report goes, from a ``profile`` setting.
+
+    Parameters
+    ----------
+    profile : bool or str
+        False or an empty str disables profiling, falling back on the
+        ``NPDOC_CLI_PROFILE`` environment variable. True, ``1`` or
+        ``stderr`` report as text to stderr, ``json`` as JSON to stderr.
+        Any other str is a file to write the report to, as JSON if it ends
+        with ``.json`` and as text otherwise.
+
+    Returns
+    -------
+    str
+        ``stderr``, ``json`` or a file path. None if not profiling.
+
+    """
+    if not profile:
+        profile = _os.environ.get(ENV_VAR, '')
+    if profile is True:
+        return 'stderr'
+    if profile.lower() in ('', '0', 'false'):
+        return None
+    if profile.lower() in ('1', 'true', 'stderr'):
+        return 'stderr'
+    return profile
+
+
+class _NullTimer():
+    """Timer doing nothing, used when not profiling."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class _Timer():
+
+    def __init__(self, profiler, phase: str, name: str):
+        self.profiler = profiler
+        self.phase = phase
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = _time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(
+            self.phase, self.name, _time.perf_counter() - self.start)
+        return False
+
+
+class Profiler():
+    """
+    Record of how long each phase of a CLI took.
+
+    Times are inclusive, e.g. a ``build_subparser`` time includes the
+    ``scrape`` of the same command and ``parse_args`` includes the
+    parsers a lazy build fills in. The report is written when the program
+    exits, or when :py:meth:`Profiler.write` is called.
+    """
+
+    def __init__(self, output: str = 'stderr'):
+        """
+        Initialize a :py:obj:`Profiler`.
+
+        Parameters
+        ----------
+        output : str, optional
+            Where the report goes, see :py:func:`destination`.
+            The default is stderr.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.output = output
+        """Where the report goes."""
+        self.records = []
+        """List of (phase, name, seconds) in the order they were timed."""
+        self._written = True
+
+    def time(self, phase: str, name: str) -> _Timer:
+        """
+        Context manager timing its block.
+
+        Parameters
+        ----------
+        phase : str
+            Phase being timed, e.g. ``scrape``.
+        name : str
+            What the phase is run on, e.g. the command's qualified name.
+
+        Returns
+        -------
+        context manager
+            Records the time spent in its block on exit.
+
+        """
+        return _Timer(self, phase, name)
+
+    def record(self, phase: str, name: str, seconds: float):
+        """Add a timing to the report."""
+        if self._written:
+            self._written = False
+            _atexit.register(self.write)
+        self.records.append((phase, name, seconds))
+
+    def totals(self) -> dict:
+        """Total seconds of each phase, slowest first."""
+        totals = {}
+        for phase, _, seconds in self.records:
+            totals[phase] = totals.get(phase, 0.) + seconds
+        return dict(sorted(totals.items(), key=lambda t: -t[1]))
+
+    def to_dict(self) -> dict:
+        """Report as a JSON serializable dict, slowest timings first."""
+        return {
+            'totals_ms': {k: v * 1e3 for k, v in self.totals().items()},
+            'records': [
+                {'phase': p, 'name': n, 'ms': s * 1e3}
+                for p, n, s in sorted(self.records, key=lambda r: -r[2])],
+        }
+
+    def report(self, limit: int = None) -> str:
+        """
+        Report as text, phase totals then every timing, slowest first.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Number of timings to list. The default is all of them.
+
+        Returns
+        -------
+        str
+            Report.
+
+        """
+        lines = ['npdoc-cli profile (ms, inclusive)', '', 'phase totals']
+        for phase, seconds in self.totals().items():
+            lines.append('  {:<18}{:>12.3f}'.format(phase, seconds * 1e3))
+        lines += ['', 'slowest']
+        records = sorted(self.records, key=lambda r: -r[2])
+        for phase, name, seconds in records[:limit]:
+            if len(name) > 60:
+                name = name[:57] + '...'
+            lines.append('  {:<18}{:>12.3f}  {}'.format(
+                phase, seconds * 1e3, name))
+        return '\n'.join(lines) + '\n'
+
+    def write(self):
+        """
+        Write the report to its output.
+
+        Returns
+        -------
+        None.
+
+        """
+        self._written = True
+        _atexit.unregister(self.write)
+        if self.output == 'stderr':
+            _sys.stderr.write(self.report())
+        elif self.output == 'json' or self.output.endswith('.json'):
+            import json
+
+            text = json.dumps(self.to_dict(), indent=2) + '\n'
+            if self.output == 'json':
+                _sys.stderr.write(text)
+            else:
+                with open(self.output, 'w') as f:
+                    f.write(text)
+        else:
+            with open(self.output, 'w') as f:
+                f.write(self.report())
@@ -0,0 +1,142 @@
+"""
+Interactive shell running commands of a built CLI in one process.
+"""
+import sys as _sys
+
+
+def completions(cli, words: list, text: str) -> list:
+    """
+    Completions of a word from the CLI's parser tree.
+
+    Placeholder parsers of a lazy build are filled in as the words descend
+    into them.
+
+    Parameters
+    ----------
+    cli : :py:obj:`NumpyDocCLI`
+        Built CLI.
+    words : list[str]
+        Complete words before the one being completed.
+    text : str
+        Start of the word being completed.
+
+    Returns
+    -------
+    list[str]
+        Sorted candidates starting with ``text``.
+
+    """
+    parser = cli.program_parser
+    for w in words:
+        child = cli._children.get(parser, {}).get(w)
+        if child is not None:
+            if child in cli._pending:
+                cli._populate_subparser(child)
+            parser = child
+
+    previous = parser._option_string_actions.get(words[-1]) if words else None
+    if previous is not None and previous.nargs != 0:
+        candidates = [str(c) for c in previous.choices or ()]
+    elif text.startswith('-'):
+        candidates = list(parser._option_string_actions)
+    else:
+        candidates = list(cli._children.get(parser, {}))
+        for action in parser._get_positional_actions():
+            if action.choices and not isinstance(
+                    action.choices, dict):
+                candidates += [str(c) for c in action.choices]
+    return sorted(c for c in set(candidates) if c.startswith(text))
+
+
+def _readline_completer(cli, readline):
+    """Completer function for readline."""
+    import shlex
+
+    matches = []
+
+    def complete(text: str, state: int):
+        if state == 0:
+            line = readline.get_line_buffer()[:readline.get_begidx()]
+            try:
+                words = shlex.split(line)
+            except ValueError:
+                words = line.split()
+            matches[:] = [m + ' ' for m in completions(cli, words, text)]
+        return matches[state] if state < len(matches) else None
+    return complete
+
+
+def repl(cli, prompt: str = None, history: str = None):
+    """
+    Read, parse and dispatch commands until end of input.
+
+    See :py:meth:`NumpyDocCLI.repl`.
+    """
+    import shlex
+    import traceback
+    try:
+        import readline
+    except ImportError:
+        readline = None
+
+    if prompt is None:
+        prompt = cli.program_parser.prog + '> '
+    if readline is not None:
+        old_completer = readline.get_completer()
+        old_delims = readline.get_completer_delims()
+        readline.set_completer(_readline_completer(cli, readline))
+        readline.set_completer_delims(' \t\n')
+        if 'libedit' in (readline.__doc__ or ''):
+            readline.parse_and_bind('bind ^I rl_complete')
+        else:
+            readline.parse_and_bind('tab: complete')
+        if history is not None:
+            try:
+                readline.read_history_file(history)
+            except OSError:
+                pass
+
+    try:
+        while True:
+            try:
+                line = input(prompt)
+            except EOFError:
+                print(file=_sys.stderr)
+                break
+            except KeyboardInterrupt:
+                print(file=_sys.stderr)
+                continue
+            try:
+                argv = shlex.split(line)
+            except ValueError as e:
+                print('error:', e, file=_sys.stderr)
+                continue
+            if not argv:
+                continue
+            if argv in (['exit'], ['quit']):
+                break
+            try:
+                args = cli.parse_args(argv)
+            except SystemExit:
+                # argparse printed the help or the error already
+                continue
+            if getattr(args, '__shell__', False):
+                continue
+            try:
+                cli.dispatch(args)
+            except SystemExit as e:
+                if e.code not in (None, 0):
+                    print('exit status', e.code, file=_sys.stderr)
+            except KeyboardInterrupt:
+                print(file=_sys.stderr)
+            except Exception:
+                traceback.print_exc()
+    finally:
+        if readline is not None:
+            if history is not None:
+                try:
+                    readline.write_history_file(history)
+                except OSError:
+                    pass
+            readline.set_completer(old_completer)
+            readline.set_completer_delims(old_delims)
@@ -0,0 +1,187 @@
+"""
+Immutable representation of scraped command settings.
+"""
+
+
+def _freeze(key: str, value: object) -> object:
+    """Store choices as a tuple, argparse accepts any container."""
+    if key == 'choices' and isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class _Frozen():
+    """Base class of immutable, slotted specs."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(type(self).__name__ + ' is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError(type(self).__name__ + ' is immutable')
+
+    def _fields(self) -> tuple:
+        return tuple(getattr(self, k) for k in self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self):
+        return hash(self._fields())
+
+
+class ArgSpec(_Frozen):
+    """
+    Settings of one argument, as passed to ArgumentParser.add_argument.
+
+    Hashable as long as its default value is.
+    """
+
+    __slots__ = ('flags', 'kwargs')
+
+    def __init__(self, flags: tuple, kwargs: dict):
+        """
+        Initialize an :py:obj:`ArgSpec`.
+
+        Parameters
+        ----------
+        flags : tuple[str]
+            Name of a positional argument, or the short and long flag of an
+            optional one.
+        kwargs : dict
+            Keyword arguments of ArgumentParser.add_argument.
+
+        Returns
+        -------
+        None.
+
+        """
+        object.__setattr__(self, 'flags', tuple(flags))
+        object.__setattr__(self, 'kwargs', tuple(
+            (k, _freeze(k, v)) for k, v in kwargs.items()))
+
+    def __reduce__(self):
+        return (ArgSpec, (self.flags, dict(self.kwargs)))
+
+    def __repr__(self):
+        return 'ArgSpec({!r}, {!r})'.format(self.flags, dict(self.kwargs))
+
+    @property
+    def positional(self) -> bool:
+        """True for positional arguments."""
+        return not self.flags[0].startswith('-')
+
+    def get(self, key: str, default: object = None) -> object:
+        """
+        Get a keyword argument of ArgumentParser.add_argument.
+
+        Parameters
+        ----------
+        key : str
+            Name of the keyword argument.
+        default : object, optional
+            Returned if ``key`` isn't set. The default is None.
+
+        Returns
+        -------
+        object
+            Value of the keyword argument.
+
+        """
+        for k, v in self.kwargs:
+            if k == key:
+                return v
+        return default
+
+    def to_argparse(self) -> tuple:
+        """
+        Convert to the inputs of ArgumentParser.add_argument.
+
+        Returns
+        -------
+        tuple
+            Positional arguments.
+        dict
+            Keyword arguments.
+
+        """
+        return self.flags, dict(self.kwargs)
+
+
+class CommandSpec(_Frozen):
+    """
+    Settings of one command's parser and all of its arguments.
+
+    Hashable as long as the default values of its arguments are.
+    """
+
+    __slots__ = ('name', 'kwargs', 'args')
+
+    def __init__(self, name: str, kwargs: dict, args: tuple):
+        """
+        Initialize a :py:obj:`CommandSpec`.
+
+        Parameters
+        ----------
+        name : str
+            Name of the command on the command line.
+        kwargs : dict
+            Keyword arguments of the command's ArgumentParser.
+        args : tuple[:py:obj:`ArgSpec`]
+            Arguments of the command.
+
+        Returns
+        -------
+        None.
+
+        """
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'kwargs', tuple(kwargs.items()))
+        object.__setattr__(self, 'args', tuple(args))
+
+    def __reduce__(self):
+        return (CommandSpec, (self.name, dict(self.kwargs), self.args))
+
+    def __repr__(self):
+        return 'CommandSpec({!r}, {!r}, {!r})'.format(
+            self.name, dict(self.kwargs), self.args)
+
+    @classmethod
+    def from_inputs(cls, parser_ins, arg_ins: list) -> 'CommandSpec':
+        """
+        Convert the output of :py:meth:`NumpyDocCommand.scrape`.
+
+        Parameters
+        ----------
+        parser_ins : :py:obj:`FunctionInput`
+            Inputs to be passed into argparse.ArgumentParser
+        arg_ins : list[:py:obj:`FunctionInput`]
+            Inputs to be passed into argparse.ArgumentParser.add_argument
+
+        Returns
+        -------
+        :py:obj:`CommandSpec`
+            Equivalent spec.
+
+        """
+        return cls(
+            parser_ins.pa[0],
+            parser_ins.kwa,
+            tuple(ArgSpec(a.pa, a.kwa) for a in arg_ins))
+
+    def to_argparse(self) -> tuple:
+        """
+        Convert to the inputs of ArgumentParser or add_parser.
+
+        Returns
+        -------
+        tuple
+            Positional arguments.
+        dict
+            Keyword arguments.
+
+        """
+        return (self.name,), dict(self.kwargs)
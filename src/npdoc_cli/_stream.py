@@ -0,0 +1,91 @@
+"""
+Arguments streamed lazily from a file or stdin.
+
+Parameters annotated as ``Iterator[T]`` or ``Iterable[T]`` are passed an
+iterator converting each item to ``T`` only when it is reached, so commands
+can start on the first of millions of items with constant memory.
+"""
+import argparse as _ap
+import os as _os
+import sys as _sys
+
+
+def _read(path: str) -> iter:
+    """Stripped, non blank lines of a file, ``-`` for stdin."""
+    if path == '-':
+        for line in _sys.stdin:
+            line = line.strip()
+            if line:
+                yield line
+        return
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def stream(dest: str, values: list, item_type: callable = str) -> iter:
+    """
+    Iterator over the items of a streamed argument.
+
+    Parameters
+    ----------
+    dest : str
+        Name of the argument, for error messages.
+    values : list[str]
+        Values given on the command line. A single ``@path`` reads one item
+        per line of the file at ``path``, a single ``-`` reads them from
+        stdin. Otherwise the values are the items.
+    item_type : callable, optional
+        Converts each item. The default is str.
+
+    Raises
+    ------
+    ValueError
+        While iterating, if an item can't be converted.
+    OSError
+        While iterating, if the file can't be read.
+
+    Yields
+    ------
+    object
+        Each converted item.
+
+    """
+    if values == ['-']:
+        items = _read('-')
+    elif len(values) == 1 and values[0].startswith('@'):
+        items = _read(values[0][1:])
+    else:
+        items = iter(values)
+    for i, item in enumerate(items):
+        try:
+            converted = item_type(item)
+        except (TypeError, ValueError):
+            raise ValueError('argument {}: invalid {} value: {!r} '
+                             '(item {})'.format(
+                                 dest, getattr(item_type, '__name__',
+                                               repr(item_type)),
+                                 item, i + 1)) from None
+        yield converted
+
+
+class StreamAction(_ap.Action):
+    """
+    Store a lazy iterator of converted items, see :py:func:`stream`.
+    """
+
+    def __init__(self, option_strings, dest, item_type=str, **kwargs):
+        kwargs.setdefault('nargs', '+')
+        super().__init__(option_strings, dest, **kwargs)
+        self.item_type = item_type
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        values = list(values)
+        if len(values) == 1 and values[0].startswith('@'):
+            if not _os.path.isfile(values[0][1:]):
+                parser.error("argument {}: can't open '{}'".format(
+                    self.metavar or self.dest, values[0][1:]))
+        setattr(namespace, self.dest, stream(
+            self.metavar or self.dest, values, self.item_type))
@@ -0,0 +1,133 @@
+"""
+Fork server running a built CLI for short lived invocations.
+
+The server builds the CLI once and listens on a Unix socket. Each client
+sends its arguments, environment and working directory along with its
+stdin, stdout and stderr file descriptors. The server forks a child that
+takes them over, parses and dispatches the arguments and reports the exit
+status back, so every invocation is isolated and starts at the cost of a
+fork.
+
+The client, :py:mod:`npdoc_zygote`, only needs the standard library and
+doesn't import npdoc-cli::
+
+    python -m npdoc_zygote /tmp/tool.sock command --option value
+
+Only available on platforms with fork and Unix sockets.
+"""
+import json as _json
+import os as _os
+import socket as _socket
+import sys as _sys
+from npdoc_zygote import _HEADER, _STATUS, _recv_exactly
+
+
+def _exit_code(e: SystemExit) -> int:
+    """Exit status of a SystemExit, like the interpreter's."""
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+    print(e.code, file=_sys.stderr)
+    return 1
+
+
+def _run_child(cli, conn: _socket.socket, request: dict, fds: list) -> int:
+    """Take over the client's process state, then parse and dispatch."""
+    import signal
+    import traceback
+
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    for target, fd in enumerate(fds):
+        _os.dup2(fd, target)
+        _os.close(fd)
+    _os.environ.clear()
+    _os.environ.update(request['env'])
+    _os.chdir(request['cwd'])
+    _sys.argv = [cli.program_parser.prog] + request['argv']
+    conn.sendall(_STATUS.pack(_os.getpid()))
+
+    try:
+        cli.dispatch(cli.parse_args(request['argv']))
+        code = 0
+    except SystemExit as e:
+        code = _exit_code(e)
+    except KeyboardInterrupt:
+        code = 130
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    for stream in (_sys.stdout, _sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+    return code
+
+
+def serve(cli, path: str, backlog: int = 64):
+    """
+    Serve invocations of a built CLI on a Unix socket until interrupted.
+
+    See :py:meth:`NumpyDocCLI.serve`.
+    """
+    import signal
+
+    # fill in every parser, so children don't each import and scrape
+    cli._populate_all(lazy_commands=True)
+    if _os.path.exists(path):
+        _os.unlink(path)
+    server = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    # only this user may run commands as the server, from the moment the
+    # socket exists
+    umask = _os.umask(0o177)
+    try:
+        server.bind(path)
+    finally:
+        _os.umask(umask)
+    server.listen(backlog)
+    # children are reaped automatically
+    previous = signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    try:
+        while True:
+            conn, _ = server.accept()
+            fds = []
+            try:
+                header, fds, _, _ = _socket.recv_fds(conn, _HEADER.size, 3)
+                if len(header) < _HEADER.size:
+                    header += _recv_exactly(
+                        conn, _HEADER.size - len(header))
+                (size,) = _HEADER.unpack(header)
+                request = _json.loads(_recv_exactly(conn, size))
+                if len(fds) != 3:
+                    raise ConnectionError('expected 3 file descriptors')
+            except (OSError, ValueError):
+                for fd in fds:
+                    _os.close(fd)
+                conn.close()
+                continue
+
+            for stream in (_sys.stdout, _sys.stderr):
+                stream.flush()
+            try:
+                pid = _os.fork()
+            except OSError:
+                # e.g. out of processes, the client reports a failure
+                pid = None
+            if pid == 0:
+                code = 1
+                try:
+                    server.close()
+                    code = _run_child(cli, conn, request, fds)
+                    conn.sendall(_STATUS.pack(code))
+                finally:
+                    _os._exit(code)
+            for fd in fds:
+                _os.close(fd)
+            conn.close()
+    finally:
+        signal.signal(signal.SIGCHLD, previous)
+        server.close()
+        if _os.path.exists(path):
+            _os.unlink(path)
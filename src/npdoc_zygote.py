@@ -0,0 +1,87 @@
+"""
+Client of an npdoc-cli fork server, see ``NumpyDocCLI.serve``.
+
+Kept out of the npdoc_cli package, and only using the standard library,
+so a client starts without importing npdoc-cli or numpydoc::
+
+    python -m npdoc_zygote /tmp/tool.sock command --option value
+
+Only available on platforms with Unix sockets.
+"""
+import json as _json
+import os as _os
+import socket as _socket
+import struct as _struct
+import sys as _sys
+
+_HEADER = _struct.Struct('!Q')
+"""Length of the request sent after the file descriptors."""
+_STATUS = _struct.Struct('!i')
+"""Child pid, then its exit status, sent back to the client."""
+
+
+def _recv_exactly(sock: _socket.socket, n: int) -> bytes:
+    data = b''
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            raise ConnectionError('connection closed')
+        data += chunk
+    return data
+
+
+def connect(path: str, argv: list = None) -> int:
+    """
+    Run a command on a fork server, with this process' stdio.
+
+    Interrupting the client interrupts the command.
+
+    Parameters
+    ----------
+    path : str
+        Socket the server listens on.
+    argv : list[str], optional
+        Arguments of the command. The default is ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        Exit status of the command.
+
+    """
+    import signal
+
+    if argv is None:
+        argv = _sys.argv[1:]
+    request = _json.dumps({
+        'argv': list(argv),
+        'env': dict(_os.environ),
+        'cwd': _os.getcwd(),
+    }).encode()
+    for stream in (_sys.stdout, _sys.stderr):
+        stream.flush()
+    with _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        _socket.send_fds(sock, [_HEADER.pack(len(request))], [0, 1, 2])
+        sock.sendall(request)
+        try:
+            (pid,) = _STATUS.unpack(_recv_exactly(sock, _STATUS.size))
+        except ConnectionError:
+            return 1
+        try:
+            (code,) = _STATUS.unpack(_recv_exactly(sock, _STATUS.size))
+        except KeyboardInterrupt:
+            _os.kill(pid, signal.SIGINT)
+            try:
+                (code,) = _STATUS.unpack(
+                    _recv_exactly(sock, _STATUS.size))
+            except ConnectionError:
+                code = 130
+        except ConnectionError:
+            # the child died without reporting
+            code = 1
+    return code
+
+
+if __name__ == '__main__':
+    _sys.exit(connect(_sys.argv[1], _sys.argv[2:]))
@@ -0,0 +1,16 @@
+"""Module imported by a lazy command in test_lazy_command.py."""
+from npdoc_cli import cli
+
+
+@cli.command
+def train(epochs: int):
+    """
+    Train a model.
+
+    Parameters
+    ----------
+    epochs : int
+        Number of epochs.
+
+    """
+    return epochs
@@ -0,0 +1,95 @@
+"""Pytest functions for testing numeric lists converted into arrays."""
+import argparse
+import array
+import types
+import pytest
+from npdoc_cli import cli, NumpyDocCommand, CLIArgError
+from npdoc_cli._array import ArrayAction
+
+# array.array[int] and array.array[str], on python versions where array.array
+# isn't subscriptable yet
+ARRAY_INT = types.GenericAlias(array.array, (int,))
+ARRAY_STR = types.GenericAlias(array.array, (str,))
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    @cli.command
+    def stats(
+            counts: ARRAY_INT,
+            weights: list[float] = None,
+            raw: array.array = None):
+        """
+        Summarize numbers.
+
+        Parameters
+        ----------
+        counts : array.array[int]
+            Counts.
+        weights : list[float], optional
+            Weights.
+            For CLI argument typecode = f.
+        raw : array.array, optional
+            Raw values.
+
+        """
+        return counts, weights, raw
+
+    cli.build()
+
+
+def test_array_arguments():
+    """Test that annotations and typecodes give typed arrays."""
+    _register()
+    counts, weights, raw = cli.dispatch(cli.parse_args(
+        ['stats', '1', '2', '3', '-w', '0.5', '1.5', '-w', '2',
+         '-r', '1e3']))
+    assert counts == array.array('q', [1, 2, 3])
+    assert weights == array.array('f', [0.5, 1.5, 2.0])
+    assert raw == array.array('d', [1000.0])
+
+    with pytest.raises(SystemExit):
+        cli.parse_args(['stats', '1', 'x'])
+
+    # repeated flags extend a copy, not the default
+    default = array.array('d', [1.0])
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v', action=ArrayAction, default=default)
+    assert parser.parse_args(['-v', '2', '-v', '3']).v == array.array(
+        'd', [1.0, 2.0, 3.0])
+    assert default == array.array('d', [1.0])
+
+
+def test_array_errors():
+    """Test that unusable typecodes are reported while scraping."""
+    def bad(values: ARRAY_STR):
+        """
+        Bad.
+
+        Parameters
+        ----------
+        values : array.array[str]
+            No typecode for str.
+
+        """
+
+    def unknown(values: list[int]):
+        """
+        Unknown.
+
+        Parameters
+        ----------
+        values : list[int]
+            Unknown typecode.
+            For CLI argument typecode = z.
+
+        """
+
+    for f in (bad, unknown):
+        with pytest.raises(CLIArgError):
+            NumpyDocCommand(f).scrape()
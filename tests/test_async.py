@@ -0,0 +1,103 @@
+"""Pytest functions for testing async commands."""
+import asyncio
+from npdoc_cli import cli
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    @cli.command
+    async def fetch(n: int):
+        """
+        Fetch something.
+
+        Parameters
+        ----------
+        n : int
+            Number fetched.
+
+        """
+        await asyncio.sleep(0)
+        return n, asyncio.get_running_loop()
+
+    @cli.command
+    async def stream(n: int):
+        """
+        Stream numbers.
+
+        Parameters
+        ----------
+        n : int
+            Count of numbers.
+
+        """
+        for i in range(n):
+            await asyncio.sleep(0)
+            yield i
+
+    @cli.command
+    def plain(n: int):
+        """
+        Plain command.
+
+        Parameters
+        ----------
+        n : int
+            Returned.
+
+        """
+        return n
+
+    cli.build()
+
+
+def test_dispatch_async_routines():
+    """Test that dispatch runs coroutines and async generators."""
+    _register()
+    n, loop = cli.dispatch(cli.parse_args(['fetch', '3']))
+    assert n == 3
+    # the loop is reused between dispatches
+    assert cli.dispatch(cli.parse_args(['fetch', '4']))[1] is loop
+    assert cli.dispatch(cli.parse_args(['stream', '3'])) == [0, 1, 2]
+    assert cli.dispatch(cli.parse_args(['plain', '2'])) == 2
+
+
+def test_dispatch_in_running_loop():
+    """Test that dispatch_async awaits routines on the running loop."""
+    _register()
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        n, used = await cli.dispatch_async(cli.parse_args(['fetch', '5']))
+        assert used is loop
+        assert await cli.dispatch_async(
+            cli.parse_args(['stream', '2'])) == [0, 1]
+        return n + await cli.dispatch_async(cli.parse_args(['plain', '1']))
+
+    assert asyncio.run(main()) == 6
+
+
+def test_thread_loops_closed():
+    """Test that the loop of a thread is closed once the thread ends."""
+    import gc
+    import threading
+
+    _register()
+    loops = []
+
+    def work():
+        loops.append(cli.dispatch(cli.parse_args(['fetch', '1']))[1])
+    threads = [threading.Thread(target=work) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    gc.collect()
+    assert len(loops) == 20
+    assert all(loop.is_closed() for loop in loops)
+    # while the loop of a running thread stays open
+    assert not cli.dispatch(cli.parse_args(['fetch', '1']))[1].is_closed()
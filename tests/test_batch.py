@@ -0,0 +1,125 @@
+"""Pytest functions for testing batch execution."""
+import os
+import pytest
+from npdoc_cli import cli
+
+LINES = [
+    '# comment',
+    'square 2',
+    '',
+    'square x',
+    'square 3 --fail',
+    "square '4'",
+]
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    @cli.command
+    def square(n: int, fail: bool = False):
+        """
+        Square a number.
+
+        Parameters
+        ----------
+        n : int
+            Number.
+        fail : bool, optional
+            Raise an error instead. The default is False.
+
+        """
+        if fail:
+            raise ValueError('no square')
+        print(n * n)
+
+    cli.build(batch=True)
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_run_batch(jobs, capfd):
+    """Test that lines run in-process and in workers report failures."""
+    _register()
+    result = cli.run_batch(LINES, jobs=jobs, recycle=1)
+    assert result.total == 4
+    assert [(f.line, f.status) for f in result.failures] == [(4, 2), (5, 1)]
+    assert 'invalid int value' in result.failures[0].error
+    assert result.failures[1].error == 'ValueError: no square'
+    assert result.status == 2
+    out, err = capfd.readouterr()
+    assert sorted(out.split()) == ['16', '4']
+    assert 'line 4: status 2: square x' in result.report()
+
+
+def test_batch_option(tmp_path, capfd):
+    """Test the --batch program option and its exit status."""
+    _register()
+    path = tmp_path / 'batch.txt'
+    path.write_text('square 5\nsquare 6\n')
+    result = cli.dispatch(cli.parse_args(['--batch', str(path)]))
+    assert result.status == 0
+    assert capfd.readouterr().out.split() == ['25', '36']
+
+    path.write_text('\n'.join(LINES))
+    with pytest.raises(SystemExit) as e:
+        cli.dispatch(cli.parse_args(
+            ['--batch', os.fspath(path), '--batch-jobs', '2']))
+    assert e.value.code == 2
+    assert '2 of 4 lines failed' in capfd.readouterr().err
+
+
+def test_batch_backpressure():
+    """Test that workers are sent lines only a few chunks ahead."""
+    from npdoc_cli._batch import IN_FLIGHT, _run_lines
+
+    _register()
+    read = []
+
+    def lines():
+        for i in range(1, 41):
+            read.append(i)
+            yield i, ['square', str(i)]
+
+    jobs, chunksize = 2, 3
+    done = 0
+    for i, argv, status, error in _run_lines(
+            cli, lines(), jobs, None, chunksize):
+        done += 1
+        assert status == 0
+        assert len(read) - done <= (jobs * IN_FLIGHT + 1) * chunksize
+    assert done == len(read) == 40
+
+
+def test_batch_worker_dies(capfd):
+    """Test that lines lost with a dead worker are failures."""
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    @cli.command
+    def die(code: int):
+        """
+        Exit the process abruptly.
+
+        Parameters
+        ----------
+        code : int
+            Exit status, 0 to return instead.
+
+        """
+        if code:
+            os._exit(code)
+        print('alive')
+
+    cli.build()
+    result = cli.run_batch(['die 0', 'die 3', 'die 0', 'die 0'], jobs=2)
+    assert result.total == 4
+    assert [(f.line, f.status, f.error) for f in result.failures] == [
+        (2, 3, 'worker exited with status 3')]
+    assert capfd.readouterr().out.split() == ['alive'] * 3
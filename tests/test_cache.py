@@ -0,0 +1,71 @@
+"""Pytest functions for testing the persistent scrape cache."""
+import os
+from npdoc_cli import cli, NumpyDocCommand, ScrapeCache
+
+
+def hello(name: str, loud: bool = False):
+    """
+    Say hello.
+
+    Parameters
+    ----------
+    name : str
+        Who is being greeted.
+    loud : bool, optional
+        Shout the greeting. The default is False.
+
+    """
+
+
+def test_cache_roundtrip(tmp_path, monkeypatch):
+    """Test that a second build is served from the cache."""
+    cli.reset()
+    cli.program(hello)
+    cli.build(cache=tmp_path)
+    assert len(os.listdir(tmp_path)) == 1
+
+    def fail(self, **kwargs):
+        raise AssertionError('scrape should be served from cache')
+    monkeypatch.setattr(NumpyDocCommand, '_scrape', fail)
+    cli.reset()
+    cli.program(hello)
+    cli.build(cache=tmp_path)
+    args = cli.parse_args(['reader', '-l'])
+    assert args.name == 'reader'
+    assert args.loud
+
+
+def test_cache_invalidation(tmp_path):
+    """Test that changed doc strings and settings miss the cache."""
+    cache = ScrapeCache(tmp_path)
+    command = NumpyDocCommand(hello)
+    spec = cache.spec(command, dict(replace_underscores=True))
+    assert spec.args[0].get('help') == 'Who is being greeted.'
+
+    original = hello.__doc__
+    try:
+        hello.__doc__ = original.replace('Who is', 'Person')
+        spec = cache.spec(command, dict(replace_underscores=True))
+        assert spec.args[0].get('help') == 'Person being greeted.'
+    finally:
+        hello.__doc__ = original
+
+    spec = cache.spec(command, dict(replace_underscores=False))
+    assert spec.args[0].get('help') == 'Who is being greeted.'
+    # one entry per command, overwritten when stale
+    assert len(os.listdir(tmp_path)) == 1
+    cache.clear()
+    assert os.listdir(tmp_path) == []
+
+
+def test_cache_versions(tmp_path, monkeypatch):
+    """Test that upgrading npdoc-cli or numpydoc misses the cache."""
+    import npdoc_cli
+    from npdoc_cli import _cache
+
+    assert _cache.versions() == 'npdoc-cli {}, numpydoc {}'.format(
+        npdoc_cli.__version__, _cache._installed_version('numpydoc'))
+    assert _cache._installed_version('numpydoc')
+    key = _cache.digest(hello, {})
+    monkeypatch.setattr(_cache, '_versions', 'npdoc-cli 0, numpydoc 0')
+    assert _cache.digest(hello, {}) != key
@@ -0,0 +1,113 @@
+"""Pytest functions for testing compiled parser modules."""
+import types
+from pathlib import Path
+import pytest
+from npdoc_cli import cli, CLIArgError, NumpyDocCommand
+
+
+def program(verbose: int = 0):
+    """
+    Sample program.
+
+    Parameters
+    ----------
+    verbose : int, optional
+        Verbosity.
+        For CLI argument action = count.
+
+    """
+    return verbose
+
+
+def copy(source: Path, ids: list[int], mode: str = 'fast', force: bool = False):
+    """
+    Copy a file.
+
+    Parameters
+    ----------
+    source : Path
+        File to copy.
+    ids : list[int]
+        Identifiers.
+    mode : {fast, slow}, optional
+        Copy mode. The default is 'fast'.
+    force : bool, optional
+        Overwrite existing files. The default is False.
+
+    """
+    return source, ids, mode, force
+
+
+class say():
+    """Say things."""
+
+    @staticmethod
+    def hello(name: str):
+        """
+        Say hello.
+
+        Parameters
+        ----------
+        name : str
+            Say hello to?.
+
+        """
+        return 'hello ' + name
+
+
+def _load(source):
+    module = types.ModuleType('compiled')
+    exec(compile(source, 'compiled', 'exec'), module.__dict__)
+    return module
+
+
+def test_compile_matches_build(tmp_path, monkeypatch, capsys):
+    """Test that the compiled parser matches the built one."""
+    cli.reset()
+    cli.program(program)
+    cli.command(copy)
+    cli.command(say)
+    cli.subcommand(say.hello)
+    cli.build()
+
+    def fail(self, **kwargs):
+        raise AssertionError('specs of the build should be reused')
+    monkeypatch.setattr(NumpyDocCommand, '_scrape', fail)
+    path = tmp_path / 'parser.py'
+    source = cli.compile(path)
+    cli.completion('bash')
+    monkeypatch.undo()
+    assert path.read_text() == source
+    assert 'import numpydoc' not in source
+    module = _load(source)
+    parser = module.build_parser()
+
+    argvs = [
+        ['-vv', 'copy', 'a.txt', '1', '2', '-m', 'slow', '-f'],
+        ['copy', 'b.txt', '3'],
+        ['say', 'hello', 'reader'],
+    ]
+    for argv in argvs:
+        assert vars(parser.parse_args(argv)) == vars(cli.parse_args(argv))
+    assert parser.format_help() == cli.program_parser.format_help()
+    assert module.main(['-vv']) == 2
+
+    # abbreviated and mistyped commands, as in the built parser
+    assert vars(parser.parse_args(['co', 'c.txt', '4'])) == vars(
+        cli.parse_args(['co', 'c.txt', '4']))
+    assert parser.parse_args(['say', 'hel', 'you']).name == 'you'
+    with pytest.raises(SystemExit):
+        parser.parse_args(['sya', 'hello', 'you'])
+    assert "maybe you meant 'say'" in capsys.readouterr().err
+
+
+def test_compile_local_function():
+    """Test that routines which can't be imported are refused."""
+    cli.reset()
+
+    @cli.program
+    def local():
+        pass
+
+    with pytest.raises(CLIArgError):
+        cli.compile()
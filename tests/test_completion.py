@@ -0,0 +1,106 @@
+"""Pytest functions for testing static shell completion scripts."""
+import shutil
+import subprocess
+import pytest
+from npdoc_cli import cli, CLIArgError
+
+
+class remote():
+    """Manage remotes."""
+
+    @cli.subcommand
+    def add(name: str, protocol: str = 'ssh'):
+        """
+        Add a remote.
+
+        Parameters
+        ----------
+        name : str
+            Remote name.
+        protocol : {ssh, https}, optional
+            Protocol. The default is 'ssh'.
+
+        """
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def git():
+        """Sample program."""
+
+    @cli.command
+    def push(force: bool = False, target: str = None):
+        """
+        Push commits.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Overwrite. The default is False.
+        target : str, optional
+            Target file.
+
+        """
+
+    cli.command(remote)
+    cli.subcommand(remote.add)
+    cli.build(lazy=True)
+
+
+_BASH = '''
+source "$1"
+complete_words() {
+    COMP_WORDS=("$@"); COMP_CWORD=$((${#COMP_WORDS[@]}-1)); COMPREPLY=()
+    _git_complete
+    echo "${COMPREPLY[*]}"
+}
+complete_words git ''
+complete_words git p
+complete_words git push -
+complete_words git remote ''
+complete_words git remote add origin -p ''
+complete_words git remote add origin --
+'''
+
+
+@pytest.mark.skipif(shutil.which('bash') is None, reason='needs bash')
+def test_bash_completion(tmp_path):
+    """Test the bash script completes commands, flags and choices."""
+    _register()
+    path = tmp_path / 'git.bash'
+    cli.completion('bash', str(path))
+    out = subprocess.run(
+        ['bash', '-c', _BASH, 'bash', str(path)],
+        capture_output=True, text=True, check=True).stdout
+    assert out.splitlines() == [
+        'push remote',
+        'push',
+        '-h --help -f --force -t --target',
+        'add',
+        'ssh https',
+        '--help --protocol',
+    ]
+
+
+def test_other_shells():
+    """Test the zsh and fish scripts hold the same completions."""
+    _register()
+    zsh = cli.completion('zsh')
+    assert zsh.startswith('#compdef git')
+    assert 'compadd -- "ssh" "https"' in zsh
+    assert '"/remote/add") compadd -- -h --help -p --protocol;;' in zsh
+
+    fish = cli.completion('fish')
+    assert ("complete -c git -n '_git_complete_at \\'/remote\\'' "
+            "-a 'add' -d 'Add a remote.'") in fish
+    assert "-s 'p' -l 'protocol' -x -a 'ssh https'" in fish
+
+    for shell, checker in (('zsh', 'zsh'), ('fish', 'fish')):
+        if shutil.which(checker):
+            subprocess.run([checker, '-n'], input=cli.completion(shell),
+                           text=True, check=True)
+
+    with pytest.raises(CLIArgError):
+        cli.completion('tcsh')
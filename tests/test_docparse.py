@@ -0,0 +1,199 @@
+"""Pytest functions for checking the fast doc string parser against numpydoc."""
+import inspect
+import runpy
+from pathlib import Path
+import pytest
+from npdoc_cli import NumpyDocCommand, CLIArgError
+from npdoc_cli._docparse import parse
+from tests import test_heirarchy, test_typing
+
+EXAMPLES = Path(__file__).parents[1] / 'examples'
+
+
+def extended(first: int, second: str = 'b', *, ls: list[float] = None):
+    """
+    Summary spanning
+    two lines.
+
+    Extended summary
+        with an indented line.
+
+    And a second paragraph.
+
+    Parameters
+    ----------
+    first : int
+        Description of first,
+        on two lines.
+
+        With a blank line.
+    second : {a, b, c}, optional
+        Choices. The default is 'b'.
+    ls : list[float],
+         optional
+        Continued type.
+        For CLI argument nargs = *.
+
+    Returns
+    -------
+    None.
+
+    Examples
+    --------
+    >>> extended(1)
+    """
+
+
+def undocumented(arg: int):
+    pass
+
+
+def only_sections(arg: int = 0):
+    """
+    Parameters
+    ----------
+    arg : int, optional
+        For CLI argument action = count, required = False.
+    """
+
+
+def mismatch(arg: int):
+    """
+    Parameters mismatching the signature.
+
+    Parameters
+    ----------
+    other : int
+        Not an argument.
+    """
+
+
+def missing_blank_line(arg: int):
+    """
+    Summary.
+
+    Parameters
+    ----------
+    arg : int
+        Argument.
+    Returns
+    -------
+    None.
+    """
+
+
+def signature_summary(arg: int):
+    """
+    signature_summary(arg)
+
+    Parameters
+    ----------
+    arg : int
+        Argument.
+    """
+
+
+def unknown_section(arg: int):
+    """
+    Summary.
+
+    Parameters
+    ----------
+    arg : int
+        Argument.
+
+    Example
+    -------
+    Not a numpydoc section.
+    """
+
+
+def short_underline(arg: int):
+    """
+    Summary.
+
+    Parameters
+    ------
+    arg : int
+        Argument.
+    """
+
+
+class Command():
+    """
+    A class command.
+
+    Parameters
+    ----------
+    value : float
+        Passed to __init__.
+    """
+
+    def __init__(self, value: float):
+        self.value = value
+
+
+SAMPLES = [
+    extended, undocumented, only_sections, mismatch, missing_blank_line,
+    signature_summary, unknown_section, short_underline, Command,
+]
+"""Doc strings covering the parser's edge cases."""
+
+UNUSUAL = [
+    missing_blank_line, signature_summary, unknown_section, short_underline,
+]
+"""Doc strings the fast parser leaves to numpydoc."""
+
+
+def _registered(monkeypatch, capsys):
+    """Objects registered while running the examples and other tests."""
+    objs = []
+    init = NumpyDocCommand.__init__
+
+    def spy(self, obj):
+        objs.append(obj)
+        init(self, obj)
+    monkeypatch.setattr(NumpyDocCommand, '__init__', spy)
+
+    for path in sorted(EXAMPLES.glob('plot_*.py')):
+        runpy.run_path(str(path))
+    for module in (test_heirarchy, test_typing):
+        for name, test in vars(module).items():
+            if name.startswith('test_') and not inspect.signature(
+                    test).parameters:
+                test()
+    capsys.readouterr()
+    monkeypatch.undo()
+    return objs
+
+
+def _scrape(obj, doc_parser):
+    try:
+        parser_ins, arg_ins = NumpyDocCommand(obj).scrape(
+            doc_parser=doc_parser)
+    except CLIArgError as e:
+        return 'CLIArgError', str(e)
+    return ([parser_ins.pa, parser_ins.kwa]
+            + [[a.pa, a.kwa] for a in arg_ins])
+
+
+@pytest.mark.filterwarnings('ignore:.*:UserWarning')
+def test_fast_parser_conformance(monkeypatch, capsys):
+    """Test that the fast parser scrapes the same settings as numpydoc."""
+    objs = SAMPLES + _registered(monkeypatch, capsys)
+    assert len(objs) > len(SAMPLES)
+    for obj in objs:
+        assert _scrape(obj, 'fast') == _scrape(obj, 'numpydoc'), obj
+
+
+def test_fast_parser_fallback():
+    """Test that only unusual doc strings are left to numpydoc."""
+    for obj in SAMPLES:
+        fallback = parse(inspect.getdoc(obj) or '') is None
+        assert fallback == (obj in UNUSUAL), obj
+
+
+def test_unknown_parser():
+    """Test that an unknown doc parser is an error."""
+    with pytest.raises(CLIArgError):
+        NumpyDocCommand(extended).scrape(doc_parser='other')
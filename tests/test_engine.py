@@ -0,0 +1,159 @@
+"""Pytest functions for testing the fast parsing engine."""
+from collections.abc import Iterator
+import pytest
+from npdoc_cli import cli, CLIArgError
+from npdoc_cli._engine import _Fallback, Engine
+
+
+class store():
+    """Manage the store."""
+
+    @cli.subcommand
+    def stock(item: str, sizes: list[int], price: float = 1.0,
+              tags: list[str] = None, shelf: str = 'a',
+              verbose: int = 0, dry_run: bool = False):
+        """
+        Stock an item.
+
+        Parameters
+        ----------
+        item : str
+            Item stocked.
+        sizes : list[int]
+            Sizes stocked.
+        price : float, optional
+            Price of the item. The default is 1.0.
+        tags : list[str], optional
+            Tags of the item. The default is None.
+        shelf : {a, b, c}, optional
+            Shelf of the item. The default is 'a'.
+        verbose : int, optional
+            Verbosity.
+            For CLI argument action = count.
+        dry_run : bool, optional
+            Don't stock it. The default is False.
+
+        """
+        return item, sizes, price, tags, shelf, verbose, dry_run
+
+
+def total(values: Iterator[int]):
+    """
+    Sum streamed values.
+
+    Parameters
+    ----------
+    values : Iterator[int]
+        Values to sum.
+
+    """
+    return sum(values)
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    cli.command(store)
+    cli.subcommand(store.stock)
+    cli.command(total)
+
+
+ARGVS = [
+    ['store', 'stock', 'pen', '1', '2'],
+    ['store', 'stock', 'pen', '1', '2', '-p', '2.5'],
+    ['store', 'stock', '-vv', 'pen', '1', '-v'],
+    ['store', 'stock', 'pen', '1', '-dv', '-t', 'x', 'y', '-t', 'z'],
+    ['store', 'stock', 'pen', '1', '-s', 'b', '--price=3'],
+    ['store', 'stock', 'pen', '1', '-sc', '--dry-run'],
+    ['store', 'stock', 'pen', '1', '-vp4'],
+    ['store'],
+    ['sto', 'sto', 'pen', '1'],
+    ['total', '1', '2', '3'],
+    [],
+]
+"""Arguments the engine parses itself."""
+
+FALLBACKS = [
+    ['store', 'stock', 'pen', '1', '--pri', '2'],
+    ['store', 'stock', 'pen', '1', '-p', '-1'],
+    ['store', 'stock', 'pen', '--', '1'],
+    ['store', 'stock', 'pen', '1', '-d=x'],
+]
+"""Valid arguments handed to argparse."""
+
+ERRORS = [
+    ['store', 'stock', 'pen'],
+    ['store', 'stock', 'pen', 'x'],
+    ['store', 'stock', 'pen', '1', '-p', '2.5', '2'],
+    ['store', 'stock', 'pen', '1', '-s', 'd'],
+    ['store', 'stock', 'pen', '1', '-p'],
+    ['store', 'stock', 'pen', '1', '--nope'],
+    ['shop'],
+    ['stroe'],
+    ['store', '-h'],
+]
+"""Arguments argparse reports or prints help for."""
+
+
+def _parse(argv, engine):
+    cli.build(engine=engine)
+    try:
+        args = vars(cli.parse_args(argv))
+    except SystemExit as e:
+        return e.code
+    # streams compare by what they give
+    return {k: list(v) if isinstance(v, Iterator) else v
+            for k, v in args.items()}
+
+
+def test_engine_matches_argparse(monkeypatch, capsys):
+    """Test that the engine parses arguments as argparse does."""
+    _register()
+    plan = Engine._plan
+    planned = []
+
+    def counted(self, parser, args):
+        try:
+            result = plan(self, parser, args)
+        except _Fallback:
+            planned.append(False)
+            raise
+        if parser is cli.program_parser:
+            planned.append(True)
+        return result
+    monkeypatch.setattr(Engine, '_plan', counted)
+
+    for argvs, fast in ((ARGVS, True), (FALLBACKS, False), (ERRORS, False)):
+        for argv in argvs:
+            expected = _parse(argv, 'argparse')
+            del planned[:]
+            assert _parse(argv, 'fast') == expected, argv
+            assert planned[-1] is fast, argv
+    capsys.readouterr()
+
+    cli.build(engine='fast')
+    assert cli.dispatch(cli.parse_args(ARGVS[3])) == (
+        'pen', [1], 1.0, ['x', 'y', 'z'], 'a', 1, True)
+    assert cli.invoke(['total', '1', '2']) == 3
+    assert cli.call(['store', 'stock', 'pen', 'x']).status == 2
+
+    with pytest.raises(CLIArgError):
+        cli.build(engine='slow')
+
+
+def test_engine_lazy():
+    """Test that placeholders are filled in before the engine parses."""
+    _register()
+    cli.build(lazy=True, engine='fast', memo_size=4)
+    assert cli.invoke('store stock pen 1 -s c') == (
+        'pen', [1], 1.0, None, 'c', 0, False)
+    assert cli.invoke('store stock pen 1 -s c')[4] == 'c'
+    assert list(cli._memo._entries) == [
+        ('store', 'stock', 'pen', '1', '-s', 'c')]
+    # streamed arguments aren't memoized
+    assert cli.invoke('total 1 2') == 3
+    assert len(cli._memo._entries) == 1
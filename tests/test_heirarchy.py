@@ -1,5 +1,62 @@
 """Pytest functions for testing the command heirarchy."""
-from npdoc_cli import cli
+import contextlib
+import io
+import pytest
+from npdoc_cli import cli, CLIArgError, NumpyDocCommand
+
+
+def deep_prog():
+    """Sample program."""
+
+
+class cluster():
+    """Manage clusters."""
+
+    class node():
+        """Manage nodes."""
+
+        class disk():
+            """Manage disks."""
+
+            def scrub(name: str, deep: bool = False):
+                """
+                Scrub a disk.
+
+                Parameters
+                ----------
+                name : str
+                    Disk scrubbed.
+                deep : bool, optional
+                    Read every block. The default is False.
+
+                """
+                return 'scrub', name, deep
+
+            def wipe(name: str):
+                """
+                Wipe a disk.
+
+                Parameters
+                ----------
+                name : str
+                    Disk wiped.
+
+                """
+
+        def drain():
+            """Drain the node."""
+
+    class pool():
+        """Manage pools."""
+
+        # same name as the group of nodes
+        class disk():
+            """Manage pool disks."""
+
+            def scrub():
+                """Scrub the pool's disks."""
+                return 'pool scrub'
+
 
 def test_subcommands():
     """Test for nesting subcommands, commands, and programs"""
@@ -28,7 +85,19 @@ def test_subcommands():
         def c1sub2(self):
             pass
     c1 = command1()
-    cli.tree()
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        cli.tree()
+    assert out.getvalue().splitlines()[3:] == [
+        'test_program',
+        '   > command2',
+        '        > c2sub2',
+        '        > c2sub1',
+        '   > command1',
+        '        > c1sub1',
+        '        > c1sub2',
+        '----------------',
+    ]
     cli.build()
     cli.parse_args(['command1','c1sub1'])
     cli.parse_args(['command1','c1sub2'])
@@ -85,5 +154,138 @@ def test_commands_only():
     args = cli.parse_args(['comm','file/path'])
     assert args.file == 'file/path'
 
+def test_lazy_build(monkeypatch):
+    """Test that a lazy build only scrapes the commands that are parsed."""
+    cli.reset()
+    @cli.program
+    def prog(mode: str = 'fast'):
+        """
+        Sample program.
+
+        Parameters
+        ----------
+        mode : str, optional
+            Mode. The default is 'fast'.
+
+        """
+        pass
+
+    @cli.command
+    def comm(file: str):
+        """
+        Print a str.
+
+        Parameters
+        ----------
+        file : str
+            Print a file string.
+
+        """
+
+    @cli.command
+    class group():
+        @cli.subcommand
+        def sub1(self, count: int):
+            """
+            First subcommand.
+
+            Parameters
+            ----------
+            count : int
+                A count.
+
+            """
+
+        @cli.subcommand
+        def sub2(self):
+            pass
+
+    scraped = []
+    scrape = NumpyDocCommand._scrape
+    def spy(self, **kwargs):
+        scraped.append(self.fname)
+        return scrape(self, **kwargs)
+    monkeypatch.setattr(NumpyDocCommand, '_scrape', spy)
+
+    cli.build(lazy=True)
+    assert scraped == ['prog']
+    args = cli.parse_args(['group', 'sub1', '3'])
+    assert args.count == 3
+    assert scraped == ['prog', 'group', 'sub1']
+    # option values aren't commands, even when they name one
+    args = cli.parse_args(['--mode', 'comm', 'group', 'sub1', '4'])
+    assert (args.mode, args.count) == ('comm', 4)
+    assert scraped == ['prog', 'group', 'sub1']
+    # nor are program options alone reasons to fill in the tree
+    assert cli.parse_args(['-m', 'slow']).mode == 'slow'
+    assert scraped == ['prog', 'group', 'sub1']
+    args = cli.parse_args(['-m', 'g', 'comm', 'file/path'])
+    assert args.file == 'file/path'
+    assert scraped == ['prog', 'group', 'sub1', 'comm']
+
+    # program help needs the whole tree
+    cli.build(lazy=True)
+    try:
+        cli.parse_args(['-h'])
+    except SystemExit:
+        pass
+    assert scraped == ['prog', 'group', 'sub1', 'comm', 'sub2']
+
+    # so do unknown commands
+    del scraped[:]
+    cli.build(lazy=True, replace_underscores=False)
+    with pytest.raises(SystemExit):
+        cli.parse_args(['-m', 'comm', 'grop'])
+    assert sorted(scraped) == ['comm', 'group', 'prog', 'sub1', 'sub2']
+
+def test_deep_hierarchy(monkeypatch, capsys):
+    """Test groups nested to any depth, built as argv descends into them."""
+    cli.reset()
+    cli.program(deep_prog)
+    cli.command(cluster)
+    for obj in (cluster.node, cluster.node.disk, cluster.node.disk.scrub,
+                cluster.node.disk.wipe, cluster.node.drain, cluster.pool,
+                cluster.pool.disk, cluster.pool.disk.scrub):
+        cli.subcommand(obj)
+
+    scraped = []
+    scrape = NumpyDocCommand._scrape
+    def spy(self, **kwargs):
+        scraped.append(self.qualname)
+        return scrape(self, **kwargs)
+    monkeypatch.setattr(NumpyDocCommand, '_scrape', spy)
+
+    cli.build(lazy=True)
+    argv = ['cluster', 'node', 'disk', 'scrub', 'sda', '--deep']
+    assert cli.dispatch(cli.parse_args(argv)) == ('scrub', 'sda', True)
+    assert scraped == ['deep_prog', 'cluster', 'cluster.node',
+                       'cluster.node.disk', 'cluster.node.disk.scrub']
+
+    del scraped[:]
+    cli.build(engine='fast')
+    # specs scraped before are reused
+    assert scraped == ['cluster.node.disk.wipe', 'cluster.node.drain',
+                       'cluster.pool', 'cluster.pool.disk',
+                       'cluster.pool.disk.scrub']
+    assert cli.dispatch(cli.parse_args(argv)) == ('scrub', 'sda', True)
+    assert cli.invoke('cluster pool disk scrub') == 'pool scrub'
+    assert cli.invoke('cl no di sc sdb') == ('scrub', 'sdb', False)
+    source = cli.compile()
+    assert source.count("add_parser('scrub'") == 2
+
+    cli.tree()
+    assert capsys.readouterr().out.splitlines()[4:9] == [
+        '   > cluster',
+        '        > node',
+        '            > disk',
+        '                > scrub',
+        '                > wipe',
+    ]
+
+    with pytest.raises(CLIArgError):
+        @cli.subcommand
+        def orphan():
+            """Not in a class."""
+
 if __name__ == '__main__':
     test_commands_only()
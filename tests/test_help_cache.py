@@ -0,0 +1,112 @@
+"""Pytest functions for testing the cache of rendered help."""
+import argparse
+import sys
+import pytest
+from npdoc_cli import cli, NumpyDocCommand
+
+TARGET = 'tests.lazy_target'
+
+
+class store():
+    """Manage the store."""
+
+    @cli.subcommand
+    def put(key: str, value: int = 0):
+        """
+        Put a value.
+
+        Parameters
+        ----------
+        key : str
+            Key of the value.
+        value : int, optional
+            Value to put. The default is 0.
+
+        """
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    cli.command(store)
+    cli.subcommand(store.put)
+    cli.lazy_command(TARGET + ':train', summary='Train a model.')
+
+
+def _help(capsys, argv) -> str:
+    with pytest.raises(SystemExit) as e:
+        cli.parse_args(argv)
+    assert e.value.code == 0
+    return capsys.readouterr().out
+
+
+def test_help_cache(capsys, tmp_path, monkeypatch):
+    """Test that help is rendered once and served without argparse."""
+    sys.modules.pop(TARGET, None)
+    _register()
+    cli.build(lazy=True)
+    expected = {}
+    for argv in (['-h'], ['store', '--help'], ['store', 'put', '-h'],
+                 ['train', '-h']):
+        expected[argv[-2] if len(argv) > 1 else ''] = _help(capsys, argv)
+
+    sys.modules.pop(TARGET, None)
+    _register()
+    cli.build(lazy=True, cache=tmp_path, help_cache=tmp_path)
+    for name, text in expected.items():
+        argv = ['store', 'put'] if name == 'put' else [name] if name else []
+        assert _help(capsys, argv + ['-h']) == text
+
+    def fail(*args, **kwargs):
+        raise AssertionError('help should be served from the cache')
+    monkeypatch.setattr(NumpyDocCommand, '_scrape', fail)
+    monkeypatch.setattr(argparse.ArgumentParser, 'format_help', fail)
+    sys.modules.pop(TARGET, None)
+    _register()
+    cli.build(lazy=True, cache=tmp_path, help_cache=tmp_path)
+    assert _help(capsys, ['store', 'put', '-h']) == expected['put']
+    assert _help(capsys, ['train', '-h']) == expected['train']
+    assert TARGET not in sys.modules
+    cli.print_help()
+    assert capsys.readouterr().out == expected['']
+    monkeypatch.undo()
+
+    # a changed doc string renders the help again
+    original = store.put.__doc__
+    try:
+        store.put.__doc__ = original.replace('Key of', 'Name of')
+        assert 'Name of the value.' in _help(capsys, ['store', 'put', '-h'])
+    finally:
+        store.put.__doc__ = original
+
+
+def test_help_cache_fallback(capsys, tmp_path):
+    """Test that other arguments are parsed as usual."""
+    _register()
+    cli.build(lazy=True, help_cache=tmp_path)
+    assert 'Key of the value.' in _help(capsys, ['store', 'put', 'k', '-h'])
+    with pytest.raises(SystemExit) as e:
+        cli.parse_args(['missing', '-h'])
+    assert e.value.code == 2
+    assert cli.parse_args(['store', 'put', 'k']).key == 'k'
+
+
+def wave():
+    """Wave."""
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_help_cache_new_command(lazy, capsys, tmp_path):
+    """Test that commands registered since are listed in cached help."""
+    _register()
+    cli.build(lazy=lazy, help_cache=tmp_path)
+    assert 'wave' not in _help(capsys, ['-h'])
+
+    _register()
+    cli.command(wave)
+    cli.build(lazy=lazy, help_cache=tmp_path)
+    assert '{store,train,wave}' in _help(capsys, ['-h'])
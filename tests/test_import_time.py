@@ -0,0 +1,46 @@
+"""Pytest functions for testing the cost of importing npdoc_cli."""
+import json
+import subprocess
+import sys
+
+IMPORT_BUDGET_MS = 100
+"""Most time ``import npdoc_cli`` may take, in milliseconds."""
+
+FORBIDDEN = (
+    'numpydoc',
+    'numpydoc.docscrape',
+    'inspect',
+    'typing',
+    'numpy',
+    'sphinx',
+    'jinja2',
+)
+"""Modules ``import npdoc_cli`` must not import."""
+
+_PROBE = '''
+import json, sys, time
+before = set(sys.modules)
+t = time.perf_counter()
+import npdoc_cli
+t = time.perf_counter() - t
+print(json.dumps(dict(
+    ms=t * 1000,
+    modules=sorted(set(sys.modules) - before))))
+'''
+
+
+def _probe():
+    out = subprocess.run(
+        [sys.executable, '-c', _PROBE],
+        capture_output=True, text=True, check=True).stdout
+    return json.loads(out)
+
+
+def test_import_budget():
+    """Test that importing npdoc_cli is fast and doesn't import numpydoc."""
+    probe = _probe()
+    imported = [m for m in FORBIDDEN if m in probe['modules']]
+    assert imported == []
+    # best of a few runs, to be robust against a busy machine
+    ms = min([probe['ms']] + [_probe()['ms'] for _ in range(2)])
+    assert ms < IMPORT_BUDGET_MS
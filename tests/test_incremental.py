@@ -0,0 +1,166 @@
+"""Pytest functions for testing incremental builds."""
+import pytest
+from npdoc_cli import cli, NumpyDocCommand
+
+
+def greet(name: str):
+    """
+    Greet someone.
+
+    Parameters
+    ----------
+    name : str
+        Who is greeted.
+
+    """
+    return 'hello ' + name
+
+
+def wave():
+    """Wave."""
+    return 'wave'
+
+
+class team():
+    """Manage the team."""
+
+    @cli.subcommand
+    def join(name: str):
+        """
+        Join the team.
+
+        Parameters
+        ----------
+        name : str
+            Who joins.
+
+        """
+        return 'joined ' + name
+
+    def leave(name: str):
+        """
+        Leave the team.
+
+        Parameters
+        ----------
+        name : str
+            Who leaves.
+
+        """
+        return 'left ' + name
+
+
+@pytest.fixture
+def scraped(monkeypatch):
+    """Names of the commands scraped."""
+    names = []
+    scrape = NumpyDocCommand._scrape
+
+    def counted(self, **kwargs):
+        names.append(self.fname)
+        return scrape(self, **kwargs)
+    monkeypatch.setattr(NumpyDocCommand, '_scrape', counted)
+    return names
+
+
+def _run(argv):
+    return cli.dispatch(cli.parse_args(argv))
+
+
+def test_incremental_build(scraped):
+    """Test that only new and changed commands are scraped again."""
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    cli.command(greet)
+    cli.command(team)
+    cli.subcommand(team.join)
+    cli.build()
+    assert sorted(scraped) == ['greet', 'join', 'prog', 'team']
+    parsers = dict(cli._children[cli.program_parser])
+
+    # new command and subcommand
+    del scraped[:]
+    cli.command(wave)
+    cli.subcommand(team.leave)
+    cli.build()
+    assert sorted(scraped) == ['leave', 'wave']
+    assert cli._children[cli.program_parser]['greet'] is parsers['greet']
+    assert cli._children[cli.program_parser]['team'] is parsers['team']
+    assert _run(['wave']) == 'wave'
+    assert _run(['team', 'leave', 'bo']) == 'left bo'
+    assert _run(['team', 'join', 'al']) == 'joined al'
+
+    # changed doc string
+    del scraped[:]
+    original = greet.__doc__
+    try:
+        greet.__doc__ = original.replace('Who is', 'Person')
+        cli.build()
+        assert scraped == ['greet']
+        assert 'Person greeted.' in cli.command_parsers[0].format_help()
+    finally:
+        greet.__doc__ = original
+    cli.build()
+
+    # registered again, e.g. by a reloaded module
+    del scraped[:]
+
+    def reloaded():
+        """Wave twice."""
+        return 'wave wave'
+    reloaded.__name__ = wave.__name__
+    reloaded.__qualname__ = wave.__qualname__
+    reloaded.__module__ = wave.__module__
+    cli.command(reloaded)
+    cli.build()
+    assert scraped == ['wave']
+    assert len(cli.commands) == 3
+    assert _run(['wave']) == 'wave wave'
+
+    # no longer registered
+    del scraped[:]
+    cli.commands = [c for c in cli.commands if c.fname != 'wave']
+    cli.build()
+    assert scraped == []
+    assert list(cli._children[cli.program_parser]) == ['greet', 'team']
+    with pytest.raises(SystemExit):
+        cli.parse_args(['wave'])
+
+    # other settings build everything again
+    cli.build(replace_underscores=False)
+    assert cli._children[cli.program_parser]['greet'] is not parsers['greet']
+
+
+def make(name: str):
+    """Command named ``name``, all sharing one qualified name."""
+    def cmd():
+        """Say the command's name."""
+        return name
+    cmd.__name__ = name
+    return cmd
+
+
+def test_factory_commands():
+    """Test that commands made by a factory aren't re-registrations."""
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    for name in ('alpha', 'beta', 'gamma'):
+        cli.command(make(name))
+    assert [c.fname for c in cli.commands] == ['alpha', 'beta', 'gamma']
+    cli.build()
+    for name in ('alpha', 'beta', 'gamma'):
+        assert _run([name]) == name
+
+    # made again, e.g. by a reloaded module
+    cli.command(make('beta'))
+    cli.build()
+    assert [c.fname for c in cli.commands] == ['alpha', 'beta', 'gamma']
+    assert _run(['beta']) == 'beta'
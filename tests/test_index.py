@@ -0,0 +1,81 @@
+"""Pytest functions for testing abbreviated and mistyped command names."""
+import pytest
+from npdoc_cli import cli
+from npdoc_cli._index import CommandIndex
+
+
+class model():
+    """Manage models."""
+
+    @cli.subcommand
+    def train(epochs: int = 1):
+        """
+        Train a model.
+
+        Parameters
+        ----------
+        epochs : int, optional
+            Passes over the data. The default is 1.
+
+        """
+        return 'trained', epochs
+
+    @cli.subcommand
+    def trace():
+        """Trace a model."""
+        return 'traced'
+
+
+def test_index():
+    """Test prefixes and suggestions of an index."""
+    index = CommandIndex(['train', 'trace', 'test', 'serve'])
+    assert index.complete('tra') == ['trace', 'train']
+    assert index.unique('trai') == 'train'
+    assert index.unique('tra') is None
+    assert index.unique('test') == 'test'
+    assert index.unique('x') is None
+    # replaced, missing, extra and swapped characters
+    assert index.suggest('trian') == ['train']
+    assert index.suggest('srve') == ['serve']
+    assert index.suggest('tests') == ['test']
+    assert index.suggest('tset') == ['test']
+    assert index.suggest('tacex') == ['trace']
+    assert index.suggest('deploy') == []
+
+    index.update(['train', 'trail', 'deploy'])
+    assert index.names == ['deploy', 'trail', 'train']
+    assert index.unique('trai') is None
+    assert index.suggest('deplyo') == ['deploy']
+    assert index.suggest('tset') == []
+    assert index.suggest('trail') == ['train']
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_abbreviations(lazy, capsys):
+    """Test that unique prefixes name commands, and errors suggest names."""
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    cli.command(model)
+    cli.subcommand(model.train)
+    cli.subcommand(model.trace)
+    cli.build(lazy=lazy)
+
+    assert cli.dispatch(cli.parse_args(['mod', 'trai', '-e', '3'])) == (
+        'trained', 3)
+    assert cli.dispatch(cli.parse_args(['model', 'trac'])) == 'traced'
+
+    with pytest.raises(SystemExit):
+        cli.parse_args(['model', 'tra'])
+    assert ("ambiguous choice: 'tra' could match trace, train"
+            in capsys.readouterr().err)
+    with pytest.raises(SystemExit):
+        cli.parse_args(['model', 'trian'])
+    assert ("invalid choice: 'trian', maybe you meant 'train'?"
+            in capsys.readouterr().err)
+
+    outcome = cli.call(['modle', 'train'])
+    assert "maybe you meant 'model'?" in outcome.output
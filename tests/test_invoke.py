@@ -0,0 +1,169 @@
+"""Pytest functions for testing thread safe invocation."""
+import threading
+from collections.abc import Iterator
+import pytest
+from npdoc_cli import cli
+from npdoc_cli._invoke import Parser
+
+
+class calc():
+    """Calculator."""
+
+    @cli.subcommand
+    def add(a: int, b: int = 1):
+        """
+        Add numbers.
+
+        Parameters
+        ----------
+        a : int
+            First number.
+        b : int, optional
+            Second number. The default is 1.
+
+        """
+        return a + b
+
+    @cli.subcommand
+    def div(a: int, b: int):
+        """
+        Divide numbers.
+
+        Parameters
+        ----------
+        a : int
+            Dividend.
+        b : int
+            Divisor.
+
+        """
+        return a // b
+
+
+def pad(values: list[int]):
+    """
+    Pad values with a zero.
+
+    Parameters
+    ----------
+    values : list[int]
+        Values to pad.
+
+    """
+    values.append(0)
+    return values
+
+
+def total(values: Iterator[int]):
+    """
+    Sum streamed values.
+
+    Parameters
+    ----------
+    values : Iterator[int]
+        Values to sum.
+
+    """
+    return sum(values)
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    cli.command(calc)
+    cli.subcommand(calc.add)
+    cli.subcommand(calc.div)
+    cli.command(pad)
+    cli.command(total)
+
+
+def test_call_outcomes(capsys):
+    """Test that results and errors are returned, and nothing printed."""
+    _register()
+    cli.build(lazy=True)
+    assert cli.call(['calc', 'add', '2', '-b', '3']) == (5, None, 0, '')
+
+    outcome = cli.call(['calc', 'div', '1', '0'])
+    assert isinstance(outcome.error, ZeroDivisionError)
+    assert outcome.status == 1
+
+    outcome = cli.call(['calc', 'add', 'x'])
+    assert outcome.status == 2
+    assert "invalid int value: 'x'" in outcome.output
+
+    outcome = cli.call(['calc', '-h'])
+    assert outcome.status == 0 and outcome.error is None
+    assert outcome.output.startswith('usage: prog calc')
+    assert capsys.readouterr() == ('', '')
+
+    # dispatch leaves the namespace it is given alone
+    args = cli.parse_args(['calc', 'add', '1'])
+    assert cli.dispatch(args) == 2
+    assert cli.dispatch(args) == 2
+
+
+def test_call_threads():
+    """Test concurrent calls while the CLI is rebuilt."""
+    _register()
+    cli.build(lazy=True)
+    errors = []
+    done = threading.Event()
+
+    def work(n):
+        for i in range(200):
+            outcome = cli.call(['calc', 'add', str(i), '-b', str(n)])
+            if outcome != (i + n, None, 0, ''):
+                errors.append(outcome)
+
+    def rebuild():
+        lazy = False
+        while not done.wait(0.005):
+            cli.build(lazy=lazy)
+            lazy = not lazy
+
+    builder = threading.Thread(target=rebuild)
+    builder.start()
+    workers = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    done.set()
+    builder.join()
+    assert errors == []
+
+
+def test_invoke_memo(monkeypatch):
+    """Test that invoked arguments are memoized when deterministic."""
+    _register()
+    cli.build(memo_size=2)
+    assert cli.invoke('calc add 2 -b 3') == 5
+    assert cli.invoke(['pad', '1', '2']) == [1, 2, 0]
+    assert cli.invoke(['total', '1', '2']) == 3
+    assert list(cli._memo._entries) == [
+        ('calc', 'add', '2', '-b', '3'), ('pad', '1', '2')]
+
+    def fail(*args, **kwargs):
+        raise AssertionError('arguments should be memoized')
+    monkeypatch.setattr(Parser, 'parse_known_args', fail)
+    assert cli.invoke(['calc', 'add', '2', '-b', '3']) == 5
+    # routines changing their arguments don't change the memo
+    assert cli.invoke(['pad', '1', '2']) == [1, 2, 0]
+    with pytest.raises(AssertionError):
+        cli.invoke(['total', '1', '2'])
+    monkeypatch.undo()
+
+    # least recently used out
+    assert cli.invoke(['calc', 'add', '1']) == 2
+    assert list(cli._memo._entries) == [
+        ('pad', '1', '2'), ('calc', 'add', '1')]
+
+    # building again starts over
+    cli.build(memo_size=2)
+    assert list(cli._memo._entries) == []
+    with pytest.raises(SystemExit):
+        cli.invoke(['calc', 'add', 'x'])
@@ -0,0 +1,65 @@
+"""Pytest functions for testing commands registered by import path."""
+import sys
+from npdoc_cli import cli
+
+TARGET = 'tests.lazy_target'
+
+
+def test_lazy_command(capsys, tmp_path):
+    """Test that a lazy command is only imported when dispatched."""
+    sys.modules.pop(TARGET, None)
+    cli.reset()
+    @cli.program
+    def prog():
+        """ Sample program."""
+        pass
+
+    @cli.command
+    def other():
+        pass
+
+    cli.lazy_command(TARGET + ':train')
+    cli.build(cache=tmp_path)
+    cli.print_help()
+    assert TARGET not in sys.modules
+    assert 'Train a model.' not in capsys.readouterr().out
+
+    # other commands and the program help don't import it
+    cli.parse_args(['other'])
+    try:
+        cli.parse_args(['-h'])
+    except SystemExit:
+        pass
+    assert TARGET not in sys.modules
+
+    args = cli.parse_args(['train', '5'])
+    assert TARGET in sys.modules
+    assert cli.dispatch(args) == 5
+    # importing the module doesn't register the command twice
+    assert len(cli.commands) == 2
+
+    # the summary is cached for the next run
+    sys.modules.pop(TARGET, None)
+    cli.reset()
+    cli.program(prog)
+    cli.lazy_command(TARGET + ':train')
+    cli.build(cache=tmp_path)
+    cli.print_help()
+    assert TARGET not in sys.modules
+    assert 'Train a model.' in capsys.readouterr().out
+
+
+def test_lazy_command_summary(capsys):
+    """Test that a given summary is listed in the program help."""
+    sys.modules.pop(TARGET, None)
+    cli.reset()
+    @cli.program
+    def prog():
+        """ Sample program."""
+        pass
+
+    cli.lazy_command(TARGET + ':train', summary='Fit the model.')
+    cli.build()
+    cli.print_help()
+    assert 'Fit the model.' in capsys.readouterr().out
+    assert TARGET not in sys.modules
@@ -0,0 +1,74 @@
+"""Pytest functions for testing numpy array arguments."""
+import pytest
+from npdoc_cli import cli
+
+np = pytest.importorskip('numpy')
+npt = pytest.importorskip('numpy.typing')
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    @cli.command
+    def mean(values: npt.NDArray[np.float32], weights: np.ndarray = None):
+        """
+        Mean of values.
+
+        Parameters
+        ----------
+        values : NDArray[float32]
+            Values, inline or from a file.
+        weights : ndarray, optional
+            Weights. The default is None.
+
+        """
+        return values, weights
+
+    cli.build()
+
+
+def _parse(*argv):
+    return cli.dispatch(cli.parse_args(['mean'] + list(argv)))
+
+
+def test_inline_arrays():
+    """Test comma and whitespace separated values."""
+    _register()
+    values, weights = _parse('1,2', '3', '-w', '0.5,1')
+    assert values.dtype == np.float32
+    assert values.tolist() == [1, 2, 3]
+    assert weights.dtype == np.float64
+    assert weights.tolist() == [0.5, 1]
+
+    with pytest.raises(SystemExit):
+        cli.parse_args(['mean', '1', 'x'])
+
+
+def test_file_arrays(tmp_path):
+    """Test memory mapped npy and raw files, and npz archives."""
+    _register()
+    data = np.arange(6, dtype=np.float32)
+    np.save(tmp_path / 'a.npy', data)
+    data.tofile(tmp_path / 'a.bin')
+    np.savez(tmp_path / 'a.npz', first=data, second=data * 2)
+
+    values, _ = _parse(str(tmp_path / 'a.npy'))
+    assert isinstance(values, np.memmap)
+    assert not values.flags.writeable
+    assert values.tolist() == data.tolist()
+
+    values, _ = _parse(str(tmp_path / 'a.bin'))
+    assert isinstance(values, np.memmap)
+    assert values.tolist() == data.tolist()
+
+    values, _ = _parse(str(tmp_path / 'a.npz') + ':second')
+    assert values.tolist() == (data * 2).tolist()
+
+    np.save(tmp_path / 'b.npy', data.astype(np.int64))
+    for bad in ('a.npz', 'a.npz:third', 'b.npy'):
+        with pytest.raises(SystemExit):
+            cli.parse_args(['mean', str(tmp_path / bad)])
@@ -0,0 +1,68 @@
+"""Pytest functions for testing concurrent scraping during build."""
+import pytest
+from npdoc_cli import cli, CLIArgError
+
+
+def _register(n):
+    cli.reset()
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    for i in range(n):
+        def command(value: int, scale: float = 1.0):
+            """
+            Sample command.
+
+            Parameters
+            ----------
+            value : int
+                A value.
+            scale : float, optional
+                A scale. The default is 1.0.
+
+            """
+        command.__name__ = command.__qualname__ = 'command' + str(i)
+        cli.command(command)
+
+
+@pytest.mark.parametrize('pool', ['thread', 'process'])
+def test_parallel_build(pool):
+    """Test that a parallel build matches a serial one."""
+    _register(20)
+    cli.build()
+    expected = cli.program_parser.format_help()
+    args = vars(cli.parse_args(['command7', '3', '-s', '2.5']))
+
+    _register(20)
+    cli.build(workers=4, pool=pool)
+    assert cli.program_parser.format_help() == expected
+    assert vars(cli.parse_args(['command7', '3', '-s', '2.5'])) == dict(
+        args, __routine__=cli.commands[7].obj)
+
+
+def test_parallel_errors():
+    """Test that doc string errors of every command are reported together."""
+    _register(3)
+
+    @cli.command
+    def bad1(value: int):
+        """
+        Parameters
+        ----------
+        other : int
+            Not in the signature.
+        """
+
+    @cli.command
+    def bad2(flag: bool):
+        """
+        Parameters
+        ----------
+        flag : bool
+            No default.
+        """
+    with pytest.raises(CLIArgError) as e:
+        cli.build(workers=2)
+    assert 'bad1' in str(e.value)
+    assert 'Booleans' in str(e.value)
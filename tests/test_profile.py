@@ -0,0 +1,67 @@
+"""Pytest functions for testing the startup phase profiler."""
+import json
+import sys
+from npdoc_cli import cli
+
+TARGET = 'tests.lazy_target'
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    @cli.command
+    def greet(name: str):
+        """
+        Greet someone.
+
+        Parameters
+        ----------
+        name : str
+            Who is greeted.
+
+        """
+        return name
+
+    cli.lazy_command(TARGET + ':train')
+
+
+def test_profile_report(tmp_path):
+    """Test that every phase is timed and written as JSON."""
+    sys.modules.pop(TARGET, None)
+    _register()
+    path = tmp_path / 'profile.json'
+    cli.build(profile=str(path))
+    assert cli.dispatch(cli.parse_args(['greet', 'you'])) == 'you'
+    assert cli.dispatch(cli.parse_args(['train', '3'])) == 3
+    cli.profiler.write()
+
+    report = json.loads(path.read_text())
+    phases = {(r['phase'], r['name']) for r in report['records']}
+    assert ('scrape', 'tests.test_profile:_register.<locals>.greet') in phases
+    assert ('import', TARGET + ':train') in phases
+    assert ('scrape', TARGET + ':train') in phases
+    assert ('parse_args', 'train 3') in phases
+    assert ('dispatch', 'train') in phases
+    assert {'build', 'build_subparser'} <= set(report['totals_ms'])
+    ms = [r['ms'] for r in report['records']]
+    assert ms == sorted(ms, reverse=True)
+
+
+def test_profile_env(monkeypatch, capsys):
+    """Test that the environment variable enables a report to stderr."""
+    _register()
+    monkeypatch.setenv('NPDOC_CLI_PROFILE', '1')
+    cli.build()
+    cli.parse_args(['greet', 'you'])
+    cli.profiler.write()
+    err = capsys.readouterr().err
+    assert 'phase totals' in err
+    assert 'build_subparser' in err
+
+    monkeypatch.delenv('NPDOC_CLI_PROFILE')
+    cli.build()
+    assert cli.profiler is None
@@ -0,0 +1,73 @@
+"""Pytest functions for testing the interactive shell."""
+import io
+import sys
+from npdoc_cli import cli
+from npdoc_cli._shell import completions
+
+
+class counter():
+    """Count things."""
+
+    def __init__(self):
+        self.total = 0
+
+    @cli.subcommand
+    def add(self, n: int, mode: str = 'up'):
+        """
+        Add to the count.
+
+        Parameters
+        ----------
+        n : int
+            Amount added.
+        mode : {up, down}, optional
+            Direction. The default is 'up'.
+
+        """
+        self.total += n if mode == 'up' else -n
+        print('total', self.total)
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    @cli.command
+    def fail():
+        """Raise an error."""
+        raise ValueError('failed')
+
+    cli.command(counter)
+    cli.subcommand(counter.add)
+
+
+def test_repl(monkeypatch, capsys):
+    """Test that lines are dispatched to warm instances until exit."""
+    _register()
+    cli.build(counter(), shell=True)
+    lines = ['counter add 2', '', 'counter add 1 -m down',
+             'counter add x', 'fail', 'counter add 5', 'exit', 'fail']
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('\n'.join(lines) + '\n'))
+    cli.dispatch(cli.parse_args(['--shell']))
+    out, err = capsys.readouterr()
+    # the instance keeps its state between lines, errors don't end the shell
+    assert [line.split('> ')[-1] for line in out.split('\n')[:3]] == [
+        'total 2', 'total 1', 'total 6']
+    assert 'invalid int value' in err
+    assert 'ValueError: failed' in err
+    assert err.count('ValueError: failed') == 1
+
+
+def test_completions():
+    """Test completion of commands, subcommands, options and choices."""
+    _register()
+    cli.build(lazy=True)
+    assert completions(cli, [], '') == ['counter', 'fail']
+    assert completions(cli, [], 'c') == ['counter']
+    assert completions(cli, ['counter'], '') == ['add']
+    assert completions(cli, ['counter', 'add'], '--m') == ['--mode']
+    assert completions(cli, ['counter', 'add', '1', '-m'], '') == [
+        'down', 'up']
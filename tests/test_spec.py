@@ -0,0 +1,54 @@
+"""Pytest functions for testing command specs."""
+import pickle
+import pytest
+from npdoc_cli import NumpyDocCommand, CommandSpec
+
+
+def command(pos: int, opt: float = 1.0, flag: bool = False):
+    """
+    Sample command.
+
+    Parameters
+    ----------
+    pos : int
+        Positional.
+    opt : {1.0, 2.0}, optional
+        Optional. The default is 1.0.
+    flag : bool, optional
+        Flag. The default is False.
+
+    """
+
+
+def test_spec_matches_scrape():
+    """Test that a spec converts back to the scraped inputs."""
+    npd = NumpyDocCommand(command)
+    parser_ins, arg_ins = npd.scrape()
+    spec = npd.spec()
+    assert spec.to_argparse() == (tuple(parser_ins.pa), parser_ins.kwa)
+    for a, s in zip(arg_ins, spec.args):
+        pa, kwa = s.to_argparse()
+        assert pa == tuple(a.pa)
+        assert kwa == dict(a.kwa, **{
+            k: tuple(v) for k, v in a.kwa.items() if k == 'choices'})
+    assert spec.args[0].positional
+    assert not spec.args[1].positional
+
+
+def test_spec_memoized_immutable():
+    """Test that specs are computed once, immutable and hashable."""
+    npd = NumpyDocCommand(command)
+    spec = npd.spec()
+    assert npd.spec() is spec
+    assert npd.spec(replace_underscores=False) is not spec
+    assert npd.signature is npd.signature
+    with pytest.raises(AttributeError):
+        spec.name = 'other'
+    with pytest.raises(AttributeError):
+        spec.args[0].flags = ()
+
+    copy = pickle.loads(pickle.dumps(spec))
+    assert isinstance(copy, CommandSpec)
+    assert copy == spec
+    assert hash(copy) == hash(spec)
+    assert len({spec, copy}) == 1
@@ -0,0 +1,75 @@
+"""Pytest functions for testing streamed list arguments."""
+import io
+import sys
+from collections.abc import Iterable
+from typing import Iterator
+import pytest
+from npdoc_cli import cli
+
+SEEN = []
+"""Items consumed by total, in order."""
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    @cli.command
+    def total(ids: Iterator[int], names: Iterable[str] = None):
+        """
+        Add up identifiers.
+
+        Parameters
+        ----------
+        ids : Iterator[int]
+            Identifiers, from @file or - for stdin.
+        names : Iterable[str], optional
+            Names. The default is None.
+
+        """
+        out = 0
+        for i in ids:
+            SEEN.append(i)
+            out += i
+        return out, list(names or [])
+
+    cli.build()
+
+
+def test_stream_sources(tmp_path, monkeypatch):
+    """Test streaming items inline, from a file and from stdin."""
+    _register()
+    assert cli.dispatch(cli.parse_args(['total', '1', '2'])) == (3, [])
+
+    path = tmp_path / 'ids.txt'
+    path.write_text('1\n\n2\n 3 \n')
+    args = cli.parse_args(['total', '@' + str(path), '-n', 'a', 'b'])
+    # nothing is read before the command iterates
+    assert not isinstance(args.ids, list)
+    assert cli.dispatch(args) == (6, ['a', 'b'])
+
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('4\n5\n'))
+    assert cli.dispatch(cli.parse_args(['total', '-'])) == (9, [])
+
+
+def test_stream_is_lazy(tmp_path):
+    """Test that items are converted as they are reached."""
+    _register()
+    path = tmp_path / 'ids.txt'
+    path.write_text('1\n2\nx\n4\n')
+    SEEN.clear()
+    with pytest.raises(ValueError, match="invalid int value: 'x'"):
+        cli.dispatch(cli.parse_args(['total', '@' + str(path)]))
+    assert SEEN == [1, 2]
+
+    with pytest.raises(SystemExit):
+        cli.parse_args(['total', '@' + str(tmp_path / 'missing.txt')])
+
+    # files are opened once iterated
+    args = cli.parse_args(['total', '@' + str(path)])
+    path.unlink()
+    with pytest.raises(FileNotFoundError):
+        cli.dispatch(args)
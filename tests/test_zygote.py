@@ -0,0 +1,135 @@
+"""Pytest functions for testing the fork server."""
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+import pytest
+import npdoc_zygote
+from npdoc_cli import cli
+from npdoc_zygote import connect
+
+CALLS = []
+"""Appended to by each invocation, to check they are isolated."""
+
+
+def _register():
+    cli.reset()
+
+    @cli.program
+    def prog():
+        """Sample program."""
+
+    @cli.command
+    def echo(text: str):
+        """
+        Print text with the client's environment and directory.
+
+        Parameters
+        ----------
+        text : str
+            Printed text.
+
+        """
+        CALLS.append(text)
+        print(os.environ['GREETING'], text, os.getcwd(), len(CALLS))
+
+    @cli.command
+    def fail(code: int):
+        """
+        Exit with a status.
+
+        Parameters
+        ----------
+        code : int
+            Exit status.
+
+        """
+        sys.exit(code)
+
+
+def _client_env() -> dict:
+    """Environment finding the client, wherever it's run from."""
+    return dict(os.environ,
+                PYTHONPATH=os.path.dirname(npdoc_zygote.__file__))
+
+
+def _start(path: str, target=None):
+    """Serve the CLI in a forked process, once listening."""
+    server = multiprocessing.get_context('fork').Process(
+        target=target or cli.serve, args=(path,), daemon=True)
+    server.start()
+    for _ in range(500):
+        if os.path.exists(path):
+            break
+        time.sleep(0.01)
+    return server
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork')
+def test_fork_server(tmp_path, monkeypatch, capfd):
+    """Test that each invocation runs in a fork with the client's state."""
+    _register()
+    cli.build()
+    path = str(tmp_path / 'cli.sock')
+    server = _start(path)
+    try:
+        assert os.stat(path).st_mode & 0o777 == 0o600
+        monkeypatch.setenv('GREETING', 'hi')
+        monkeypatch.chdir(tmp_path)
+        assert connect(path, ['echo', 'you']) == 0
+        assert connect(path, ['echo', 'again']) == 0
+        assert connect(path, ['fail', '3']) == 3
+        assert connect(path, ['--bad']) == 2
+        client = subprocess.run(
+            [sys.executable, '-m', 'npdoc_zygote', path, 'echo', 'standalone'],
+            env=_client_env())
+        assert client.returncode == 0
+    finally:
+        server.terminate()
+        server.join()
+    out, err = capfd.readouterr()
+    assert out.splitlines() == [
+        'hi you {} 1'.format(tmp_path),
+        'hi again {} 1'.format(tmp_path),
+        'hi standalone {} 1'.format(tmp_path),
+    ]
+    assert 'unrecognized arguments: --bad' in err
+    assert CALLS == []
+
+
+def test_client_standalone():
+    """Test that the client doesn't import npdoc_cli."""
+    out = subprocess.run(
+        [sys.executable, '-c', 'import sys, npdoc_zygote; '
+         'print([m for m in sys.modules if m.startswith("npdoc_cli")])'],
+        capture_output=True, text=True, check=True, env=_client_env()).stdout
+    assert out == '[]\n'
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork')
+def test_fork_failure(tmp_path, capfd):
+    """Test that the server keeps serving when it can't fork."""
+    _register()
+    cli.build()
+
+    def serve(path):
+        fork = os.fork
+        failures = [OSError(11, 'Resource temporarily unavailable')]
+
+        def failing():
+            if failures:
+                raise failures.pop()
+            return fork()
+        os.fork = failing
+        cli.serve(path)
+
+    path = str(tmp_path / 'cli.sock')
+    server = _start(path, serve)
+    try:
+        assert connect(path, ['fail', '3']) == 1
+        assert connect(path, ['fail', '3']) == 3
+    finally:
+        server.terminate()
+        server.join()
+    capfd.readouterr()